@@ -0,0 +1,53 @@
+# benchmarks/bench_ai.py
+"""
+AI action selection benchmark: every member of a large party picks an
+action against a large enemy group, several times within one turn (as
+the engine does while a round plays out).
+
+Compares scoring with the per-turn cache against re-evaluating every
+option each time, and reports decisions/s.
+
+Run from the repository root:
+    python -m benchmarks.bench_ai [side_size]
+"""
+import logging
+import random
+import sys
+import time
+
+from game_sys.character.spawner import EnemySpawner
+from game_sys.combat.combat_engine import CombatEngine
+
+
+def _side(spawner: EnemySpawner, job: str, size: int) -> list:
+    return [spawner.spawn(job, level=1 + i % 5, name=f"{job}{i}") for i in range(size)]
+
+
+def _timed(label: str, engine: CombatEngine, actors: list, foes: list,
+           passes: int, cached: bool) -> None:
+    evaluator = engine.evaluator
+    start = time.perf_counter()
+    for _ in range(passes):
+        for actor in actors:
+            if not cached:
+                evaluator.turn = None
+            evaluator.choose(actor, foes)
+    elapsed = time.perf_counter() - start
+    count = passes * len(actors)
+    print(f"{label:<20} {count:>7} decisions  {elapsed:8.3f}s  "
+          f"{count / elapsed:>10.0f} decisions/s")
+
+
+def main(size: int = 50) -> None:
+    logging.disable(logging.INFO)
+    spawner = EnemySpawner(level_band=5, variants=4)
+    party = _side(spawner, "goblin", size)
+    foes = _side(spawner, "goblin", size)
+    engine = CombatEngine(party, foes, rng=random.Random(1))
+    engine.turn = 1
+    _timed("re-evaluated", engine, party, foes, 5, cached=False)
+    _timed("cached per turn", engine, party, foes, 5, cached=True)
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 50)
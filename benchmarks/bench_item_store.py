@@ -0,0 +1,54 @@
+# benchmarks/bench_item_store.py
+"""
+ItemStore benchmark: memory held by live EquipableItems vs. bytes per
+record on disk, plus put / materialize / select throughput.
+
+Run from the repository root:
+    python -m benchmarks.bench_item_store [count]
+"""
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from game_sys.items.factory import create_item
+from game_sys.items.item_store import ItemStore
+
+_TEMPLATES = ("iron_sword", "steel_sword", "plate_armor", "bow", "orc_axe")
+
+
+def _timed(label: str, count: int, fn):
+    start = time.perf_counter()
+    result = fn()
+    elapsed = time.perf_counter() - start
+    print(f"{label:<26} {count:>8} items  {elapsed:8.3f}s  "
+          f"{count / elapsed:>10.0f} items/s")
+    return result
+
+
+def main(count: int = 50_000) -> None:
+    create_item(_TEMPLATES[0])  # load templates outside the measurement
+    tracemalloc.start()
+    items = [create_item(_TEMPLATES[i % len(_TEMPLATES)], level=1 + i % 30)
+             for i in range(count)]
+    live_bytes = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    print(f"live EquipableItems: {live_bytes / count:.0f} bytes/item")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "items.bin")
+        with ItemStore(path) as store:
+            handles = _timed("put", count, lambda: store.put_many(items))
+            del items
+            _timed("materialize", count,
+                   lambda: [h.materialize() for h in handles])
+            hits = _timed("select (scan, level>=25)", count,
+                          lambda: sum(1 for _ in store.select(min_level=25)))
+            print(f"select matched {hits} items")
+        size = os.path.getsize(path) + os.path.getsize(path + ".ench")
+        print(f"store on disk: {size / count:.0f} bytes/item")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 50_000)
@@ -0,0 +1,60 @@
+# benchmarks/bench_leveling.py
+"""
+Mass XP distribution benchmark: a raid kill grants every member of a
+large party a big XP award.
+
+Compares the old per-level path (loop level_up, full Stats rebuild per
+level) with the unified pipeline (closed-form level, one in-place
+rescale per award), and reports awards/s.
+
+Run from the repository root:
+    python -m benchmarks.bench_leveling [raid_size]
+"""
+import logging
+import sys
+import time
+
+from game_sys.character.spawner import EnemySpawner
+
+
+def _raid(size: int) -> list:
+    spawner = EnemySpawner(level_band=5, variants=4)
+    return [spawner.spawn("goblin", level=1, name=f"g{i}") for i in range(size)]
+
+
+def _old_award(member, amount: int) -> None:
+    # Stepwise leveling with a full calculate_stats() per level, as
+    # before the unified pipeline
+    mgr = member.stats_mgr
+    levels = mgr.levels
+    levels.experience += amount
+    while levels.lvl < levels.max_level and levels.experience >= levels.required_experience():
+        levels.experience -= levels.required_experience()
+        levels.lvl += 1
+        mgr.stats = mgr.calculate_stats()
+        member.restore_all()
+
+
+def _timed(label: str, raid: list, award, amount: int, rounds: int) -> None:
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for member in raid:
+            award(member, amount)
+    elapsed = time.perf_counter() - start
+    count = rounds * len(raid)
+    print(f"{label:<28} {count:>7} awards  {elapsed:8.3f}s  "
+          f"{count / elapsed:>10.0f} awards/s  (final level {raid[0].level})")
+
+
+def main(size: int = 40) -> None:
+    # Level-up log lines would dominate the timing
+    logging.disable(logging.INFO)
+    rounds = 20
+    amount = 50_000
+    _timed("stepwise + full rebuild", _raid(size), _old_award, amount, rounds)
+    _timed("closed form + rescale", _raid(size),
+           lambda m, xp: m.stats_mgr.add_experience(xp), amount, rounds)
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 40)
@@ -0,0 +1,114 @@
+# benchmarks/bench_logging.py
+"""
+Logging overhead benchmark.
+
+Compares the old dict + json.dumps formatter with JsonFormatter, the
+cost of disabled DEBUG calls with eager f-strings vs. %-style/lazy
+args, and game-thread cost of synchronous file handlers vs. the async
+queue pipeline.
+
+Run from the repository root:
+    python -m benchmarks.bench_logging [count]
+"""
+import json
+import logging
+import os
+import sys
+import tempfile
+import time
+
+from game_sys.character.character_creation import create_character
+from logs.logs import (
+    JsonFormatter,
+    lazy,
+    start_async_logging,
+    stop_async_logging,
+)
+
+
+def _dict_format(formatter: logging.Formatter, record: logging.LogRecord) -> str:
+    # JsonFormatter.format as it was before the fast path
+    payload = {
+        "timestamp": formatter.formatTime(record, datefmt="%Y-%m-%dT%H:%M:%S"),
+        "level": record.levelname,
+        "module": record.name,
+        "lineno": record.lineno,
+        "message": record.getMessage(),
+    }
+    if record.args:
+        payload["args"] = record.args
+    payload["args"] = [str(a) for a in record.args]
+    return json.dumps(payload)
+
+
+def _rate(label: str, count: int, fn) -> float:
+    start = time.perf_counter()
+    for _ in range(count):
+        fn()
+    elapsed = time.perf_counter() - start
+    print(f"{label:<34} {count:>8} calls  {elapsed:8.3f}s  "
+          f"{elapsed / count * 1e6:8.2f} us/call")
+    return elapsed
+
+
+def _logger(name: str, handlers) -> logging.Logger:
+    logger = logging.getLogger(f"bench.{name}")
+    logger.propagate = False
+    logger.setLevel(logging.INFO)
+    logger.handlers[:] = list(handlers)
+    return logger
+
+
+def main(count: int = 100_000) -> None:
+    hero = create_character("player", name="Hero", job_id="knight")
+    record = logging.LogRecord(
+        "game_sys.combat.combat", logging.INFO, __file__, 81,
+        "%s hits %s for %d %s damage%s%s",
+        ("Hero", "Goblin", 12, "physical", "", " (CRITICAL!)"), None,
+    )
+    fast = JsonFormatter()
+    assert json.loads(fast.format(record)) == json.loads(_dict_format(fast, record))
+
+    print("formatter")
+    _rate("  dict + json.dumps", count, lambda: _dict_format(fast, record))
+    _rate("  JsonFormatter", count, lambda: fast.format(record))
+
+    print("disabled DEBUG call")
+    quiet = _logger("quiet", [logging.NullHandler()])
+    _rate("  f-string of Character", count // 10,
+          lambda: quiet.debug(f"state: {hero}"))
+    _rate("  %-style Character arg", count // 10,
+          lambda: quiet.debug("state: %s", hero))
+    _rate("  lazy(str, character)", count // 10,
+          lambda: quiet.debug("state: %s", lazy(str, hero)))
+
+    print("enabled INFO call (game-thread time)")
+    with tempfile.TemporaryDirectory() as tmp:
+        def file_handlers():
+            text = logging.FileHandler(os.path.join(tmp, "game.log"))
+            text.setFormatter(logging.Formatter(
+                "%(asctime)s [%(levelname)8s] %(name)s:%(lineno)d | %(message)s"
+            ))
+            js = logging.FileHandler(os.path.join(tmp, "game.json.log"))
+            js.setFormatter(fast)
+            return [text, js]
+
+        sync = _logger("sync", file_handlers())
+        _rate("  sync file handlers", count,
+              lambda: sync.info("%s hits %s for %d damage", "Hero", "Goblin", 12))
+        for handler in sync.handlers:
+            handler.close()
+
+        async_ = _logger("async", file_handlers())
+        start_async_logging(logger=async_, maxsize=count + 1)
+        _rate("  async queue enqueue", count,
+              lambda: async_.info("%s hits %s for %d damage", "Hero", "Goblin", 12))
+        start = time.perf_counter()
+        stop_async_logging()
+        print(f"  async drain on stop: {time.perf_counter() - start:.3f}s")
+        for handler in async_.handlers:
+            handler.close()
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
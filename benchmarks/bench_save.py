@@ -0,0 +1,69 @@
+# benchmarks/bench_save.py
+"""
+Save/load benchmark: JSON vs. the compact binary format.
+
+Reports saves/s, loads/s and bytes per character for a party of
+characters, and the streaming load rate from a multi-character file.
+
+Run from the repository root:
+    python -m benchmarks.bench_save [count]
+"""
+import io
+import sys
+import time
+
+from game_sys.character.character_creation import create_character
+from game_sys.core.save_load import (
+    dumps_binary,
+    dumps_json,
+    loads_binary,
+    loads_json,
+    read_characters,
+    write_characters,
+)
+
+
+def _party(size: int = 8) -> list:
+    party = [create_character("player", name="Hero", job_id="knight")]
+    party += [create_character("goblin", name=f"Goblin {i}")
+              for i in range(size - 1)]
+    return party
+
+
+def _rate(label: str, count: int, fn) -> float:
+    start = time.perf_counter()
+    for _ in range(count):
+        fn()
+    elapsed = time.perf_counter() - start
+    rate = count / elapsed
+    print(f"{label:<24} {count:>7} ops  {elapsed:8.3f}s  {rate:>10.0f} ops/s")
+    return rate
+
+
+def main(count: int = 2_000) -> None:
+    party = _party()
+    hero = party[0]
+
+    for label, dumps, loads in (
+        ("json", lambda c: dumps_json(c, indent=None), loads_json),
+        ("binary", dumps_binary, loads_binary),
+    ):
+        sizes = [len(dumps(c)) for c in party]
+        print(f"{label}: {sum(sizes) / len(sizes):.0f} bytes/character "
+              f"(hero {sizes[0]} bytes)")
+        blob = dumps(hero)
+        _rate(f"{label} save", count, lambda: dumps(hero))
+        _rate(f"{label} load", count, lambda: loads(blob))
+
+    buf = io.BytesIO()
+    write_characters(buf, party * (count // len(party)))
+    data = buf.getvalue()
+    start = time.perf_counter()
+    loaded = sum(1 for _ in read_characters(io.BytesIO(data)))
+    elapsed = time.perf_counter() - start
+    print(f"streamed {loaded} characters ({len(data)} bytes) in "
+          f"{elapsed:.3f}s: {loaded / elapsed:.0f} loads/s")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 2_000)
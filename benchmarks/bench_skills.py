@@ -0,0 +1,74 @@
+# benchmarks/bench_skills.py
+"""
+Skill instantiation benchmark: a large NPC population learns the same
+kit.
+
+Compares the old per-learner path (deepcopy the template, re-resolve
+damage types, build new Effect objects) with create_skill over shared
+compiled definitions, and reports skills/s plus memory retained.
+
+Run from the repository root:
+    python -m benchmarks.bench_skills [npcs]
+"""
+import copy
+import random
+import sys
+import time
+import tracemalloc
+
+from game_sys.core.damage_types import DamageType
+from game_sys.core.rarity import Rarity
+from game_sys.effects.base import Effect
+from game_sys.managers.scaling_manager import scale_damage_map
+from game_sys.skills import factory
+from game_sys.skills.base import Skill
+from game_sys.skills.learning import SkillRegistry
+
+
+def _old_create(skill_id: str, level: int, rng: random.Random) -> Skill:
+    # create_skill as it was before compiled definitions
+    templ = copy.deepcopy(factory._skill_defs[skill_id])
+    effects = []
+    for eff in templ.get("effects", []):
+        eff = eff.copy()
+        if eff.get("type") == "Damage":
+            raw = {}
+            for dt_str, spec in eff.get("damage", {}).items():
+                if isinstance(spec, dict):
+                    lo = int(spec.get("min", 0))
+                    hi = int(spec.get("max", lo))
+                    raw[DamageType[dt_str.upper()]] = rng.randint(lo, hi) if hi >= lo else lo
+                else:
+                    raw[DamageType[dt_str.upper()]] = int(spec)
+            scaled = scale_damage_map(raw, level, grade=1, rarity=Rarity.COMMON)
+            eff["damage"] = {dt.name: dmg for dt, dmg in scaled.items()}
+        effects.append(Effect.from_dict(eff))
+    return Skill(templ["skill_id"], templ.get("name", ""), templ.get("description", ""),
+                 int(templ.get("mana_cost", 0)), int(templ.get("stamina_cost", 0)),
+                 int(templ.get("cooldown", 0)), effects, templ.get("requirements") or {})
+
+
+def _timed(label: str, npcs: int, kit: list, create) -> None:
+    rng = random.Random(7)
+    tracemalloc.start()
+    start = time.perf_counter()
+    learned = [[create(sid, 1 + i % 10, rng) for sid in kit] for i in range(npcs)]
+    elapsed = time.perf_counter() - start
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    count = npcs * len(kit)
+    print(f"{label:<24} {count:>7} skills  {elapsed:8.3f}s  "
+          f"{count / elapsed:>10.0f} skills/s  {retained / count:8.0f} B/skill")
+    del learned
+
+
+def main(npcs: int = 5000) -> None:
+    SkillRegistry.ensure_loaded()
+    kit = ["fireball", "ice_spear"]
+    _timed("deepcopy + new effects", npcs, kit, _old_create)
+    _timed("compiled definitions", npcs, kit,
+           lambda sid, level, rng: factory.create_skill(sid, level=level, rng=rng))
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 5000)
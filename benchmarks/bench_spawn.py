@@ -0,0 +1,44 @@
+# benchmarks/bench_spawn.py
+"""
+Spawn-rate benchmark: create_character vs. prototype cloning vs. pooling.
+
+Run from the repository root:
+    python -m benchmarks.bench_spawn [count]
+"""
+import sys
+import time
+
+from game_sys.character.character_creation import create_character
+from game_sys.character.spawner import EnemySpawner, EnemyPool
+
+
+def _rate(label: str, count: int, fn) -> float:
+    start = time.perf_counter()
+    for _ in range(count):
+        fn()
+    elapsed = time.perf_counter() - start
+    rate = count / elapsed
+    print(f"{label:<28} {count:>7} spawns  {elapsed:8.3f}s  "
+          f"{rate:>10.0f} spawns/s")
+    return rate
+
+
+def main(count: int = 2_000) -> None:
+    spawner = EnemySpawner(level_band=5)
+    spawner.warm("goblin", level=5)
+    pool = EnemyPool(spawner)
+
+    def pooled() -> None:
+        pool.release(pool.acquire("goblin", level=5))
+
+    base = _rate("create_character", count, lambda: create_character(
+        "goblin", level=5))
+    cloned = _rate("EnemySpawner.spawn", count, lambda: spawner.spawn(
+        "goblin", level=5))
+    recycled = _rate("EnemyPool acquire/release", count, pooled)
+    print(f"clone speedup: {cloned / base:.1f}x, "
+          f"pool speedup: {recycled / base:.1f}x")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 2_000)
@@ -0,0 +1,57 @@
+# benchmarks/bench_store.py
+"""
+WorldStore benchmark: bulk save, dirty-only re-save, delta checkpoints
+and bulk load.
+
+Run from the repository root:
+    python -m benchmarks.bench_store [count]
+"""
+import os
+import sys
+import tempfile
+import time
+
+from game_sys.character.spawner import EnemySpawner
+from game_sys.core.world_store import WorldStore
+
+
+def _timed(label: str, count: int, fn) -> None:
+    start = time.perf_counter()
+    result = fn()
+    elapsed = time.perf_counter() - start
+    print(f"{label:<30} {count:>7} chars  {elapsed:8.3f}s  "
+          f"{count / elapsed:>10.0f} chars/s  (result={result})")
+
+
+def main(count: int = 5_000) -> None:
+    spawner = EnemySpawner(level_band=5, variants=4)
+    world = [spawner.spawn("goblin", level=1 + i % 20, name=f"g{i}")
+             for i in range(count)]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "world.db")
+        with WorldStore(path) as store:
+            _timed("save_many (all new)", count, lambda: store.save_many(world))
+            _timed("save_many (nothing dirty)", count,
+                   lambda: store.save_many(world))
+            for char in world[::10]:
+                char.gold += 1
+            _timed("save_many (10% dirty)", count,
+                   lambda: store.save_many(world))
+            for char in world[::100]:
+                char.gold += 1
+                char.current_health -= 1
+            _timed("checkpoint (1% dirty)", count,
+                   lambda: store.checkpoint(world))
+            _timed("checkpoint (nothing dirty)", count,
+                   lambda: store.checkpoint(world))
+        print(f"database size: {os.path.getsize(path) / count:.0f} "
+              f"bytes/character")
+
+        with WorldStore(path) as store:
+            _timed("load_many (all)", count,
+                   lambda: len(store.load_many()))
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 5_000)
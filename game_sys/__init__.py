@@ -1,8 +1,38 @@
-from game_sys.skills.learning import SkillRecord, SkillRegistry
-import game_sys.hooks.hooks_setup  # Ensure hooks are registered
-from game_sys.effects import damage, heal, status, damage_reduction, statbuff, modify_weapon, instant, unlock
-from game_sys.effects.passives import lifesteal
-data_path = "game_sys/skills/data/skills.json"
-records = SkillRecord.load_from_json_array(data_path)
-for rec in records:
-    SkillRegistry.register(rec)
+# game_sys/__init__.py
+"""
+Importing game_sys is cheap: hook wiring, effect modules and game data
+are set up on first use (the first Actor, or first template lookup).
+Call `game_sys.init()` to do all of it up front, e.g. in a parent
+process before forking workers.
+"""
+import threading
+
+__all__ = ["init", "is_initialized"]
+
+_initialized = False
+_init_lock = threading.RLock()
+
+
+def init() -> None:
+    """Wire hooks, register effects and load all game data (idempotent)."""
+    global _initialized
+    if _initialized:
+        return
+    with _init_lock:
+        if _initialized:
+            return
+        import game_sys.hooks.hooks_setup  # noqa: F401  registers listeners
+        from game_sys.effects.base import effect_types
+        from game_sys.core.game_data import game_data
+        from game_sys.managers.scaling_manager import build_multiplier_tables
+        from game_sys.skills.learning import SkillRegistry
+
+        effect_types()  # imports and registers the built-in effects
+        game_data.load()
+        build_multiplier_tables()
+        SkillRegistry.ensure_loaded()
+        _initialized = True
+
+
+def is_initialized() -> bool:
+    return _initialized
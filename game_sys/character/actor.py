@@ -1,13 +1,16 @@
 # game_sys/character/actor.py
 
-from typing import Any, Dict, List, Optional, Type
+from typing import Any, Dict, List, Optional, Set, Type
 from logs.logs import get_logger
+from game_sys import init as init_game_sys
 from game_sys.core.damage_types import DamageType
 from game_sys.hooks.hooks import hook_dispatcher
 from game_sys.inventory.inventory import Inventory
 from game_sys.items.item_base import EquipableItem
 from game_sys.effects.status import StatusEffect, Effect
+from game_sys.effects.status_scheduler import StatusScheduler
 from game_sys.managers.stats_manager import StatsManager, Stats
+from game_sys.managers.status_manager import StatusManager
 
 log = get_logger(__name__)
 
@@ -18,6 +21,10 @@ class Actor:
     Handles leveling, stats, resistances, statuses, and equipment.
     """
 
+    # Created on first use, so __new__-built actors get them too
+    _status_scheduler: Optional[StatusScheduler] = None
+    _status_mgr: Optional[StatusManager] = None
+
     def __init__(
         self,
         name: str,
@@ -28,6 +35,12 @@ class Actor:
         weakness: Optional[Dict[DamageType, float]] = None,
         resistance: Optional[Dict[DamageType, float]] = None,
     ) -> None:
+        # The first actor wires hooks and loads game data
+        init_game_sys()
+        # Fields changed since the last checkpoint (see dirty_fields)
+        self._dirty: Set[str] = set()
+        self._stats_seen: Any = (None, -1)
+        self._job_seen: Any = None
         self.name = name
         self.stats_mgr = StatsManager(self)
         self.stats_mgr.levels.lvl = level
@@ -36,8 +49,7 @@ class Actor:
 
         # Inventory and equip/unequip hooks
         self.inventory = Inventory(self)
-        hook_dispatcher.register("inventory.equip", self._on_item_equipped)
-        hook_dispatcher.register("inventory.unequip", self._on_item_unequipped)
+        self.attach_hooks()
 
         # Status effects and defending state
         self.statuses: Dict[str, StatusEffect] = {}
@@ -49,7 +61,7 @@ class Actor:
         self.resistance = resistance or {}
 
         # Resources
-        self.gold = gold or 0
+        self._gold = gold or 0
         self._current_health = self.max_health
         self._current_mana = self.max_mana
         self._current_stamina = self.max_stamina
@@ -64,6 +76,15 @@ class Actor:
     def level(self) -> int:
         return self.stats_mgr.levels.lvl
 
+    @property
+    def gold(self) -> int:
+        return self._gold
+
+    @gold.setter
+    def gold(self, value: int) -> None:
+        self._gold = value
+        self._dirty.add("gold")
+
     @property
     def experience(self) -> int:
         return self.stats_mgr.levels.experience
@@ -74,15 +95,15 @@ class Actor:
 
     @property
     def max_health(self) -> int:
-        return self.stats.effective().get("health", 0)
+        return self.stats.get("health")
 
     @property
     def max_mana(self) -> int:
-        return self.stats.effective().get("mana", 0)
+        return self.stats.get("mana")
 
     @property
     def max_stamina(self) -> int:
-        return self.stats.effective().get("stamina", 0)
+        return self.stats.get("stamina")
 
     @property
     def current_health(self) -> int:
@@ -91,6 +112,7 @@ class Actor:
     @current_health.setter
     def current_health(self, value: int):
         self._current_health = max(0, min(value, self.max_health))
+        self._dirty.add("resources")
 
     @property
     def current_mana(self) -> int:
@@ -99,6 +121,7 @@ class Actor:
     @current_mana.setter
     def current_mana(self, value: int):
         self._current_mana = max(0, min(value, self.max_mana))
+        self._dirty.add("resources")
 
     @property
     def current_stamina(self) -> int:
@@ -107,30 +130,105 @@ class Actor:
     @current_stamina.setter
     def current_stamina(self, value: int):
         self._current_stamina = max(0, min(value, self.max_stamina))
+        self._dirty.add("resources")
 
     @property
     def status_effects(self) -> List[StatusEffect]:
         return list(self.statuses.values())
 
-    def add_status(self, status_obj: StatusEffect) -> None:
-        self.statuses[status_obj.name] = status_obj
+    @property
+    def status_scheduler(self) -> StatusScheduler:
+        """
+        Expiry clock for this actor's statuses; a combat engine swaps in
+        a shared one for the length of a fight (bind_status_scheduler).
+        """
+        if self._status_scheduler is None:
+            self._status_scheduler = StatusScheduler()
+        return self._status_scheduler
+
+    def bind_status_scheduler(self, scheduler: StatusScheduler) -> StatusScheduler:
+        """
+        Move all statuses onto `scheduler` (keeping remaining turns) and
+        return the previous scheduler.
+        """
+        previous = self.status_scheduler
+        self._status_scheduler = scheduler
+        for status in self.statuses.values():
+            scheduler.adopt(self, status)
+        # Durations count down on the new clock without touching the
+        # actor, so the next delta must carry them
+        if scheduler is not previous and self.statuses:
+            self._dirty.add("statuses")
+        return previous
+
+    @property
+    def status_mgr(self) -> StatusManager:
+        """Stacking rules and Stats bookkeeping for `statuses`."""
+        if self._status_mgr is None:
+            self._status_mgr = StatusManager(self)
+        return self._status_mgr
+
+    def add_status(self, status_obj: StatusEffect) -> StatusEffect:
+        """
+        Apply a status (stacking onto an active one of the same name)
+        and return the instance that is now active.
+        """
+        status_obj = self.status_mgr.apply(status_obj)
+        self._dirty.add("statuses")
         log.info(
             "%s gains status '%s' for %d turns.",
             self.name, status_obj.name, status_obj.duration
         )
         hook_dispatcher.fire("actor.status_added", actor=self, effect=status_obj)
-
-    def tick_statuses(self) -> None:
-        expired: List[str] = []
-        for eff in list(self.status_effects):
-            eff.tick()
-            hook_dispatcher.fire("actor.status_ticked", actor=self, effect=eff)
-            if eff.is_expired():
-                expired.append(eff.name)
-        for name in expired:
-            old = self.statuses.pop(name)
-            log.info("%s's status '%s' has expired.", self.name, name)
-            hook_dispatcher.fire("actor.status_expired", actor=self, effect=old)
+        return status_obj
+
+    def remove_status(self, name: str) -> bool:
+        return self.status_mgr.remove(name)
+
+    def tick_statuses(self) -> List[StatusEffect]:
+        """
+        Advance this actor's status clock by one turn. Only statuses
+        that run out are touched; they are returned.
+        """
+        if self.statuses:
+            self._dirty.add("statuses")
+        return self.status_scheduler.advance()
+
+    def mark_dirty(self, *fields: str) -> None:
+        """Flag fields as changed since the last checkpoint."""
+        self._dirty.update(fields)
+
+    def dirty_fields(self) -> Set[str]:
+        """
+        Names of the fields changed since the last `clear_dirty`:
+        resources, gold, levels, statuses, stats, job, inventory and
+        learning. Setters flag the first five directly; stats and job
+        are compared by identity (and the Stats version counter).
+        """
+        fields = set(self._dirty)
+        stats = self.stats_mgr.stats
+        seen, version = self._stats_seen
+        if stats is not seen or stats._version != version:
+            fields.add("stats")
+        if getattr(self, "job", None) is not self._job_seen:
+            fields.add("job")
+        if self.inventory.is_dirty():
+            fields.add("inventory")
+        learning = getattr(self, "learning", None)
+        if learning is not None and learning.dirty:
+            fields.add("learning")
+        return fields
+
+    def clear_dirty(self) -> None:
+        """Mark the current state as checkpointed."""
+        self._dirty.clear()
+        stats = self.stats_mgr.stats
+        self._stats_seen = (stats, stats._version)
+        self._job_seen = getattr(self, "job", None)
+        self.inventory.clear_dirty()
+        learning = getattr(self, "learning", None)
+        if learning is not None:
+            learning.dirty = False
 
     def start_turn(self) -> None:
         self.defending = False
@@ -151,12 +249,7 @@ class Actor:
             for itm in self.inventory.equipped_items.values()
         )
         item_res = min(item_res, 0.75)
-        status_res = sum(
-            status.stat_mods.get("DamageReduction", 0) / 100.0
-            for status in self.statuses.values()
-        )
-        status_res = min(status_res, 0.75)
-        total = min(item_res + status_res, 0.75)
+        total = min(item_res + self.status_mgr.damage_reduction, 0.75)
         return base * (1.0 - total)
 
     def _apply_damage(self, raw: int, damage_type: Optional[DamageType]) -> int:
@@ -209,6 +302,30 @@ class Actor:
         )
         hook_dispatcher.fire("actor.restored_all", actor=self)
 
+    def attach_hooks(self) -> None:
+        """
+        Per-actor hook wiring: register the passive effects of equipped
+        items. Equip/unequip events reach the actor through the shared
+        listeners at the bottom of this module, keyed by inventory owner,
+        so nothing global holds on to the actor until this is called.
+        """
+        for item in self.inventory.equipped_items.values():
+            for eff_data in getattr(item, "passive_effects", []):
+                hook_dispatcher.fire(
+                    "item.passive.equip", item=item, user=self,
+                    effect_data=eff_data
+                )
+
+    def detach_hooks(self) -> None:
+        """Undo attach_hooks, so a discarded actor can be freed."""
+        for item in self.inventory.equipped_items.values():
+            for eff_data in getattr(item, "passive_effects", []):
+                hook_dispatcher.fire(
+                    "item.passive.unequip", item=item, user=self,
+                    effect_data=eff_data
+                )
+        self.passive_effects = {}
+
     def _on_item_equipped(
         self, inventory: Inventory, slot: str, item: EquipableItem
     ) -> None:
@@ -248,23 +365,23 @@ class Actor:
 
     @property
     def attack(self) -> int:
-        return self.stats.effective().get("attack", 0)
+        return self.stats.get("attack")
 
     @property
     def defense(self) -> int:
-        return self.stats.effective().get("defense", 0)
+        return self.stats.get("defense")
 
     @property
     def speed(self) -> int:
-        return self.stats.effective().get("speed", 0)
+        return self.stats.get("speed")
 
     @property
     def intellect(self) -> int:
-        return self.stats.effective().get("intellect", 0)
+        return self.stats.get("intellect")
 
     @property
     def magic_attack(self) -> int:
-        return self.stats.effective().get("magic_attack", 0)
+        return self.stats.get("magic_attack")
 
     def equip_item(self, item: EquipableItem) -> None:
         self.inventory.equip_item(item)
@@ -287,3 +404,18 @@ class Actor:
         self.stats_mgr.assign_job("")
         self.restore_all()
         hook_dispatcher.fire("character.job_removed", actor=self, old_job=old)
+
+
+# One listener pair for every actor, dispatching on the inventory's owner
+def _route_item_equipped(inventory: Inventory, slot: str, item: EquipableItem, **_: Any) -> None:
+    if isinstance(inventory.owner, Actor):
+        inventory.owner._on_item_equipped(inventory, slot, item)
+
+
+def _route_item_unequipped(inventory: Inventory, slot: str, item: EquipableItem, **_: Any) -> None:
+    if isinstance(inventory.owner, Actor):
+        inventory.owner._on_item_unequipped(inventory, slot, item)
+
+
+hook_dispatcher.register("inventory.equip", _route_item_equipped)
+hook_dispatcher.register("inventory.unequip", _route_item_unequipped)
@@ -1,43 +1,38 @@
 # File: game_sys/character/character_creation.py
 
 from __future__ import annotations
-import json
-from pathlib import Path
 from typing import Any, Dict, Optional
 from game_sys.character.actor import Actor
+from game_sys.core.game_data import game_data
 from game_sys.core.stats import Stats
 from game_sys.skills.learning import LearningSystem, SkillRegistry
-from game_sys.managers.scaling_manager import scale_stat
+from game_sys.managers.scaling_manager import scale_stat_map
 from game_sys.core.rarity import Rarity
 from game_sys.hooks.hooks import hook_dispatcher
 
-# Paths to JSON templates
-_CHAR_TEMPLATES_PATH = (
-    Path(__file__).parent / "data" / "character_templates.json"
+
+def _load_char_templates() -> Dict[str, Dict[str, Any]]:
+    templates = game_data.get("characters")
+    hook_dispatcher.fire("data.loaded", module=__name__, data=templates)
+    return templates
+
+
+def _load_job_templates() -> Dict[str, Dict[str, Any]]:
+    templates = {
+        tpl["job_id"].lower(): tpl for tpl in game_data.get("jobs")
+    }
+    hook_dispatcher.fire("data.loaded", module=__name__, data=templates)
+    return templates
+
+
+# Character and job templates (shared game_data registry, loaded on use)
+_CHAR_TEMPLATES: Dict[str, Dict[str, Any]] = game_data.view(
+    "characters", _load_char_templates
 )
-_JOB_TEMPLATES_PATH = (
-    Path(__file__).parent.parent / "jobs" / "data" / "jobs.json"
+_JOB_TEMPLATES: Dict[str, Dict[str, Any]] = game_data.view(
+    "jobs", _load_job_templates
 )
 
-# Load character templates
-try:
-    with open(_CHAR_TEMPLATES_PATH, "r", encoding="utf-8") as f:
-        _CHAR_TEMPLATES: Dict[str, Dict[str, Any]] = json.load(f)
-except FileNotFoundError:
-    _CHAR_TEMPLATES = {}
-hook_dispatcher.fire("data.loaded", module=__name__, data=_CHAR_TEMPLATES)
-
-# Load job templates
-try:
-    with open(_JOB_TEMPLATES_PATH, "r", encoding="utf-8") as f:
-        job_list = json.load(f)
-        _JOB_TEMPLATES: Dict[str, Dict[str, Any]] = {
-            tpl["job_id"].lower(): tpl for tpl in job_list
-        }
-except FileNotFoundError:
-    _JOB_TEMPLATES = {}
-hook_dispatcher.fire("data.loaded", module=__name__, data=_JOB_TEMPLATES)
-
 class Character(Actor):
     """
     Base class for all characters in the game. Inherits from Actor.
@@ -163,15 +158,12 @@ class Character(Actor):
 
         # 3) Overwrite stats with new job’s stats_mods (scaled by level)
         base_stats = getattr(new_job, "stats_mods", {}) or {}
-        scaled_stats: Dict[str, int] = {}
-        for stat_name, base_value in base_stats.items():
-            # Wrap base_value in a tuple (base_value, base_value)
-            scaled_stats[stat_name] = scale_stat(
-                (base_value, base_value),
-                self.stats_mgr.levels.lvl,
-                grade=getattr(self, "grade", 1),
-                rarity=getattr(self, "rarity", Rarity.COMMON)
-            )
+        scaled_stats: Dict[str, int] = scale_stat_map(
+            base_stats,
+            self.stats_mgr.levels.lvl,
+            grade=getattr(self, "grade", 1),
+            rarity=getattr(self, "rarity", Rarity.COMMON)
+        )
         # Ensure every stat key exists
         from game_sys.jobs.base import Job as BaseJob
 
@@ -493,9 +485,7 @@ def create_character(
     # If a job_id was given, load starting skills if any
     # ---------------------------------------------------------------------
     if requested_job:
-        SkillRegistry.load_from_file(
-            Path(__file__).parent.parent / "skills" / "data" / "skills.json"
-        )
+        SkillRegistry.ensure_loaded()
 
         job_tpl: dict = _JOB_TEMPLATES.get(requested_job, {})
         json_skills: list[str] = job_tpl.get("starting_skills", []) or []
@@ -0,0 +1,323 @@
+# game_sys/character/spawner.py
+"""
+Enemy spawning with prototypes and recycling.
+
+`create_character` is expensive: Actor/StatsManager setup, job creation,
+starting-item rolls, skill loading and several hook fires. An
+`EnemySpawner` runs it once per (template, job, level band) to build a
+prototype and then hands out cheap clones. An `EnemyPool` on top of that
+keeps defeated enemies and resets them instead of building new ones.
+"""
+from __future__ import annotations
+
+import copy
+import random
+from typing import Any, Dict, Hashable, List, Optional, Tuple
+
+from logs.logs import get_logger
+from game_sys.character.character_creation import Character, create_character
+from game_sys.core.experience import Levels
+from game_sys.core.stats import Stats
+from game_sys.hooks.hooks import hook_dispatcher
+from game_sys.inventory.inventory import Inventory
+from game_sys.items.item_base import ConsumableItem
+from game_sys.managers.stats_manager import StatsManager
+from game_sys.skills.cooldowns import CooldownManager
+
+log = get_logger(__name__)
+
+PrototypeKey = Tuple[Hashable, ...]
+
+
+def _clone_stats(stats: Stats) -> Stats:
+    clone = Stats(dict(stats.base), dict(stats.modifiers))
+    clone._modifiers = {k: dict(v) for k, v in stats._modifiers.items()}
+    return clone
+
+
+def _clone_stats_mgr(src: StatsManager, actor: Any) -> StatsManager:
+    mgr = StatsManager.__new__(StatsManager)
+    mgr.__dict__.update(src.__dict__)
+    mgr.actor = actor
+    levels = Levels.__new__(Levels)
+    levels.__dict__.update(src.levels.__dict__)
+    levels.thing = actor
+    mgr.levels = levels
+    mgr.stats = _clone_stats(src.stats)
+    return mgr
+
+
+def _clone_inventory(src: Inventory, actor: Any) -> Inventory:
+    inv = Inventory.__new__(Inventory)
+    inv.__dict__.update(src.__dict__)
+    inv.owner = actor
+    # Equipable items are shared (read-only once rolled); consumables
+    # carry a mutable charge count, so they get their own copy.
+    inv._items = {
+        item_id: {
+            "item": (copy.copy(entry["item"])
+                     if isinstance(entry["item"], ConsumableItem)
+                     else entry["item"]),
+            "quantity": entry["quantity"],
+        }
+        for item_id, entry in src._items.items()
+    }
+    inv.equipped_items = dict(src.equipped_items)
+    inv._dirty_items = set(src._dirty_items)
+    inv._new_items = set(src._new_items)
+    inv._dirty_slots = set(src._dirty_slots)
+    # Stashed records belong to the prototype's owner; clones start empty
+    inv._stash = {}
+    inv._stash_dirty = False
+    return inv
+
+
+def _clone_learning(src: Any, actor: Any) -> Any:
+    # Known skills are copied; every skill gets its own cooldown on a
+    # fresh clock
+    learning = copy.copy(src)
+    learning.owner = actor
+    learning.known_skills = set(src.known_skills)
+    learning._frontier = None
+    learning.instantiated_skills = {}
+    learning.cooldowns = CooldownManager()
+    for sid, skill in src.instantiated_skills.items():
+        learning.add_skill(sid, copy.copy(skill))
+    return learning
+
+
+def clone_character(proto: Character, name: Optional[str] = None) -> Character:
+    """
+    Build a fresh, independent copy of `proto` without re-running
+    character creation. Stats, levels, inventory and resources are
+    copied; job, templates and rolled equipment are shared.
+    """
+    clone = proto.__class__.__new__(proto.__class__)
+    for attr, value in proto.__dict__.items():
+        if isinstance(value, (dict, list, set)):
+            value = copy.copy(value)
+        clone.__dict__[attr] = value
+
+    clone.stats_mgr = _clone_stats_mgr(proto.stats_mgr, clone)
+    clone.inventory = _clone_inventory(proto.inventory, clone)
+    clone.statuses = {}
+    clone._status_scheduler = None
+    clone._status_mgr = None
+    clone.passive_effects = {}
+    clone.defending = False
+    if name is not None:
+        clone.name = name
+
+    learning = getattr(proto, "learning", None)
+    if learning is not None:
+        clone.learning = _clone_learning(learning, clone)
+
+    clone.attach_hooks()
+    return clone
+
+
+class EnemySpawner:
+    """
+    Keeps pre-built prototypes per (template, job, level band, overrides)
+    and spawns enemies by cloning them.
+
+    Enemies spawned from one prototype share its rolled grade, rarity,
+    level (the first level of the band), gold and equipment. Use
+    `variants` > 1 to keep several independently rolled prototypes per
+    key and pick among them at random.
+    """
+
+    def __init__(
+        self,
+        level_band: int = 1,
+        variants: int = 1,
+        rng: Optional[random.Random] = None,
+    ) -> None:
+        if level_band < 1:
+            raise ValueError("level_band must be >= 1")
+        if variants < 1:
+            raise ValueError("variants must be >= 1")
+        self.level_band = level_band
+        self.variants = variants
+        self.rng = rng or random.Random()
+        self._prototypes: Dict[PrototypeKey, List[Character]] = {}
+
+    def band_level(self, level: int) -> int:
+        """First level of the band containing `level`."""
+        return ((max(1, level) - 1) // self.level_band) * self.level_band + 1
+
+    def key_for(
+        self,
+        template: str,
+        level: int,
+        job_id: Optional[str] = None,
+        **overrides: Any,
+    ) -> PrototypeKey:
+        return (
+            template.lower(),
+            job_id.lower() if job_id else None,
+            self.band_level(level),
+            tuple(sorted((k, str(v)) for k, v in overrides.items())),
+        )
+
+    def prototypes(self, key: PrototypeKey) -> List[Character]:
+        return self._prototypes.get(key, [])
+
+    def _build_prototypes(
+        self,
+        key: PrototypeKey,
+        template: str,
+        job_id: Optional[str],
+        overrides: Dict[str, Any],
+    ) -> List[Character]:
+        protos = self._prototypes.get(key)
+        if protos is None:
+            params = dict(overrides)
+            params["level"] = key[2]
+            if job_id:
+                params["job_id"] = job_id
+            protos = [create_character(template, **params)
+                      for _ in range(self.variants)]
+            self._prototypes[key] = protos
+            log.debug("Built %d prototype(s) for %s", len(protos), key)
+        return protos
+
+    def warm(
+        self,
+        template: str,
+        level: int,
+        job_id: Optional[str] = None,
+        **overrides: Any,
+    ) -> PrototypeKey:
+        """Build the prototypes for a key ahead of time."""
+        key = self.key_for(template, level, job_id, **overrides)
+        self._build_prototypes(key, template, job_id, overrides)
+        return key
+
+    def spawn(
+        self,
+        template: str,
+        level: int = 1,
+        job_id: Optional[str] = None,
+        name: Optional[str] = None,
+        **overrides: Any,
+    ) -> Character:
+        """Return a new enemy cloned from the matching prototype."""
+        key = self.key_for(template, level, job_id, **overrides)
+        protos = self._build_prototypes(key, template, job_id, overrides)
+        proto = protos[0] if len(protos) == 1 else self.rng.choice(protos)
+        enemy = clone_character(proto, name=name)
+        enemy._spawn_key = key
+        enemy._spawn_proto = proto
+        hook_dispatcher.fire("character.spawned", character=enemy, key=key)
+        return enemy
+
+    def spawn_many(
+        self,
+        template: str,
+        count: int,
+        level: int = 1,
+        job_id: Optional[str] = None,
+        **overrides: Any,
+    ) -> List[Character]:
+        return [self.spawn(template, level, job_id, **overrides)
+                for _ in range(count)]
+
+    def clear(self) -> None:
+        self._prototypes.clear()
+
+
+class EnemyPool:
+    """
+    Recycles defeated enemies. `acquire` reuses a released enemy of the
+    same spawn key (reset to its prototype's state) or spawns a new one;
+    `release` returns an enemy to the pool.
+    """
+
+    def __init__(
+        self,
+        spawner: Optional[EnemySpawner] = None,
+        max_per_key: int = 256,
+    ) -> None:
+        self.spawner = spawner or EnemySpawner()
+        self.max_per_key = max_per_key
+        self._free: Dict[PrototypeKey, List[Character]] = {}
+        self.reused = 0
+        self.spawned = 0
+
+    def acquire(
+        self,
+        template: str,
+        level: int = 1,
+        job_id: Optional[str] = None,
+        name: Optional[str] = None,
+        **overrides: Any,
+    ) -> Character:
+        key = self.spawner.key_for(template, level, job_id, **overrides)
+        free = self._free.get(key)
+        if free:
+            enemy = free.pop()
+            self.reset(enemy)
+            if name is not None:
+                enemy.name = name
+            self.reused += 1
+            hook_dispatcher.fire("character.spawned", character=enemy, key=key)
+            return enemy
+        self.spawned += 1
+        return self.spawner.spawn(template, level, job_id, name, **overrides)
+
+    def release(self, enemy: Character) -> bool:
+        """
+        Return an enemy to the pool. Enemies not produced by a spawner,
+        or beyond `max_per_key`, are dropped (returns False).
+        """
+        key = getattr(enemy, "_spawn_key", None)
+        if key is None:
+            return False
+        free = self._free.setdefault(key, [])
+        if any(e is enemy for e in free):
+            return False
+        if len(free) >= self.max_per_key:
+            enemy.detach_hooks()
+            return False
+        free.append(enemy)
+        return True
+
+    def reset(self, enemy: Character) -> None:
+        """Restore a recycled enemy to its prototype's state."""
+        proto: Character = enemy._spawn_proto
+        enemy.name = proto.name
+        enemy.gold = proto.gold
+        enemy.status_mgr.clear()
+        enemy.defending = False
+        # Loot picked up and consumables used since the last fight are
+        # dropped with the old inventory
+        enemy.detach_hooks()
+        old = enemy.inventory
+        inv = enemy.inventory = _clone_inventory(proto.inventory, enemy)
+        # Record the swap as changes, so the next delta replaces the bag
+        inv._new_items = set(inv._items)
+        inv._dirty_items = set(old._items) | inv._new_items
+        inv._dirty_slots = set(old.equipped_items) | set(inv.equipped_items)
+        learning = getattr(proto, "learning", None)
+        if learning is not None:
+            enemy.learning = _clone_learning(learning, enemy)
+        enemy.stats_mgr.levels.__dict__.update(proto.stats_mgr.levels.__dict__)
+        enemy.stats_mgr.levels.thing = enemy
+        enemy.stats_mgr.stats = _clone_stats(proto.stats_mgr.stats)
+        # The prototype sits at full resources, so copy them rather than
+        # re-deriving maxima through restore_all()
+        enemy._current_health = proto._current_health
+        enemy._current_mana = proto._current_mana
+        enemy._current_stamina = proto._current_stamina
+        enemy.attach_hooks()
+        enemy.mark_dirty("resources", "levels")
+
+    def size(self) -> int:
+        return sum(len(v) for v in self._free.values())
+
+    def clear(self) -> None:
+        for free in self._free.values():
+            for enemy in free:
+                enemy.detach_hooks()
+        self._free.clear()
@@ -0,0 +1,150 @@
+# game_sys/combat/ai.py
+"""
+Action selection for combatants.
+
+Each turn an actor picks among a basic attack, castable skills from its
+LearningSystem and healing consumables. ActionEvaluator scores every
+option by expected effect, using the damage formulas without RNG
+(CombatCapabilities.expected_damage for attacks, the skills' own
+DamageEffects for skills). Scores are cached per combat turn, so a
+crowded fight evaluates each (actor, option, target) pair once per
+turn.
+
+`choose_action` is CombatEngine's default `action_fn`; pass another
+callable with the same signature to script or hand-control actors.
+"""
+from __future__ import annotations
+
+from typing import Any, Dict, Iterator, List, NamedTuple, Optional, TYPE_CHECKING
+
+from game_sys.core.damage_types import DamageType
+from game_sys.items.item_base import ConsumableItem, EquipableItem
+
+if TYPE_CHECKING:
+    from game_sys.character.actor import Actor
+    from game_sys.combat.combat_engine import CombatEngine
+    from game_sys.skills.base import Skill
+
+ATTACK = "attack"
+SKILL = "skill"
+ITEM = "item"
+
+# Healing is only considered below this fraction of max health, and
+# then HP restored counts this much more than the same damage dealt
+HEAL_THRESHOLD = 0.4
+HEAL_WEIGHT = 2.0
+# Extra score for an option expected to defeat its target, as a
+# fraction of the target's max health
+KILL_BONUS = 0.5
+
+
+class Action(NamedTuple):
+    """One choice for an actor's turn."""
+    kind: str
+    target: Any
+    skill: Optional[Skill] = None
+    item: Optional[ConsumableItem] = None
+    score: float = 0.0
+
+
+def attack_damage_map(actor: Actor, target: Actor) -> Dict[DamageType, int]:
+    """Damage map of a basic attack: weapon damage plus attack, or bare
+    attack less a little of the target's defense."""
+    weapon = actor.inventory.get_primary_weapon()
+    if isinstance(weapon, EquipableItem):
+        return {dt: amt + actor.attack for dt, amt in weapon.total_damage_map().items()}
+    return {DamageType.PHYSICAL: max(0, actor.attack - int(target.defense * 0.05))}
+
+
+class ActionEvaluator:
+    """Scores an actor's options; results are reused within one turn."""
+
+    def __init__(self, engine: CombatEngine) -> None:
+        self.engine = engine
+        self.turn: Optional[int] = None
+        # id(actor or skill) → {id(target): expected damage}
+        self._rows: Dict[int, Dict[int, float]] = {}
+
+    def _row(self, source: Any) -> Dict[int, float]:
+        if self.turn != self.engine.turn:
+            self.turn = self.engine.turn
+            self._rows.clear()
+        row = self._rows.get(id(source))
+        if row is None:
+            row = self._rows[id(source)] = {}
+        return row
+
+    def attack_damage(self, actor: Actor, target: Actor) -> float:
+        row = self._row(actor)
+        value = row.get(id(target))
+        if value is None:
+            value = row[id(target)] = self.engine.combat.expected_damage(
+                actor, target, attack_damage_map(actor, target), stat_name=None
+            )
+        return value
+
+    def skill_damage(self, actor: Actor, skill: Skill, target: Actor) -> float:
+        row = self._row(skill)
+        value = row.get(id(target))
+        if value is None:
+            value = row[id(target)] = skill.expected_damage(actor, target)
+        return value
+
+    @staticmethod
+    def damage_score(damage: float, target: Actor) -> float:
+        """Expected damage, plus the kill bonus if it should defeat `target`."""
+        if damage >= target.current_health:
+            return damage + KILL_BONUS * target.max_health
+        return damage
+
+    def _scored(self, actor: Actor, foes: List[Actor]) -> Iterator[tuple]:
+        # (score, kind, target, skill, item) per option; plain tuples
+        # keep the hot loop cheap, Actions are built by the callers
+        score = self.damage_score
+        for foe in foes:
+            yield score(self.attack_damage(actor, foe), foe), ATTACK, foe, None, None
+
+        learning = getattr(actor, "learning", None)
+        skills = learning.instantiated_skills.values() if learning is not None else ()
+        missing = actor.max_health - actor.current_health
+        hurt = actor.current_health < actor.max_health * HEAL_THRESHOLD
+        for skill in skills:
+            if not skill.can_cast(actor):
+                continue
+            heal = skill.expected_heal()
+            if heal and hurt:
+                yield HEAL_WEIGHT * min(heal, missing), SKILL, actor, skill, None
+            for foe in foes:
+                damage = self.skill_damage(actor, skill, foe)
+                if damage > 0:
+                    yield score(damage, foe), SKILL, foe, skill, None
+
+        if hurt:
+            for item in actor.inventory.list_items():
+                if isinstance(item, ConsumableItem):
+                    heal = item.expected_heal()
+                    if heal:
+                        yield HEAL_WEIGHT * min(heal, missing), ITEM, actor, None, item
+
+    def options(self, actor: Actor, foes: List[Actor]) -> List[Action]:
+        """Every available action with its score."""
+        return [
+            Action(kind, target, skill, item, score)
+            for score, kind, target, skill, item in self._scored(actor, foes)
+        ]
+
+    def choose(self, actor: Actor, foes: List[Actor]) -> Optional[Action]:
+        """Highest-scoring action; ties go to the earliest option."""
+        best = None
+        for option in self._scored(actor, foes):
+            if best is None or option[0] > best[0]:
+                best = option
+        if best is None:
+            return None
+        score, kind, target, skill, item = best
+        return Action(kind, target, skill, item, score)
+
+
+def choose_action(engine: CombatEngine, actor: Actor, foes: List[Actor]) -> Optional[Action]:
+    """Default CombatEngine action_fn: the evaluator's best option."""
+    return engine.evaluator.choose(actor, foes)
@@ -1,6 +1,7 @@
+import logging
 import random
-from typing import Any, Dict, Optional, List
-from logs.logs import get_logger
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+from logs.logs import get_logger, log_enabled
 
 from game_sys.config.config import (
     DEFENSE_PIVOT,
@@ -16,6 +17,33 @@ from game_sys.items.item_base import EquipableItem
 log = get_logger(__name__)
 
 
+def defense_reduction(raw: float, defense: float) -> float:
+    """Damage left of `raw` after `defense`: hybrid flat subtraction,
+    then the percentage curve."""
+    flat = max(raw - defense * FLAT_DEFENSE_FACTOR, raw * MIN_DAMAGE_PERCENT)
+    if defense >= 0:
+        return flat * DEFENSE_PIVOT / (DEFENSE_PIVOT + (defense ** DEFENSE_ALPHA))
+    return flat
+
+
+def _mitigated(raw: int, defense: float, res_mult: float) -> int:
+    """Hit damage calculate_damage reports for a rolled `raw`."""
+    post_def = max(int(round(defense_reduction(raw, defense))), 1)
+    return int(round(post_def * res_mult))
+
+
+def _rounded_uniform(lo: float, hi: float) -> Iterator[Tuple[int, float]]:
+    """(value, probability) of int(round(x)) for x uniform on [lo, hi]."""
+    if hi <= lo:
+        yield int(round(lo)), 1.0
+        return
+    span = hi - lo
+    for value in range(int(round(lo)), int(round(hi)) + 1):
+        p = (min(hi, value + 0.5) - max(lo, value - 0.5)) / span
+        if p > 0:
+            yield value, p
+
+
 class CombatCapabilities:
     def __init__(self, rng: Optional[random.Random] = None) -> None:
         self.rng = rng or random.Random()
@@ -54,40 +82,30 @@ class CombatCapabilities:
             raw = int(round(roll))
             defense = getattr(defender, "defense", 0)
 
-            # Hybrid flat subtraction
-            flat = max(raw - defense * FLAT_DEFENSE_FACTOR, raw * MIN_DAMAGE_PERCENT)
-
-            # Percentage‐based reduction with exponent
-            if defense >= 0:
-                reduced = flat * DEFENSE_PIVOT / (DEFENSE_PIVOT + (defense ** DEFENSE_ALPHA))
-            else:
-                reduced = flat
-            post_def = int(round(reduced))
-            post_def = max(post_def, 1)
-
-            # Apply weakness/resist
+            # Apply defense, then weakness/resist
             res_mult = (
                 defender._resistance_multiplier(dt)
                 if hasattr(defender, "_resistance_multiplier")
                 else 1.0
             )
-            final_dmg = int(round(post_def * res_mult))
+            final_dmg = _mitigated(raw, defense, res_mult)
 
             hits.append((dt, final_dmg, is_crit, res_mult))
 
         # 2) Apply all hits
         for dt, dmg, is_crit, res_mult in hits:
             dealt = defender._apply_damage(dmg, dt)
-            log.info(
-                "%s hits %s for %d %s damage%s%s",
-                attacker.name,
-                defender.name,
-                dealt,
-                dt.name.lower(),
-                f" (weakness×{res_mult:.2f})" if res_mult > 1 else
-                (f" (resist×{res_mult:.2f})" if res_mult < 1 else ""),
-                " (CRITICAL!)" if is_crit else ""
-            )
+            if log_enabled(log, logging.INFO):
+                log.info(
+                    "%s hits %s for %d %s damage%s%s",
+                    attacker.name,
+                    defender.name,
+                    dealt,
+                    dt.name.lower(),
+                    f" (weakness×{res_mult:.2f})" if res_mult > 1 else
+                    (f" (resist×{res_mult:.2f})" if res_mult < 1 else ""),
+                    " (CRITICAL!)" if is_crit else ""
+                )
 
             # ←— **necessary**: fire this so LifeStealPassive sees the hit
             hook_dispatcher.fire(
@@ -116,6 +134,48 @@ class CombatCapabilities:
         log.info(summary)
         return summary
 
+    def expected_damage(
+        self,
+        attacker: Any,
+        defender: Any,
+        damage_map: Optional[Dict[DamageType, float]],
+        stat_name: Optional[str],
+        multiplier: float = 1.0,
+        crit_chance: float = 0.10,
+        variance: float = 0.10,
+    ) -> float:
+        """
+        Mean HP calculate_damage would take off `defender`, without
+        rolling: exact over the variance and crit rolls, including the
+        per-hit rounding, the 1-damage floor and the defender's own
+        rounding in _apply_damage. Defending and the defender's
+        remaining HP are not taken into account.
+        """
+        if not damage_map or sum(damage_map.values()) <= 0:
+            fallback = getattr(attacker, stat_name, 1) if stat_name else 1
+            damage_map = {DamageType.PHYSICAL: fallback}
+
+        bonus = getattr(attacker, stat_name, 0) * multiplier if stat_name else 0
+        defense = getattr(defender, "defense", 0)
+        resist = getattr(defender, "_resistance_multiplier", None)
+        outcomes = [(1 - crit_chance, 1), (crit_chance, 2)]
+        total = 0.0
+        for dt, base in damage_map.items():
+            roll = base + bonus
+            res_mult = resist(dt) if resist is not None else 1.0
+            for weight, scale in outcomes:
+                if weight <= 0:
+                    continue
+                lo = roll * (1 - variance) * scale
+                hi = roll * (1 + variance) * scale
+                for raw, p in _rounded_uniform(lo, hi):
+                    hit = _mitigated(raw, defense, res_mult)
+                    if resist is not None:
+                        # _apply_damage scales by the multiplier again
+                        hit = int(round(hit * res_mult))
+                    total += weight * p * hit
+        return total
+
     def transfer_loot(self, winner: Any, defeated: Any) -> None:
         for item in roll_loot(defeated, self.rng):
             winner.inventory.add_item(item)
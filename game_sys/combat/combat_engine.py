@@ -1,13 +1,18 @@
 # game_sys/combat/combat_engine.py
 
 import random
-from typing import List, Optional, Callable
+from typing import Dict, List, Optional, Callable
 from logs.logs import get_logger
-from game_sys.core.damage_types import DamageType
 from game_sys.character.actor import Actor
 from game_sys.combat.combat import CombatCapabilities
+from game_sys.combat.ai import (
+    ATTACK, ITEM, SKILL, Action, ActionEvaluator, attack_damage_map, choose_action,
+)
+from game_sys.effects.base import active_combat_engine
 from game_sys.character.character_creation import Enemy
 from game_sys.items.item_base import EquipableItem
+from game_sys.skills.cooldowns import CooldownManager
+from game_sys.effects.status_scheduler import StatusScheduler
 
 log = get_logger(__name__)
 
@@ -28,10 +33,56 @@ class CombatEngine:
         self.party = party
         self.enemies = enemies
         self.rng = rng or random.Random()
-        self.action_fn = action_fn
+        # action_fn(engine, actor, living_foes) -> Action or None (basic
+        # attack on a random foe); the default picks by expected effect
+        self.action_fn = action_fn or choose_action
         self.max_turns = max_turns
         self.turn = 0
         self.combat = CombatCapabilities(self.rng)
+        self.evaluator = ActionEvaluator(self)
+        # id(recipient) → [recipient, pending XP, kills]; settled once
+        # per round by settle_xp()
+        self._pending_xp: Dict[int, list] = {}
+        # One cooldown clock for every participant, advanced per round
+        self.cooldowns = CooldownManager()
+        # Likewise one expiry clock for every participant's statuses
+        self.statuses = StatusScheduler()
+
+    def award_kill_xp(self, defeated: Actor) -> None:
+        """
+        Split `defeated`'s XP among the living party members and queue
+        the shares; nothing is applied until settle_xp().
+        """
+        xp_share = defeated.stats_mgr.levels.experience
+        if xp_share <= 0:
+            return
+        living = [m for m in self.party if m.current_health > 0]
+        if not living:
+            return
+        share = xp_share // len(living)
+        pending = self._pending_xp
+        for m in living:
+            entry = pending.get(id(m))
+            if entry is None:
+                pending[id(m)] = [m, share, 1]
+            else:
+                entry[1] += share
+                entry[2] += 1
+
+    def settle_xp(self) -> Dict[Actor, int]:
+        """
+        Apply all queued XP: one add_experience call (and so at most
+        one level-up evaluation) per recipient, however many kills fed
+        it. Returns {recipient: XP granted}.
+        """
+        pending, self._pending_xp = self._pending_xp, {}
+        awarded: Dict[Actor, int] = {}
+        for member, amount, kills in pending.values():
+            member.stats_mgr.add_experience(amount)
+            awarded[member] = amount
+            log.info("%s receives %d XP from %d defeated foe(s).",
+                     member.name, amount, kills)
+        return awarded
 
     def _perform_actor_turn(self, actor: Actor, foes: List[Actor]) -> Optional[str]:
         from game_sys.hooks.hooks import hook_dispatcher
@@ -41,35 +92,15 @@ class CombatEngine:
         if not living_foes:
             return None
 
-        target = self.rng.choice(living_foes)
-        # Attack logic
-        weapon = actor.inventory.get_primary_weapon()
-        if isinstance(weapon, EquipableItem):
-            base_map = weapon.total_damage_map()
-            dmg_map = {dt: amt + actor.attack for dt, amt in base_map.items()}
-        else:
-            log.info("%s is not an EquipableItem, using base attack damage.", weapon)
-            amt = max(0, actor.attack - int(target.defense * 0.05))
-            dmg_map = {DamageType.PHYSICAL: amt}
-
-        # Damage roll
-        self.combat.calculate_damage(
-            attacker=actor,
-            defender=target,
-            damage_map=dmg_map,
-            stat_name=None
-        )
+        action = self.action_fn(self, actor, living_foes)
+        if action is None:
+            action = Action(ATTACK, self.rng.choice(living_foes))
+        target = action.target
+        self._execute(actor, action)
 
-        # If defeated, distribute XP & loot
-        if target.current_health <= 0:
-            xp_share = target.stats_mgr.levels.experience
-            if xp_share > 0:
-                living = [m for m in self.party if m.current_health > 0]
-                if living:
-                    share = xp_share // len(living)
-                    for m in living:
-                        m.stats_mgr.levels.add_experience(share)
-                        log.info("%s receives %d XP from defeating %s.", m.name, share, target.name)
+        # If defeated, queue XP (settled at end of round) & hand out loot
+        if target in foes and target.current_health <= 0:
+            self.award_kill_xp(target)
             self.combat.transfer_loot(winner=actor, defeated=target)
 
             if all(f.current_health <= 0 for f in foes):
@@ -78,14 +109,56 @@ class CombatEngine:
                     if isinstance(actor, Enemy)
                     else "Party wins! (All enemies defeated)"
                 )
+                self.settle_xp()
                 hook_dispatcher.fire("combat.end", engine=self, result=result)
                 return result
         return None
 
+    def _execute(self, actor: Actor, action: Action) -> None:
+        target = action.target
+        if action.kind == SKILL:
+            log.info("%s uses %s on %s.", actor.name, action.skill.name, target.name)
+            action.skill.use(actor, target, self)
+        elif action.kind == ITEM:
+            actor.inventory.use_item(action.item, self)
+        else:
+            self.basic_attack(actor, target)
+
+    def basic_attack(self, actor: Actor, target: Actor) -> None:
+        weapon = actor.inventory.get_primary_weapon()
+        if not isinstance(weapon, EquipableItem):
+            log.info("%s is not an EquipableItem, using base attack damage.", weapon)
+        self.combat.calculate_damage(
+            attacker=actor,
+            defender=target,
+            damage_map=attack_damage_map(actor, target),
+            stat_name=None
+        )
+
     def start(self) -> str:
+        # Skills and statuses of all participants run on the engine's
+        # clocks for the fight, then go back to their owners' clocks
+        bound = []
+        schedulers = []
+        for actor in self.party + self.enemies:
+            learning = getattr(actor, "learning", None)
+            if learning is not None:
+                bound.append((learning, learning.bind_cooldowns(self.cooldowns)))
+            schedulers.append((actor, actor.bind_status_scheduler(self.statuses)))
+        try:
+            # Effects applied during the fight roll from this engine's RNG
+            with active_combat_engine(self):
+                return self._run_turns()
+        finally:
+            for learning, previous in bound:
+                learning.bind_cooldowns(previous)
+            for actor, scheduler in schedulers:
+                actor.bind_status_scheduler(scheduler)
+
+    def _run_turns(self) -> str:
         for turn in range(1, self.max_turns + 1):
             self.turn = turn
-            log.info(f"--- Turn {self.turn} ---")
+            log.info("--- Turn %d ---", self.turn)
 
             self.party.sort(key=lambda a: a.speed, reverse=True)
             for member in self.party:
@@ -105,6 +178,10 @@ class CombatEngine:
                 if res:
                     return res
 
+            self.settle_xp()
+            self.cooldowns.advance()
+            self.statuses.advance()
+
         return "Draw?"
 
     def run(self) -> str:
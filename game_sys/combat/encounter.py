@@ -6,7 +6,7 @@ interface (start() returning a result string), but delegates the fight logic
 to CombatEngine.
 """
 
-from typing import List, Union, Optional, Callable
+from typing import Any, List, Union, Optional, Callable
 import random
 
 from game_sys.character.actor import Actor
@@ -24,7 +24,7 @@ class Encounter:
         party: Union[Actor, List[Actor]],
         enemies: Union[Actor, List[Actor]],
         rng: Optional[random.Random] = None,
-        action_fn: Optional[Callable[[Actor], str]] = None,
+        action_fn: Optional[Callable[..., Any]] = None,
         max_turns: int = 100,
     ):
         # Ensure 'party' is always a list of Actor
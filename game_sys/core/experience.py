@@ -11,6 +11,31 @@ from typing import Any
 log = get_logger(__name__)
 
 
+def experience_to_reach(level: int) -> int:
+    """
+    Total XP needed to go from level 1 to `level`: the prefix sum of
+    required_experience, sum(100*l^2 + 100*l for l < level), which is
+    100*(level-1)*level*(level+1)/3.
+    """
+    if level <= 1:
+        return 0
+    return 100 * (level - 1) * level * (level + 1) // 3
+
+
+def level_for_experience(total: int, max_level: int = 100) -> int:
+    """Highest level (capped at `max_level`) reachable with `total` XP."""
+    if total <= 0:
+        return 1
+    # (L-1)L(L+1) = L^3 - L, so the cube root is a close first guess;
+    # the loops only correct float rounding.
+    level = max(1, int((3 * total / 100) ** (1 / 3)))
+    while experience_to_reach(level + 1) <= total:
+        level += 1
+    while level > 1 and experience_to_reach(level) > total:
+        level -= 1
+    return min(level, max_level)
+
+
 class Levels:
     """
     Manages a thing’s level and experience.
@@ -54,17 +79,23 @@ class Levels:
             # Delegate leveling logic to the thing
             return
 
-        # NPC/Enemy: auto-level up here
-        while (self.lvl < self.max_level and
-               self.experience >= self.required_experience()):
-            self.level_up()
+        # NPC/Enemy: auto-level up here, jumping straight to the level
+        # the new total reaches instead of looping one level at a time
+        if (self.lvl < self.max_level and
+                self.experience >= self.required_experience()):
+            old_lvl = self.lvl
+            total = experience_to_reach(old_lvl) + self.experience
+            new_lvl = level_for_experience(total, self.max_level)
+            self.lvl = new_lvl
+            self.experience = total - experience_to_reach(new_lvl)
+            self._on_level_change(old_lvl)
 
     def remove_experience(self, exp: int) -> None:
         """Remove experience points from the thing (floors at zero)."""
         if not isinstance(exp, int):
             raise TypeError("Experience must be an integer.")
         self.experience = max(0, self.experience - exp)
-        log.info(f"{self.thing.name} lost {exp} experience points.")
+        log.info("%s lost %d experience points.", self.thing.name, exp)
 
     def level_up(self) -> None:
         """
@@ -73,18 +104,23 @@ class Levels:
         recalc stats, restore resources.
         """
         to_next = self.required_experience()
+        old_lvl = self.lvl
         self.experience -= to_next
         self.lvl += 1
+        self._on_level_change(old_lvl)
 
+    def _on_level_change(self, old_lvl: int) -> None:
+        """
+        Run the level-up side effects once for a jump from `old_lvl`
+        to the current level, however many levels were gained: one
+        stat recalculation and one aggregated `character.level_up`.
+        """
         # Character-specific hooks
         from game_sys.character.actor import Actor
         from game_sys.items.item_base import Item
         if isinstance(self.thing, Actor):
-            try:
-                self.thing.update_stats()
-                self.thing.restore_all()
-            except AttributeError:
-                pass
+            self.thing.stats_mgr.rescale(old_lvl)
+            self.thing.restore_all()
         # Item rescaling on level change
         elif isinstance(self.thing, Item):
             try:
@@ -95,16 +131,18 @@ class Levels:
         hook_dispatcher.fire(
             "character.level_up",
             character=self.thing,
-            new_level=self.thing.levels.lvl
+            old_level=old_lvl,
+            new_level=self.lvl,
+            levels_gained=self.lvl - old_lvl,
             )
-        log.info(f"{self.thing.name} reached level {self.lvl}!")
+        log.info("%s reached level %d!", self.thing.name, self.lvl)
 
     def change_level(self, new_level: int) -> None:
         """Force-set the thing's level (with validation)."""
         if not isinstance(new_level, int):
             raise TypeError("Level must be an integer.")
         self.lvl = new_level
-        log.info(f"{self.thing.name} level changed to {self.lvl}.")
+        log.info("%s level changed to %d.", self.thing.name, self.lvl)
 
     def reset_experience(self) -> None:
         """Reset XP to zero."""
@@ -134,6 +172,7 @@ class Levels:
     def required_experience(self) -> int:
         """
         XP needed to reach the next level. Formula: 100*lvl^2 + 100*lvl.
+        See experience_to_reach for the cumulative form.
         """
         if self.lvl >= self.max_level:
             return float("inf")
@@ -148,6 +187,7 @@ class Levels:
         if not isinstance(value, int):
             raise TypeError("Experience must be an integer.")
         self._experience = max(0, value)
+        self._mark_dirty()
 
     @property
     def lvl(self) -> int:
@@ -158,3 +198,9 @@ class Levels:
         if not isinstance(value, int):
             raise TypeError("Level must be an integer.")
         self._lvl = max(1, min(value, self.max_level))
+        self._mark_dirty()
+
+    def _mark_dirty(self) -> None:
+        mark = getattr(self.thing, "mark_dirty", None)
+        if mark is not None:
+            mark("levels")
@@ -0,0 +1,352 @@
+# game_sys/core/game_data.py
+"""
+Single registry for every JSON data file the game ships with.
+
+Each module used to open and parse its own file at import time (and
+jobs.json was parsed twice). `game_data` loads them all once, checks
+cross-references between them, and keeps a pickled copy of the parsed
+data next to the package. On later cold starts, files whose mtime and
+size (or, failing that, SHA-256) match the cache are taken from the
+pickle instead of being parsed again.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import pickle
+import threading
+from collections.abc import MutableMapping
+from pathlib import Path
+from typing import (
+    Any, Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple,
+)
+
+from logs.logs import get_logger
+
+log = get_logger(__name__)
+
+_PKG_DIR = Path(__file__).resolve().parent.parent
+
+# name -> (path relative to game_sys/, empty value when missing/invalid)
+DATA_FILES: Dict[str, Tuple[str, Any]] = {
+    "items": ("items/data/items.json", []),
+    "jobs": ("jobs/data/jobs.json", []),
+    "skills": ("skills/data/skills.json", []),
+    "enchantments": ("enchantments/data/enchantments.json", []),
+    "drop_tables": ("combat/data/drop_tables.json", {}),
+    "characters": ("character/data/character_templates.json", {}),
+    "inventories": ("inventory/data/inventories.json", {}),
+}
+
+DEFAULT_CACHE_PATH = _PKG_DIR / "__datacache__" / "game_data.pickle"
+CACHE_VERSION = 1
+
+# (mtime_ns, size, sha256)
+Fingerprint = Tuple[int, int, Optional[str]]
+
+
+class LazyData(MutableMapping):
+    """
+    dict-like template table built on first access. Lets modules keep
+    their module-level `_TEMPLATES`-style globals without reading any
+    data at import time.
+    """
+
+    __slots__ = ("_build", "_data")
+
+    def __init__(self, build: Callable[[], Dict[Any, Any]]) -> None:
+        self._build = build
+        self._data: Optional[Dict[Any, Any]] = None
+
+    def _load(self) -> Dict[Any, Any]:
+        if self._data is None:
+            self._data = self._build()
+        return self._data
+
+    @property
+    def loaded(self) -> bool:
+        return self._data is not None
+
+    def reset(self) -> None:
+        """Drop the built table; it is rebuilt on next access."""
+        self._data = None
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        return self._load().get(key, default)
+
+    def __getitem__(self, key: Any) -> Any:
+        return self._load()[key]
+
+    def __setitem__(self, key: Any, value: Any) -> None:
+        self._load()[key] = value
+
+    def __delitem__(self, key: Any) -> None:
+        del self._load()[key]
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._load()
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(self._load())
+
+    def __len__(self) -> int:
+        return len(self._load())
+
+    def __repr__(self) -> str:
+        if self._data is None:
+            return f"{type(self).__name__}(<not loaded>)"
+        return f"{type(self).__name__}({self._data!r})"
+
+
+class GameData:
+    """
+    Lazily loads all data files on first access and serves the parsed
+    JSON from memory afterwards. Use `reload()` after editing data files
+    at runtime.
+    """
+
+    def __init__(
+        self,
+        files: Optional[Dict[str, Tuple[str, Any]]] = None,
+        root: Optional[Path] = None,
+        cache_path: Optional[Path] = DEFAULT_CACHE_PATH,
+        strict: bool = False,
+    ) -> None:
+        self.files = dict(files if files is not None else DATA_FILES)
+        self.root = Path(root) if root is not None else _PKG_DIR
+        self.cache_path = Path(cache_path) if cache_path else None
+        self.strict = strict
+        self._data: Dict[str, Any] = {}
+        self._fingerprints: Dict[str, Fingerprint] = {}
+        self._loaded = False
+        self._lock = threading.RLock()
+        self._views: Dict[str, List[LazyData]] = {}
+        self.cache_hits: Set[str] = set()
+
+    # ------------------------------------------------------------------
+    # Access
+    # ------------------------------------------------------------------
+    def get(self, name: str) -> Any:
+        """Parsed contents of data file `name` (see DATA_FILES)."""
+        if not self._loaded:
+            self.load()
+        try:
+            return self._data[name]
+        except KeyError:
+            raise KeyError(f"Unknown data file '{name}'") from None
+
+    def __getitem__(self, name: str) -> Any:
+        return self.get(name)
+
+    def view(self, name: str, build: Callable[[], Dict[Any, Any]]) -> LazyData:
+        """
+        A LazyData table derived from data file `name` by `build`. It is
+        reset whenever `reload()` finds that file changed.
+        """
+        lazy = LazyData(build)
+        self._views.setdefault(name, []).append(lazy)
+        return lazy
+
+    def path(self, name: str) -> Path:
+        return self.root / self.files[name][0]
+
+    def digest(self, name: str) -> Optional[str]:
+        """SHA-256 of file `name` as last loaded."""
+        if not self._loaded:
+            self.load()
+        fp = self._fingerprints.get(name)
+        return fp[2] if fp else None
+
+    # ------------------------------------------------------------------
+    # Loading
+    # ------------------------------------------------------------------
+    def load(self) -> None:
+        """Load every data file once (no-op when already loaded)."""
+        with self._lock:
+            if self._loaded:
+                return
+            cache = self._read_cache()
+            parsed = [self._load_one(name, cache) for name in self.files]
+            self._loaded = True
+            # Data taken from the cache was validated when it was written
+            stale = any(parsed) or set(cache) != set(self._fingerprints)
+            if stale or self.strict:
+                self.validate()
+            if stale:
+                self._write_cache()
+
+    def reload(self, names: Optional[Iterable[str]] = None) -> List[str]:
+        """
+        Re-check data files on disk (all, or just `names`) and re-parse
+        those whose contents changed. Returns the names that changed,
+        after firing `data.reloaded` with them.
+        """
+        with self._lock:
+            if not self._loaded:
+                self.load()
+                return list(self.files)
+            changed: List[str] = []
+            for name in (list(names) if names is not None else self.files):
+                cached = {name: (self._fingerprints.get(name),
+                                 self._data.get(name))}
+                if self._load_one(name, cached):
+                    changed.append(name)
+            if changed:
+                self.validate()
+                self._write_cache()
+                for name in changed:
+                    for lazy in self._views.get(name, ()):
+                        lazy.reset()
+        if changed:
+            from game_sys.hooks.hooks import hook_dispatcher
+            hook_dispatcher.fire("data.reloaded", names=changed)
+        return changed
+
+    def _load_one(
+        self,
+        name: str,
+        cache: Dict[str, Tuple[Optional[Fingerprint], Any]],
+    ) -> bool:
+        """Load `name`, preferring `cache`. Returns True if data changed."""
+        rel, empty = self.files[name]
+        path = self.root / rel
+        old_fp, old_data = cache.get(name, (None, None))
+        try:
+            st = path.stat()
+        except FileNotFoundError:
+            log.warning("Data file missing: %s", path)
+            self._data[name] = type(empty)()
+            self._fingerprints.pop(name, None)
+            return old_fp is not None
+
+        # Fast path: unchanged mtime and size
+        if old_fp and old_fp[:2] == (st.st_mtime_ns, st.st_size):
+            self._data[name] = old_data
+            self._fingerprints[name] = old_fp
+            self.cache_hits.add(name)
+            return False
+
+        raw = path.read_bytes()
+        sha = hashlib.sha256(raw).hexdigest()
+        fp: Fingerprint = (st.st_mtime_ns, st.st_size, sha)
+        if old_fp and old_fp[2] == sha:
+            # Touched but not edited
+            self._data[name] = old_data
+            self._fingerprints[name] = fp
+            self.cache_hits.add(name)
+            return False
+
+        try:
+            parsed = (json.loads(raw.decode("utf-8")) if raw.strip()
+                      else type(empty)())
+        except (json.JSONDecodeError, UnicodeDecodeError) as e:
+            log.warning("Invalid JSON in %s: %s", path, e)
+            parsed = type(empty)()
+        self._data[name] = parsed
+        self._fingerprints[name] = fp
+        self.cache_hits.discard(name)
+        return True
+
+    # ------------------------------------------------------------------
+    # Compiled cache
+    # ------------------------------------------------------------------
+    def _read_cache(self) -> Dict[str, Tuple[Fingerprint, Any]]:
+        if self.cache_path is None or not self.cache_path.is_file():
+            return {}
+        try:
+            with self.cache_path.open("rb") as f:
+                payload = pickle.load(f)
+        except Exception as e:
+            log.debug("Ignoring unreadable data cache %s: %s",
+                      self.cache_path, e)
+            return {}
+        if (not isinstance(payload, dict)
+                or payload.get("version") != CACHE_VERSION):
+            return {}
+        return payload.get("files", {})
+
+    def _write_cache(self) -> None:
+        if self.cache_path is None:
+            return
+        files = {
+            name: (self._fingerprints[name], self._data[name])
+            for name in self.files if name in self._fingerprints
+        }
+        tmp = self.cache_path.with_suffix(".tmp")
+        try:
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            with tmp.open("wb") as f:
+                pickle.dump({"version": CACHE_VERSION, "files": files}, f,
+                            protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp, self.cache_path)
+        except OSError as e:
+            log.debug("Could not write data cache %s: %s", self.cache_path, e)
+
+    def clear_cache(self) -> None:
+        """Delete the on-disk cache (the in-memory data is kept)."""
+        if self.cache_path is not None and self.cache_path.exists():
+            self.cache_path.unlink()
+
+    # ------------------------------------------------------------------
+    # Validation
+    # ------------------------------------------------------------------
+    def validate(self, strict: Optional[bool] = None) -> List[str]:
+        """
+        Check references between data files (job items/skills, skill
+        prerequisites, drop-table items, character jobs, inventory
+        items). Problems are logged (one warning plus a debug line per
+        problem), or raised as ValueError in strict mode. Returns the
+        list of problems.
+        """
+        strict = self.strict if strict is None else strict
+        d = self._data
+        item_ids = {e.get("id") for e in d.get("items", [])
+                    if isinstance(e, dict)}
+        skill_ids = {e.get("skill_id") for e in d.get("skills", [])
+                     if isinstance(e, dict)}
+        job_ids = {str(e.get("job_id") or e.get("id") or "").lower()
+                   for e in d.get("jobs", []) if isinstance(e, dict)}
+
+        problems: List[str] = []
+
+        def _check(ids: Iterable[Any], known: Set[Any], where: str,
+                   kind: str) -> None:
+            for ref in ids or ():
+                if ref not in known:
+                    problems.append(f"{where}: unknown {kind} '{ref}'")
+
+        for job in d.get("jobs", []):
+            jid = job.get("job_id") or job.get("id")
+            _check(job.get("starting_items"), item_ids,
+                   f"job '{jid}'", "item")
+            _check(job.get("starting_skills"), skill_ids,
+                   f"job '{jid}'", "skill")
+        for skill in d.get("skills", []):
+            _check(skill.get("prereq_skills"), skill_ids,
+                   f"skill '{skill.get('skill_id')}'", "skill")
+        for enemy, tiers in d.get("drop_tables", {}).items():
+            for tier in tiers:
+                _check((drop.get("item_id") for drop in tier.get("drops", [])),
+                       item_ids, f"drop table '{enemy}'", "item")
+        for key, tpl in d.get("characters", {}).items():
+            jid = tpl.get("job_id")
+            if jid:
+                _check([jid.lower()], job_ids, f"character '{key}'", "job")
+        for inv, entries in d.get("inventories", {}).items():
+            _check((e.get("item_id") for e in entries), item_ids,
+                   f"inventory '{inv}'", "item")
+
+        if strict and problems:
+            raise ValueError(
+                "Invalid game data:\n  " + "\n  ".join(problems)
+            )
+        if problems:
+            log.warning("Game data has %d unresolved reference(s); "
+                        "see debug log", len(problems))
+            for msg in problems:
+                log.debug("Game data: %s", msg)
+        return problems
+
+
+game_data = GameData()
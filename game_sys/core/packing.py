@@ -0,0 +1,260 @@
+# game_sys/core/packing.py
+
+"""
+Compact binary encoding for plain data (None, bool, int, float, str,
+bytes, list/tuple, dict).
+
+The wire format is the MessagePack subset covering those types, so the
+output can also be read by any msgpack library. Small ints, short
+strings and small containers are a single tag byte; everything is
+packed with `struct`, big-endian.
+
+Records are framed as a 4-byte big-endian length followed by the packed
+body, so a stream of records can be decoded one at a time with
+`iter_records` without reading the whole file.
+"""
+
+from __future__ import annotations
+import struct
+from typing import Any, BinaryIO, Iterator, List, Tuple
+
+_PACK_U16 = struct.Struct(">H").pack
+_PACK_U32 = struct.Struct(">I").pack
+_PACK_I8 = struct.Struct(">b").pack
+_PACK_I16 = struct.Struct(">h").pack
+_PACK_I32 = struct.Struct(">i").pack
+_PACK_I64 = struct.Struct(">q").pack
+_PACK_U64 = struct.Struct(">Q").pack
+_PACK_F64 = struct.Struct(">d").pack
+
+_UNPACK_U16 = struct.Struct(">H").unpack_from
+_UNPACK_U32 = struct.Struct(">I").unpack_from
+_UNPACK_U64 = struct.Struct(">Q").unpack_from
+_UNPACK_I8 = struct.Struct(">b").unpack_from
+_UNPACK_I16 = struct.Struct(">h").unpack_from
+_UNPACK_I32 = struct.Struct(">i").unpack_from
+_UNPACK_I64 = struct.Struct(">q").unpack_from
+_UNPACK_F32 = struct.Struct(">f").unpack_from
+_UNPACK_F64 = struct.Struct(">d").unpack_from
+
+_FRAME = struct.Struct(">I")
+
+# Single-byte tags; fixint/fixstr/fixmap/fixarray headers come from
+# this table instead of a struct call per value
+_BYTE = [bytes((i,)) for i in range(256)]
+_NIL, _FALSE, _TRUE = _BYTE[0xC0], _BYTE[0xC2], _BYTE[0xC3]
+
+
+class PackError(ValueError):
+    """Raised for unsupported values or malformed packed data."""
+
+
+def _pack_str(buf: List[bytes], raw: bytes, fix: int, tags: Tuple[int, int, int]) -> None:
+    n = len(raw)
+    if fix and n < 32:
+        buf.append(_BYTE[fix | n])
+    elif n < 0x100 and tags[0]:
+        buf.append(_BYTE[tags[0]] + _BYTE[n])
+    elif n < 0x10000:
+        buf.append(_BYTE[tags[1]] + _PACK_U16(n))
+    else:
+        buf.append(_BYTE[tags[2]] + _PACK_U32(n))
+    buf.append(raw)
+
+
+def _pack_int(buf: List[bytes], v: int) -> None:
+    if -32 <= v < 0x80:
+        buf.append(_BYTE[v & 0xFF])
+    elif -0x80 <= v < 0x80:
+        buf.append(b"\xd0" + _PACK_I8(v))
+    elif -0x8000 <= v < 0x8000:
+        buf.append(b"\xd1" + _PACK_I16(v))
+    elif -0x80000000 <= v < 0x80000000:
+        buf.append(b"\xd2" + _PACK_I32(v))
+    elif -0x8000000000000000 <= v < 0x8000000000000000:
+        buf.append(b"\xd3" + _PACK_I64(v))
+    elif 0 <= v < 0x10000000000000000:
+        buf.append(b"\xcf" + _PACK_U64(v))
+    else:
+        raise PackError(f"Integer out of range: {v}")
+
+
+def _pack_into(buf: List[bytes], obj: Any) -> None:
+    # Exact type checks first: they cover nearly every value we pack.
+    t = type(obj)
+    if t is str:
+        _pack_str(buf, obj.encode("utf-8"), 0xA0, (0xD9, 0xDA, 0xDB))
+    elif t is int:
+        _pack_int(buf, obj)
+    elif t is dict:
+        n = len(obj)
+        if n < 16:
+            buf.append(_BYTE[0x80 | n])
+        elif n < 0x10000:
+            buf.append(b"\xde" + _PACK_U16(n))
+        else:
+            buf.append(b"\xdf" + _PACK_U32(n))
+        for k, v in obj.items():
+            _pack_into(buf, k)
+            _pack_into(buf, v)
+    elif t is list or t is tuple:
+        n = len(obj)
+        if n < 16:
+            buf.append(_BYTE[0x90 | n])
+        elif n < 0x10000:
+            buf.append(b"\xdc" + _PACK_U16(n))
+        else:
+            buf.append(b"\xdd" + _PACK_U32(n))
+        for v in obj:
+            _pack_into(buf, v)
+    elif obj is None:
+        buf.append(_NIL)
+    elif obj is True:
+        buf.append(_TRUE)
+    elif obj is False:
+        buf.append(_FALSE)
+    elif t is float:
+        buf.append(b"\xcb" + _PACK_F64(obj))
+    elif t is bytes or t is bytearray:
+        _pack_str(buf, bytes(obj), 0, (0xC4, 0xC5, 0xC6))
+    elif isinstance(obj, int):
+        _pack_int(buf, int(obj))
+    elif isinstance(obj, str):
+        _pack_into(buf, str(obj))
+    else:
+        raise PackError(f"Cannot pack value of type {t.__name__}")
+
+
+def pack(obj: Any) -> bytes:
+    """Encode `obj` to bytes."""
+    buf: List[bytes] = []
+    _pack_into(buf, obj)
+    return b"".join(buf)
+
+
+def _unpack_from(data: bytes, pos: int) -> Tuple[Any, int]:
+    tag = data[pos]
+    pos += 1
+    if tag < 0x80:
+        return tag, pos
+    if tag >= 0xE0:
+        return tag - 0x100, pos
+    if 0xA0 <= tag <= 0xBF:
+        end = pos + (tag & 0x1F)
+        return data[pos:end].decode("utf-8"), end
+    if 0x80 <= tag <= 0x8F:
+        return _unpack_map(data, pos, tag & 0x0F)
+    if 0x90 <= tag <= 0x9F:
+        return _unpack_array(data, pos, tag & 0x0F)
+    if tag == 0xC0:
+        return None, pos
+    if tag == 0xC2:
+        return False, pos
+    if tag == 0xC3:
+        return True, pos
+    if tag == 0xCB:
+        return _UNPACK_F64(data, pos)[0], pos + 8
+    if tag == 0xCA:
+        return _UNPACK_F32(data, pos)[0], pos + 4
+    if tag == 0xCC:
+        return data[pos], pos + 1
+    if tag == 0xCD:
+        return _UNPACK_U16(data, pos)[0], pos + 2
+    if tag == 0xCE:
+        return _UNPACK_U32(data, pos)[0], pos + 4
+    if tag == 0xCF:
+        return _UNPACK_U64(data, pos)[0], pos + 8
+    if tag == 0xD0:
+        return _UNPACK_I8(data, pos)[0], pos + 1
+    if tag == 0xD1:
+        return _UNPACK_I16(data, pos)[0], pos + 2
+    if tag == 0xD2:
+        return _UNPACK_I32(data, pos)[0], pos + 4
+    if tag == 0xD3:
+        return _UNPACK_I64(data, pos)[0], pos + 8
+    if tag in (0xD9, 0xDA, 0xDB, 0xC4, 0xC5, 0xC6):
+        if tag in (0xD9, 0xC4):
+            n, pos = data[pos], pos + 1
+        elif tag in (0xDA, 0xC5):
+            n, pos = _UNPACK_U16(data, pos)[0], pos + 2
+        else:
+            n, pos = _UNPACK_U32(data, pos)[0], pos + 4
+        raw = data[pos:pos + n]
+        if len(raw) != n:
+            raise PackError("Truncated string/bytes value")
+        if tag >= 0xD9:
+            return raw.decode("utf-8"), pos + n
+        return bytes(raw), pos + n
+    if tag == 0xDC:
+        return _unpack_array(data, pos + 2, _UNPACK_U16(data, pos)[0])
+    if tag == 0xDD:
+        return _unpack_array(data, pos + 4, _UNPACK_U32(data, pos)[0])
+    if tag == 0xDE:
+        return _unpack_map(data, pos + 2, _UNPACK_U16(data, pos)[0])
+    if tag == 0xDF:
+        return _unpack_map(data, pos + 4, _UNPACK_U32(data, pos)[0])
+    raise PackError(f"Unsupported tag 0x{tag:02x} at offset {pos - 1}")
+
+
+def _unpack_array(data: bytes, pos: int, n: int) -> Tuple[List[Any], int]:
+    out = []
+    for _ in range(n):
+        value, pos = _unpack_from(data, pos)
+        out.append(value)
+    return out, pos
+
+
+def _unpack_map(data: bytes, pos: int, n: int) -> Tuple[dict, int]:
+    out = {}
+    for _ in range(n):
+        key, pos = _unpack_from(data, pos)
+        value, pos = _unpack_from(data, pos)
+        if isinstance(key, list):
+            key = tuple(key)
+        out[key] = value
+    return out, pos
+
+
+def unpack(data: bytes) -> Any:
+    """Decode one value that spans all of `data`."""
+    try:
+        obj, pos = _unpack_from(data, 0)
+    except (IndexError, struct.error) as exc:
+        raise PackError("Truncated packed data") from exc
+    if pos != len(data):
+        raise PackError(f"{len(data) - pos} trailing bytes after packed value")
+    return obj
+
+
+def write_record(fp: BinaryIO, obj: Any) -> int:
+    """Append one length-prefixed record to `fp`; returns bytes written."""
+    body = pack(obj)
+    fp.write(_FRAME.pack(len(body)))
+    fp.write(body)
+    return _FRAME.size + len(body)
+
+
+def read_record(fp: BinaryIO) -> Any:
+    """
+    Read the next record from `fp`. Raises EOFError at a clean end of
+    stream and PackError if the stream stops mid-record.
+    """
+    head = fp.read(_FRAME.size)
+    if not head:
+        raise EOFError
+    if len(head) != _FRAME.size:
+        raise PackError("Truncated record header")
+    (size,) = _FRAME.unpack(head)
+    body = fp.read(size)
+    if len(body) != size:
+        raise PackError("Truncated record body")
+    return unpack(body)
+
+
+def iter_records(fp: BinaryIO) -> Iterator[Any]:
+    """Yield records from `fp` one at a time until end of stream."""
+    while True:
+        try:
+            yield read_record(fp)
+        except EOFError:
+            return
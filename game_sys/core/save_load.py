@@ -1,37 +1,602 @@
+# game_sys/core/save_load.py
+
+"""
+Versioned save/load for characters.
+
+A character is turned into a plain dict (`character_to_dict`) holding
+everything needed to rebuild it without re-rolling: level/experience,
+stats with named modifiers, current resources, job, inventory
+quantities, equipped items with their rolled bonuses and enchantments,
+statuses, stashed item handles (as ItemStore path and record indexes),
+and (for players) learned skills with remaining cooldowns.
+
+That dict is written either as readable JSON or in the compact binary
+format from `game_sys.core.packing`:
+
+  JSON:    {"format": "game_sys.save", "version": N, "character": {...}}
+  Binary:  b"GSAV" + u16 version, then one length-prefixed record per
+           character, so files with many characters load as a stream
+           (`iter_characters`).
+
+`load_character` detects the format from the file contents.
+
+`character_delta` emits only the fields changed since the character's
+last checkpoint (see `Actor.dirty_fields`); `apply_delta` merges such a
+delta back into a full dict.
+"""
+
+from __future__ import annotations
+import io
 import json
-from game_sys.character.character_creation import Character
+import struct
+from pathlib import Path
+from typing import Any, BinaryIO, Dict, Iterable, Iterator, List, Optional, Union
+
+from logs.logs import get_logger
+from game_sys import init as init_game_sys
+from game_sys.character.character_creation import (
+    Character, Enemy, NPC, Player,
+)
+from game_sys.core.damage_types import DamageType
+from game_sys.core.experience import Levels
+from game_sys.core.packing import PackError, iter_records, write_record
+from game_sys.core.rarity import Rarity
+from game_sys.core.stats import Stats
+from game_sys.effects.status import STACK_REFRESH, StatusEffect
+from game_sys.enchantments.base import BasicEnchantment, Enchantment
+from game_sys.hooks.hooks import hook_dispatcher
+from game_sys.inventory.inventory import Inventory
+from game_sys.items.item_base import ConsumableItem, EquipableItem, Item
+from game_sys.managers.stats_manager import StatsManager
+
+log = get_logger(__name__)
+
+SAVE_FORMAT = "game_sys.save"
+SAVE_VERSION = 1
+BINARY_MAGIC = b"GSAV"
+_BINARY_HEADER = struct.Struct(">4sH")
+
+PathLike = Union[str, Path]
+
+_CHARACTER_CLASSES: Dict[str, type] = {
+    cls.__name__: cls for cls in (Character, Player, NPC, Enemy)
+}
+
+
+# ---------------------------------------------------------------------------
+# Enum-keyed maps
+# ---------------------------------------------------------------------------
+
+def _damage_map_to_dict(values: Dict[Any, Any]) -> Dict[str, Any]:
+    return {
+        (k.name if isinstance(k, DamageType) else str(k)): v
+        for k, v in values.items()
+    }
+
+
+def _damage_map_from_dict(values: Dict[str, Any]) -> Dict[Any, Any]:
+    out: Dict[Any, Any] = {}
+    for k, v in values.items():
+        out[DamageType[k] if k in DamageType.__members__ else k] = v
+    return out
+
+
+# ---------------------------------------------------------------------------
+# Items
+# ---------------------------------------------------------------------------
+
+def enchantment_to_dict(ench: Enchantment) -> Dict[str, Any]:
+    """Serialize a rolled enchantment in `Enchantment.from_dict` form."""
+    return {
+        "id": ench.enchant_id,
+        "name": ench.name,
+        "description": ench.description,
+        "level": ench.level,
+        "grade": ench.grade,
+        "rarity": ench.rarity.name,
+        "applicable_slots": list(ench.applicable_slots),
+        "stat_bonuses": dict(ench.stat_bonuses),
+        "damage_modifiers": _damage_map_to_dict(ench.damage_modifiers),
+    }
+
+
+def item_to_dict(item: Item) -> Dict[str, Any]:
+    """
+    Serialize an item instance, including rolled values. The result is
+    self-contained: loading it does not consult the item templates.
+    """
+    data: Dict[str, Any] = {
+        "id": item.id,
+        "name": item.name,
+        "description": item.description,
+        "price": item.price,
+        "level": item.level,
+        "grade": item.grade,
+        "rarity": item.rarity.name,
+    }
+    if isinstance(item, EquipableItem):
+        data["kind"] = "equipable"
+        data["slot"] = item.slot
+        data["base_bonus_ranges"] = item.base_bonus_ranges
+        data["damage_map"] = item.damage_map
+        data["percent_bonuses"] = item.percent_bonuses
+        data["passive_effects"] = item.passive_effects
+        data["enchantments"] = [enchantment_to_dict(e) for e in item.enchantments]
+        data["resistances"] = _damage_map_to_dict(item.resistances)
+    elif isinstance(item, ConsumableItem):
+        data["kind"] = "consumable"
+        data["effects_data"] = item.effects_data
+        data["amount"] = item.amount
+    else:
+        data["kind"] = "item"
+    return data
+
+
+def item_from_dict(data: Dict[str, Any]) -> Item:
+    """Rebuild an item serialized by `item_to_dict`."""
+    common = dict(
+        id=data["id"],
+        name=data["name"],
+        description=data.get("description", ""),
+        price=data.get("price", 0),
+        level=data.get("level", 1),
+        grade=data.get("grade", 1),
+        rarity=data.get("rarity", "COMMON"),
+    )
+    kind = data.get("kind", "item")
+    if kind == "equipable":
+        return EquipableItem(
+            slot=data["slot"],
+            base_bonus_ranges=data.get("base_bonus_ranges"),
+            damage_map=data.get("damage_map"),
+            percent_bonuses=data.get("percent_bonuses"),
+            passive_effects=data.get("passive_effects"),
+            enchantments=[
+                BasicEnchantment.from_dict(e)
+                for e in data.get("enchantments", ())
+            ],
+            resistances=_damage_map_from_dict(data.get("resistances") or {}),
+            **common,
+        )
+    if kind == "consumable":
+        return ConsumableItem(
+            effects_data=data.get("effects_data") or [],
+            amount=data.get("amount", 1),
+            **common,
+        )
+    if kind == "item":
+        return Item(**common)
+    raise ValueError(f"Unknown item kind {kind!r} for item {data['id']!r}")
+
+
+# ---------------------------------------------------------------------------
+# Characters
+# ---------------------------------------------------------------------------
+
+def _stats_to_dict(stats: Stats) -> Dict[str, Any]:
+    return {
+        "base": dict(stats.base),
+        "modifiers": dict(stats.modifiers),
+        "named": {k: dict(v) for k, v in stats._modifiers.items()},
+    }
+
+
+def _stats_from_dict(data: Dict[str, Any]) -> Stats:
+    stats = Stats(dict(data["base"]), dict(data["modifiers"]))
+    stats._modifiers = {k: dict(v) for k, v in data.get("named", {}).items()}
+    return stats
+
+
+def _learning_to_dict(learning: Any) -> Dict[str, Any]:
+    skills: Dict[str, Any] = {}
+    for sid in sorted(learning.known_skills):
+        skill = learning.instantiated_skills.get(sid)
+        if skill is None:
+            skills[sid] = None
+            continue
+        skills[sid] = {
+            "mana_cost": skill.mana_cost,
+            "stamina_cost": skill.stamina_cost,
+            "cooldown": skill.cooldown,
+            "remaining": skill._current_cooldown,
+        }
+    return {"sp": learning.available_sp, "skills": skills}
+
+
+def _restore_learning(char: Player, data: Dict[str, Any]) -> None:
+    from game_sys.skills.learning import LearningSystem, SkillRegistry
+
+    learning = LearningSystem(char, initial_sp=data.get("sp", 0))
+    for sid, state in data.get("skills", {}).items():
+        learning.known_skills.add(sid)
+        try:
+            record = SkillRegistry.get(sid)
+        except KeyError:
+            log.warning("Saved skill '%s' no longer exists; skipping", sid)
+            continue
+        # Effects come from the current skill data; the rolled numbers
+        # the player saw (costs, cooldown) are restored as saved.
+        skill = record.build_skill_instance(char)
+        if state:
+            skill.mana_cost = state["mana_cost"]
+            skill.stamina_cost = state["stamina_cost"]
+            skill.cooldown = state["cooldown"]
+            skill._current_cooldown = state["remaining"]
+        learning.add_skill(sid, skill)
+    char.learning = learning
+
+
+def _job_to_dict(job: Any) -> Optional[Dict[str, Any]]:
+    if job is None:
+        return None
+    return {"id": job.job_id, "level": job.level,
+            "stats_mods": dict(job.stats_mods)}
+
+
+def _statuses_to_list(character: Character) -> List[Dict[str, Any]]:
+    return [
+        {"name": s.name, "stat_mods": dict(s.stat_mods), "duration": s.duration,
+         "stacking": s.stacking, "max_stacks": s.max_stacks, "stacks": s.stacks}
+        for s in character.statuses.values()
+    ]
+
+
+def _stash_to_dict(inventory: Inventory) -> Dict[str, List[int]]:
+    stash: Dict[str, List[int]] = {}
+    for handle in inventory.stashed():
+        stash.setdefault(str(handle.store.path.resolve()), []).append(handle.index)
+    return stash
+
+
+def _stash_from_dict(inventory: Inventory, stash: Dict[str, List[int]]) -> None:
+    from game_sys.items.item_store import ItemHandle, ItemStore
+
+    for path, indexes in stash.items():
+        store = ItemStore.open(path)
+        for index in indexes:
+            inventory._stash[ItemHandle(store, index)] = None
+
+
+def _resources(character: Character) -> List[int]:
+    return [character._current_health, character._current_mana,
+            character._current_stamina]
+
+
+def character_to_dict(character: Character) -> Dict[str, Any]:
+    """Serialize `character` to a plain, JSON-compatible dict."""
+    levels = character.stats_mgr.levels
+    data: Dict[str, Any] = {
+        "class": character.__class__.__name__,
+        "name": character.name,
+        "level": levels.lvl,
+        "experience": levels.experience,
+        "gold": character.gold,
+        "resources": _resources(character),
+        "stats": _stats_to_dict(character.stats_mgr.stats),
+        "job": _job_to_dict(getattr(character, "job", None)),
+        "job_items": list(getattr(character, "_job_item_ids", [])),
+        "weakness": _damage_map_to_dict(character.weakness),
+        "resistance": _damage_map_to_dict(character.resistance),
+        "inventory": [
+            {"item": item_to_dict(entry["item"]), "quantity": entry["quantity"]}
+            for entry in character.inventory._items.values()
+        ],
+        "equipped": {
+            slot: item_to_dict(item)
+            for slot, item in character.inventory.equipped_items.items()
+        },
+        "statuses": _statuses_to_list(character),
+    }
+    if hasattr(character, "grade"):
+        data["grade"] = character.grade
+    if hasattr(character, "rarity"):
+        data["rarity"] = character.rarity.name
+    if character.inventory._stash:
+        data["stash"] = _stash_to_dict(character.inventory)
+    learning = getattr(character, "learning", None)
+    if learning is not None:
+        data["learning"] = _learning_to_dict(learning)
+    return data
 
-def save_character(character: Character, filename: str):
-    """Save a character to a JSON file."""
+
+def character_delta(character: Character) -> Dict[str, Any]:
+    """
+    The fields of `character` changed since its last checkpoint
+    (`Actor.clear_dirty`), in `character_to_dict` form. Inventory changes
+    are per item id and equipment changes per slot; a None value means
+    the entry was removed. Returns an empty dict if nothing changed.
+    """
+    fields = character.dirty_fields()
+    if not fields:
+        return {}
+    delta: Dict[str, Any] = {}
+    if "resources" in fields:
+        delta["resources"] = _resources(character)
+    if "gold" in fields:
+        delta["gold"] = character.gold
+    if "levels" in fields:
+        levels = character.stats_mgr.levels
+        delta["level"] = levels.lvl
+        delta["experience"] = levels.experience
+    if "stats" in fields:
+        delta["stats"] = _stats_to_dict(character.stats_mgr.stats)
+    if "statuses" in fields:
+        delta["statuses"] = _statuses_to_list(character)
+    if "job" in fields:
+        delta["job"] = _job_to_dict(getattr(character, "job", None))
+        delta["job_items"] = list(getattr(character, "_job_item_ids", []))
+    if "inventory" in fields:
+        inv = character.inventory
+        items: Dict[str, Any] = {}
+        new_ids = inv.new_item_ids()
+        for item_id in inv.dirty_item_ids():
+            entry = inv._items.get(item_id)
+            if entry is None:
+                items[item_id] = None
+                continue
+            change = {"quantity": entry["quantity"]}
+            # Consumables carry a mutable charge count, so always resend
+            if item_id in new_ids or isinstance(entry["item"], ConsumableItem):
+                change["item"] = item_to_dict(entry["item"])
+            items[item_id] = change
+        slots = {}
+        for slot in inv.dirty_slots():
+            item = inv.equipped_items.get(slot)
+            slots[slot] = None if item is None else item_to_dict(item)
+        if items:
+            delta["items"] = items
+        if slots:
+            delta["equipped"] = slots
+        if inv.stash_changed():
+            delta["stash"] = _stash_to_dict(inv)
+    if "learning" in fields:
+        delta["learning"] = _learning_to_dict(character.learning)
+    return delta
+
+
+_REPLACED_BY_DELTA = (
+    "resources", "gold", "level", "experience", "stats", "statuses",
+    "job", "job_items", "stash", "learning",
+)
+
+
+def apply_delta(data: Dict[str, Any], delta: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Merge a `character_delta` into a `character_to_dict` snapshot in
+    place and return it.
+    """
+    for key in _REPLACED_BY_DELTA:
+        if key in delta:
+            data[key] = delta[key]
+    items = delta.get("items")
+    if items:
+        bag = {entry["item"]["id"]: entry for entry in data.get("inventory", ())}
+        for item_id, change in items.items():
+            if change is None:
+                bag.pop(item_id, None)
+            elif "item" in change:
+                bag[item_id] = {"item": change["item"],
+                                "quantity": change["quantity"]}
+            elif item_id in bag:
+                bag[item_id] = dict(bag[item_id], quantity=change["quantity"])
+        data["inventory"] = list(bag.values())
+    slots = delta.get("equipped")
+    if slots:
+        equipped = dict(data.get("equipped", {}))
+        for slot, item in slots.items():
+            if item is None:
+                equipped.pop(slot, None)
+            else:
+                equipped[slot] = item
+        data["equipped"] = equipped
+    return data
+
+
+def character_from_dict(data: Dict[str, Any]) -> Character:
+    """
+    Rebuild a character serialized by `character_to_dict`.
+
+    Bypasses the class constructors, which would assign a default job and
+    roll fresh starting items; the saved state is restored as-is and only
+    the per-actor hook wiring is redone.
+    """
+    from game_sys.jobs.base import Job
+
+    init_game_sys()
+    cls = _CHARACTER_CLASSES.get(data.get("class", "Character"))
+    if cls is None:
+        raise ValueError(f"Unknown character class {data.get('class')!r}")
+
+    char = cls.__new__(cls)
+    char._dirty = set()
+    char.name = data["name"]
+    if "grade" in data:
+        char.grade = data["grade"]
+    if "rarity" in data:
+        char.rarity = Rarity[data["rarity"]]
+
+    job = data.get("job")
+    char.job = None if job is None else Job(
+        job["level"], base_stats=dict(job["stats_mods"]), job_id=job["id"]
+    )
+    char._job_item_ids = list(data.get("job_items", []))
+
+    mgr = StatsManager.__new__(StatsManager)
+    mgr.actor = char
+    mgr.levels = Levels(char, data["level"], data["experience"])
+    mgr.stats = _stats_from_dict(data["stats"])
+    char.stats_mgr = mgr
+
+    inv = Inventory(char)
+    for entry in data.get("inventory", ()):
+        item = item_from_dict(entry["item"])
+        inv._items[item.id] = {"item": item, "quantity": entry["quantity"]}
+    for slot, item_data in data.get("equipped", {}).items():
+        inv.equipped_items[slot] = item_from_dict(item_data)
+    _stash_from_dict(inv, data.get("stash", {}))
+    char.inventory = inv
+
+    char.statuses = {}
+    for s in data.get("statuses", ()):
+        status = StatusEffect(
+            s["name"], dict(s["stat_mods"]), s["duration"],
+            s.get("stacking", STACK_REFRESH), s.get("max_stacks", 1),
+        )
+        status.stacks = s.get("stacks", 1)
+        char.status_mgr.apply(status)
+    char.passive_effects = {}
+    char.defending = False
+    char.weakness = _damage_map_from_dict(data.get("weakness", {}))
+    char.resistance = _damage_map_from_dict(data.get("resistance", {}))
+    char._gold = data.get("gold", 0)
+    (char._current_health, char._current_mana,
+     char._current_stamina) = data["resources"]
+
+    if "learning" in data:
+        _restore_learning(char, data["learning"])
+        char.current_xp = mgr.levels.experience
+
+    char.attach_hooks()
+    # What was just loaded is the checkpoint
+    char.clear_dirty()
+    hook_dispatcher.fire("character.loaded", actor=char)
+    return char
+
+
+# ---------------------------------------------------------------------------
+# Envelopes and files
+# ---------------------------------------------------------------------------
+
+def _check_version(version: Any, source: str) -> None:
+    if not isinstance(version, int) or not 1 <= version <= SAVE_VERSION:
+        raise ValueError(
+            f"{source}: unsupported save version {version!r} "
+            f"(this build reads up to {SAVE_VERSION})"
+        )
+
+
+def dumps_json(character: Character, indent: Optional[int] = 2) -> str:
+    """Serialize one character to a versioned JSON document."""
+    return json.dumps(
+        {"format": SAVE_FORMAT, "version": SAVE_VERSION,
+         "character": character_to_dict(character)},
+        indent=indent,
+    )
+
+
+def loads_json(text: str) -> Character:
+    """Load a character from a document produced by `dumps_json`."""
+    doc = json.loads(text)
+    if not isinstance(doc, dict) or doc.get("format") != SAVE_FORMAT:
+        raise ValueError("Not a game_sys save document")
+    _check_version(doc.get("version"), "JSON save")
+    return character_from_dict(doc["character"])
+
+
+def write_characters(fp: BinaryIO, characters: Iterable[Character]) -> int:
+    """
+    Write a binary save stream (header plus one record per character) to
+    `fp`. Returns the number of bytes written.
+    """
+    written = fp.write(_BINARY_HEADER.pack(BINARY_MAGIC, SAVE_VERSION))
+    for character in characters:
+        written += write_record(fp, character_to_dict(character))
+    return written
+
+
+def read_characters(fp: BinaryIO) -> Iterator[Character]:
+    """Yield characters from a binary save stream, one record at a time."""
+    head = fp.read(_BINARY_HEADER.size)
+    if len(head) != _BINARY_HEADER.size:
+        raise ValueError("Truncated save header")
+    magic, version = _BINARY_HEADER.unpack(head)
+    if magic != BINARY_MAGIC:
+        raise ValueError("Not a game_sys binary save")
+    _check_version(version, "Binary save")
     try:
-        with open(filename, "x") as f:
-            pass  # Ensure the file does not already exist
-    except FileExistsError:
-        raise FileExistsError(f"File '{filename}' already exists. Please choose a different name or delete the existing file.")
-    with open(filename, "w") as f:
-        json.dump(character.to_dict(), f, indent=4)
-def load_character(filename: str) -> Character:
+        for record in iter_records(fp):
+            yield character_from_dict(record)
+    except PackError as exc:
+        raise ValueError(f"Corrupted save data: {exc}") from exc
+
+
+def dumps_binary(character: Character) -> bytes:
+    """Serialize one character to the compact binary format."""
+    buf = io.BytesIO()
+    write_characters(buf, [character])
+    return buf.getvalue()
+
+
+def loads_binary(data: bytes) -> Character:
+    """Load the first character from bytes produced by `dumps_binary`."""
+    for character in read_characters(io.BytesIO(data)):
+        return character
+    raise ValueError("Save data contains no characters")
+
+
+def save_character(
+    character: Character,
+    filename: PathLike,
+    binary: Optional[bool] = None,
+    overwrite: bool = False,
+) -> None:
+    """
+    Save a character to `filename`. The format defaults to JSON for a
+    `.json` suffix and binary otherwise. Refuses to replace an existing
+    file unless `overwrite` is set.
+    """
+    path = Path(filename)
+    if binary is None:
+        binary = path.suffix.lower() != ".json"
+    mode = "w" if overwrite else "x"
     try:
-        with open(filename, "r") as f:
-            data = json.load(f)
-        # Reconstruct the character from the loaded data
-        character = Character(
-            name=data["name"],
-            level=data["level"],
-            experience=data["experience"],
-            job=data["class"]
+        if binary:
+            with open(path, mode + "b") as f:
+                write_characters(f, [character])
+        else:
+            with open(path, mode, encoding="utf-8") as f:
+                f.write(dumps_json(character))
+    except FileExistsError:
+        raise FileExistsError(
+            f"File '{filename}' already exists. Please choose a different "
+            "name or delete the existing file."
         )
-        # Load inventory items
-        for item_data in data["inventory"]:
-            item = item_from_dict(item_data)
-            character.inventory.add_item(item)
-        # Load equipped items
-        for slot, item_data in data["equipped"].items():
-            item = item_from_dict(item_data)
-            character.inventory.equip_item(item, slot)
-        return character
+
+
+def save_characters(
+    characters: Iterable[Character],
+    filename: PathLike,
+    overwrite: bool = False,
+) -> int:
+    """Save many characters to one binary file; returns bytes written."""
+    with open(filename, "wb" if overwrite else "xb") as f:
+        return write_characters(f, characters)
+
+
+def iter_characters(filename: PathLike) -> Iterator[Character]:
+    """Stream characters from a binary save file without reading it whole."""
+    with open(filename, "rb") as f:
+        yield from read_characters(f)
+
+
+def load_character(filename: PathLike) -> Character:
+    """Load a character saved by `save_character`, in either format."""
+    try:
+        with open(filename, "rb") as f:
+            if f.read(len(BINARY_MAGIC)) == BINARY_MAGIC:
+                f.seek(0)
+                for character in read_characters(f):
+                    return character
+                raise ValueError(f"File '{filename}' contains no characters.")
+            f.seek(0)
+            text = f.read().decode("utf-8")
     except FileNotFoundError:
-        raise FileNotFoundError(f"File '{filename}' not found. Please check the file path.")
+        raise FileNotFoundError(
+            f"File '{filename}' not found. Please check the file path."
+        )
+    try:
+        return loads_json(text)
     except json.JSONDecodeError:
-        raise ValueError(f"File '{filename}' is not a valid JSON file or is corrupted.")
-    
\ No newline at end of file
+        raise ValueError(
+            f"File '{filename}' is not a valid save file or is corrupted."
+        )
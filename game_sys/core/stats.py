@@ -18,6 +18,13 @@ class Stats:
     _modifiers: Dict[str, Dict[StatName, int]] = field(default_factory=dict,
                                                        init=False,
                                                        repr=False)
+    # bumped by every mutating method, so owners can detect changes
+    _version: int = field(default=0, init=False, repr=False, compare=False)
+    # effective() result and the _version it was computed at
+    _effective: Dict[StatName, int] = field(default_factory=dict, init=False,
+                                           repr=False, compare=False)
+    _effective_version: int = field(default=-1, init=False, repr=False,
+                                    compare=False)
 
     @staticmethod
     def stat_keys() -> Tuple[StatName, ...]:
@@ -26,7 +33,25 @@ class Stats:
 
     def effective(self) -> Dict[StatName, int]:
         """Calculate the effective stats by combining base, simple modifiers, and named modifiers.
-        Returns a dictionary of effective stats with non-negative values."""
+        Returns a dictionary of effective stats with non-negative values.
+        The result is cached until the next mutating call; edit stats
+        through the methods below (or call invalidate())."""
+        if self._effective_version != self._version:
+            self._effective = self._compute_effective()
+            self._effective_version = self._version
+        return dict(self._effective)
+
+    def get(self, stat: StatName) -> int:
+        """One effective stat, without copying the whole dict."""
+        if self._effective_version != self._version:
+            self.effective()
+        return self._effective.get(stat, 0)
+
+    def invalidate(self) -> None:
+        """Drop the effective() cache after editing base/modifiers directly."""
+        self._version += 1
+
+    def _compute_effective(self) -> Dict[StatName, int]:
         # first sum up all named modifiers
         total_named = {s: 0 for s in Stats.stat_keys()}
         for mods in self._modifiers.values():
@@ -47,17 +72,31 @@ class Stats:
         """Reset all simple modifiers to zero."""
         for s in Stats.stat_keys():
             self.modifiers[s] = 0
+        self._version += 1
 
     # your “named” modifiers, keyed by mod_id (e.g. item.name or item.id)
     def add_modifier(self, mod_id: str, stat: StatName, amount: int) -> None:
         self._modifiers.setdefault(mod_id, {})[stat] = amount
+        self._version += 1
+
+    def set_modifiers(self, mod_id: str, mods: Dict[StatName, int]) -> None:
+        """Replace all stats of one named modifier in a single update."""
+        self._modifiers[mod_id] = dict(mods)
+        self._version += 1
 
     def remove_modifier(self, mod_id: str) -> None:
         """Remove a named modifier by its ID."""
-        self._modifiers.pop(mod_id, None)
+        if self._modifiers.pop(mod_id, None) is not None:
+            self._version += 1
 
     def set_base(self, stat: StatName, value: int) -> None:
         """Override the base value for a given stat."""
         if stat not in Stats.stat_keys():
             raise ValueError(f"Unknown stat '{stat}'")
         self.base[stat] = value
+        self._version += 1
+
+    def set_bases(self, values: Dict[StatName, int]) -> None:
+        """Replace several base values at once, keeping all modifiers."""
+        self.base.update(values)
+        self._version += 1
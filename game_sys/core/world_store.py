@@ -0,0 +1,486 @@
+# game_sys/core/world_store.py
+
+"""
+SQLite-backed persistence for many characters at once.
+
+Rows hold the same dicts `save_load.character_to_dict` produces, packed
+with `game_sys.core.packing`:
+
+  characters(id, class, name, level, experience, gold, state)
+      state: the character dict minus inventory and equipment
+  items(character_id, slot, quantity, data)
+      one row per inventory entry (slot NULL) or equipped item
+
+Writes are batched with `executemany` inside one transaction, and the
+database runs in WAL mode so readers are not blocked by a save.
+
+Dirty tracking is two-level. Characters whose base rows are current
+and that report no `Actor.dirty_fields` are skipped before anything is
+serialized, so a save costs in proportion to what changed. The rest are
+compared by content: the store remembers a digest of the state and item
+rows it last wrote (or loaded) for each character, and skips characters
+whose rows would not change. Characters whose state changed but whose
+items did not only rewrite their `characters` row.
+
+For frequent autosave, `checkpoint` skips serializing whole characters:
+it appends the per-field `character_delta` of each changed character
+to a `deltas` table. Loads apply pending deltas on top of the base
+rows; `compact` (or the next full save of a character) folds them in.
+"""
+
+from __future__ import annotations
+import hashlib
+import sqlite3
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Set, Tuple, Union
+from weakref import WeakKeyDictionary
+
+from logs.logs import get_logger
+from game_sys.character.character_creation import Character
+from game_sys.core.packing import pack, unpack
+from game_sys.core.save_load import (
+    SAVE_VERSION, apply_delta, character_delta, character_from_dict,
+    character_to_dict,
+)
+
+log = get_logger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (
+    key   TEXT PRIMARY KEY,
+    value INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS characters (
+    id         INTEGER PRIMARY KEY,
+    class      TEXT NOT NULL,
+    name       TEXT NOT NULL,
+    level      INTEGER NOT NULL,
+    experience INTEGER NOT NULL,
+    gold       INTEGER NOT NULL,
+    state      BLOB NOT NULL
+);
+CREATE INDEX IF NOT EXISTS characters_level ON characters(level);
+CREATE TABLE IF NOT EXISTS items (
+    character_id INTEGER NOT NULL REFERENCES characters(id) ON DELETE CASCADE,
+    slot         TEXT,
+    quantity     INTEGER NOT NULL,
+    data         BLOB NOT NULL
+);
+CREATE INDEX IF NOT EXISTS items_character ON items(character_id);
+CREATE TABLE IF NOT EXISTS deltas (
+    seq          INTEGER PRIMARY KEY AUTOINCREMENT,
+    character_id INTEGER NOT NULL REFERENCES characters(id) ON DELETE CASCADE,
+    data         BLOB NOT NULL
+);
+CREATE INDEX IF NOT EXISTS deltas_character ON deltas(character_id);
+"""
+
+# Digest of (state row, item rows) last written or read per character id
+_Digests = Tuple[bytes, bytes]
+# (slot or None for the bag, quantity, packed item dict)
+_ItemRow = Tuple[Optional[str], int, bytes]
+
+
+def _digest(blob: bytes) -> bytes:
+    return hashlib.blake2b(blob, digest_size=16).digest()
+
+
+class WorldStore:
+    """
+    Bulk save/load of characters, their inventories and item instances.
+
+    Character ids are assigned on first save and tracked per instance,
+    so re-saving the same object updates its rows. Use `id_of` to get
+    the id of a saved or loaded character.
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path] = ":memory:",
+        batch_size: int = 500,
+    ) -> None:
+        if batch_size < 1:
+            raise ValueError("batch_size must be >= 1")
+        self.path = str(path)
+        self.batch_size = batch_size
+        self._conn = sqlite3.connect(self.path, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("PRAGMA foreign_keys=ON")
+        self._conn.executescript(_SCHEMA)
+        self._check_version()
+        self._ids: "WeakKeyDictionary[Character, int]" = WeakKeyDictionary()
+        self._digests: Dict[int, _Digests] = {}
+        # Ids known to have rows in `deltas`
+        self._has_deltas: Set[int] = set()
+
+    def _check_version(self) -> None:
+        row = self._conn.execute(
+            "SELECT value FROM meta WHERE key = 'version'"
+        ).fetchone()
+        if row is None:
+            self._conn.execute(
+                "INSERT INTO meta (key, value) VALUES ('version', ?)",
+                (SAVE_VERSION,),
+            )
+        elif not 1 <= row[0] <= SAVE_VERSION:
+            raise ValueError(
+                f"{self.path}: unsupported store version {row[0]} "
+                f"(this build reads up to {SAVE_VERSION})"
+            )
+
+    # ------------------------------------------------------------------
+    # Lifecycle
+    # ------------------------------------------------------------------
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def __enter__(self) -> "WorldStore":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return self._conn.execute("SELECT COUNT(*) FROM characters").fetchone()[0]
+
+    # ------------------------------------------------------------------
+    # Identity and dirty tracking
+    # ------------------------------------------------------------------
+
+    def id_of(self, character: Character) -> Optional[int]:
+        """Row id of `character`, or None if this store has not seen it."""
+        return self._ids.get(character)
+
+    @staticmethod
+    def _split(data: Dict[str, Any]) -> Tuple[Dict[str, Any], bytes, List[_ItemRow]]:
+        data = dict(data)
+        inventory = data.pop("inventory")
+        equipped = data.pop("equipped")
+        items = [(None, e["quantity"], pack(e["item"])) for e in inventory]
+        items += [(slot, 1, pack(item)) for slot, item in equipped.items()]
+        return data, pack(data), items
+
+    @classmethod
+    def _rows(cls, character: Character) -> Tuple[Dict[str, Any], bytes, List[_ItemRow]]:
+        return cls._split(character_to_dict(character))
+
+    @staticmethod
+    def _items_digest(items: Sequence[_ItemRow]) -> bytes:
+        return _digest(pack([list(row) for row in items]))
+
+    def _is_clean(self, character: Character) -> bool:
+        # Base rows are current and no tracked field changed since
+        char_id = self._ids.get(character)
+        return (char_id is not None and char_id in self._digests
+                and not character.dirty_fields())
+
+    def is_dirty(self, character: Character) -> bool:
+        """True if saving `character` would write anything."""
+        char_id = self._ids.get(character)
+        if char_id is None or char_id not in self._digests:
+            return True
+        if self._is_clean(character):
+            return False
+        _, state, items = self._rows(character)
+        return self._digests[char_id] != (_digest(state), self._items_digest(items))
+
+    # ------------------------------------------------------------------
+    # Writing
+    # ------------------------------------------------------------------
+
+    def _batched(self, sql: str, rows: Sequence[Tuple]) -> None:
+        for start in range(0, len(rows), self.batch_size):
+            self._conn.executemany(sql, rows[start:start + self.batch_size])
+
+    def _write_rows(
+        self,
+        updates: Sequence[Tuple],
+        item_owners: Sequence[int],
+        item_rows: Sequence[Tuple],
+    ) -> None:
+        """Update character rows and replace item rows (inside a transaction)."""
+        self._batched(
+            "UPDATE characters SET class = ?, name = ?, level = ?,"
+            " experience = ?, gold = ?, state = ? WHERE id = ?", updates,
+        )
+        owners = [(i,) for i in item_owners]
+        self._batched("DELETE FROM items WHERE character_id = ?", owners)
+        self._batched(
+            "INSERT INTO items (character_id, slot, quantity, data)"
+            " VALUES (?, ?, ?, ?)", item_rows,
+        )
+        folded = [(i,) for i in item_owners if i in self._has_deltas]
+        self._batched("DELETE FROM deltas WHERE character_id = ?", folded)
+
+    @staticmethod
+    def _row(data: Dict[str, Any], state: bytes) -> Tuple:
+        return (data["class"], data["name"], data["level"],
+                data["experience"], data["gold"], state)
+
+    def save(self, character: Character, force: bool = False) -> int:
+        """Save one character; returns its id."""
+        self.save_many([character], force=force)
+        return self._ids[character]
+
+    def save_many(self, characters: Iterable[Character], force: bool = False) -> int:
+        """
+        Save every changed character (all of them with `force`) in one
+        transaction, folding away any checkpoint deltas they had. Returns
+        the number of characters written.
+
+        Characters with no dirty fields are skipped unserialized; use
+        `force` after changes `Actor.dirty_fields` does not track (such
+        as renaming).
+        """
+        new_chars: List[Tuple[Character, Tuple]] = []
+        updates: List[Tuple] = []
+        item_owners: List[int] = []
+        item_rows: List[Tuple] = []
+        pending: List[Tuple[Character, Optional[int], _Digests, List[_ItemRow]]] = []
+        unchanged: List[Character] = []
+
+        for character in {id(c): c for c in characters}.values():
+            if not force and self._is_clean(character):
+                continue
+            data, state, items = self._rows(character)
+            digests = (_digest(state), self._items_digest(items))
+            char_id = self._ids.get(character)
+            old = self._digests.get(char_id) if char_id is not None else None
+            if not force and old == digests:
+                unchanged.append(character)
+                continue
+            row = self._row(data, state)
+            pending.append((character, char_id, digests, items))
+            if char_id is None:
+                new_chars.append((character, row))
+                continue
+            if force or old is None or old[0] != digests[0]:
+                updates.append(row + (char_id,))
+            if force or old is None or old[1] != digests[1]:
+                item_owners.append(char_id)
+                item_rows.extend((char_id,) + r for r in items)
+
+        for character in unchanged:
+            character.clear_dirty()
+        if not pending:
+            return 0
+
+        conn = self._conn
+        conn.execute("BEGIN")
+        try:
+            for character, row in new_chars:
+                cur = conn.execute(
+                    "INSERT INTO characters (class, name, level, experience,"
+                    " gold, state) VALUES (?, ?, ?, ?, ?, ?)", row,
+                )
+                self._ids[character] = cur.lastrowid
+            for character, char_id, _, items in pending:
+                if char_id is None:
+                    new_id = self._ids[character]
+                    item_rows.extend((new_id,) + r for r in items)
+            self._write_rows(updates, item_owners, item_rows)
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            for character, char_id, _, _ in pending:
+                if char_id is None:
+                    self._ids.pop(character, None)
+            raise
+
+        for character, _, digests, _ in pending:
+            char_id = self._ids[character]
+            self._digests[char_id] = digests
+            self._has_deltas.discard(char_id)
+            character.clear_dirty()
+        log.debug("Saved %d characters (%d new) to %s",
+                  len(pending), len(new_chars), self.path)
+        return len(pending)
+
+    def checkpoint(self, characters: Iterable[Character]) -> int:
+        """
+        Append a delta row for every character with dirty fields
+        (see `Actor.dirty_fields`), so the cost follows the volume of
+        change rather than the number of characters. Characters this
+        store has not saved yet get a full save. Returns the number of
+        characters written.
+        """
+        new_chars: List[Character] = []
+        rows: List[Tuple[int, bytes]] = []
+        written: List[Tuple[Character, int]] = []
+        for character in {id(c): c for c in characters}.values():
+            char_id = self._ids.get(character)
+            if char_id is None:
+                new_chars.append(character)
+                continue
+            delta = character_delta(character)
+            if delta:
+                rows.append((char_id, pack(delta)))
+                written.append((character, char_id))
+
+        if rows:
+            conn = self._conn
+            conn.execute("BEGIN")
+            try:
+                self._batched(
+                    "INSERT INTO deltas (character_id, data) VALUES (?, ?)", rows
+                )
+                conn.execute("COMMIT")
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+            for character, char_id in written:
+                character.clear_dirty()
+                # Base rows are now behind; the next full save rewrites them
+                self._digests.pop(char_id, None)
+                self._has_deltas.add(char_id)
+        return len(rows) + (self.save_many(new_chars) if new_chars else 0)
+
+    def pending_deltas(self) -> int:
+        """Number of checkpoint deltas not yet folded into base rows."""
+        return self._conn.execute("SELECT COUNT(*) FROM deltas").fetchone()[0]
+
+    def compact(self) -> int:
+        """
+        Fold all checkpoint deltas into their characters' base rows
+        without hydrating the characters. Returns characters compacted.
+        """
+        ids = [row[0] for row in self._conn.execute(
+            "SELECT DISTINCT character_id FROM deltas"
+        )]
+        if not ids:
+            return 0
+        self._has_deltas.update(ids)
+        updates: List[Tuple] = []
+        item_rows: List[Tuple] = []
+        for char_id, data, _, _, _ in self._fetch(ids):
+            data, state, items = self._split(data)
+            updates.append(self._row(data, state) + (char_id,))
+            item_rows.extend((char_id,) + r for r in items)
+        conn = self._conn
+        conn.execute("BEGIN")
+        try:
+            self._write_rows(updates, ids, item_rows)
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        self._has_deltas.difference_update(ids)
+        return len(ids)
+
+    def delete(self, char_id: int) -> None:
+        """Delete a character with its items and deltas."""
+        self._conn.execute("DELETE FROM characters WHERE id = ?", (char_id,))
+        self._digests.pop(char_id, None)
+        self._has_deltas.discard(char_id)
+        for character, known in list(self._ids.items()):
+            if known == char_id:
+                del self._ids[character]
+
+    # ------------------------------------------------------------------
+    # Reading
+    # ------------------------------------------------------------------
+
+    def ids(self, min_level: Optional[int] = None, max_level: Optional[int] = None) -> List[int]:
+        """Ids of stored characters, optionally filtered by level."""
+        sql = "SELECT id FROM characters"
+        clauses, params = [], []
+        if min_level is not None:
+            clauses.append("level >= ?")
+            params.append(min_level)
+        if max_level is not None:
+            clauses.append("level <= ?")
+            params.append(max_level)
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+        return [row[0] for row in self._conn.execute(sql + " ORDER BY id", params)]
+
+    def load(self, char_id: int) -> Character:
+        """Load one character; raises KeyError if it does not exist."""
+        loaded = self.load_many([char_id])
+        if char_id not in loaded:
+            raise KeyError(f"No character with id {char_id}")
+        return loaded[char_id]
+
+    def load_many(self, ids: Optional[Iterable[int]] = None) -> Dict[int, Character]:
+        """
+        Hydrate many characters with one query each over `characters`,
+        `items` and `deltas` (per `batch_size` ids), applying checkpoint
+        deltas in order. Loads everything when `ids` is None. Unknown ids
+        are skipped.
+        """
+        out: Dict[int, Character] = {}
+        for char_id, data, state, items, had_deltas in self._fetch(ids):
+            character = character_from_dict(data)
+            self._ids[character] = char_id
+            if had_deltas:
+                self._has_deltas.add(char_id)
+                self._digests.pop(char_id, None)
+            else:
+                self._digests[char_id] = (_digest(state), self._items_digest(items))
+            out[char_id] = character
+        return out
+
+    def _fetch(
+        self, ids: Optional[Iterable[int]] = None
+    ) -> Iterator[Tuple[int, Dict[str, Any], bytes, List[_ItemRow], bool]]:
+        """Yield (id, merged dict, state blob, item rows, had deltas)."""
+        conn = self._conn
+        if ids is None:
+            yield from self._merge(
+                conn.execute("SELECT id, state FROM characters ORDER BY id"),
+                conn.execute("SELECT character_id, slot, quantity, data"
+                             " FROM items ORDER BY rowid"),
+                conn.execute("SELECT character_id, data FROM deltas ORDER BY seq"),
+            )
+            return
+        wanted = list(dict.fromkeys(ids))
+        for start in range(0, len(wanted), self.batch_size):
+            chunk = wanted[start:start + self.batch_size]
+            marks = ",".join("?" * len(chunk))
+            rows = self._merge(
+                conn.execute(f"SELECT id, state FROM characters"
+                             f" WHERE id IN ({marks})", chunk),
+                conn.execute("SELECT character_id, slot, quantity, data"
+                             f" FROM items WHERE character_id IN ({marks})"
+                             " ORDER BY rowid", chunk),
+                conn.execute("SELECT character_id, data FROM deltas"
+                             f" WHERE character_id IN ({marks}) ORDER BY seq",
+                             chunk),
+            )
+            by_id = {row[0]: row for row in rows}
+            for char_id in chunk:
+                if char_id in by_id:
+                    yield by_id[char_id]
+
+    @staticmethod
+    def _merge(
+        char_rows: Iterable[Tuple],
+        item_rows: Iterable[Tuple],
+        delta_rows: Iterable[Tuple],
+    ) -> List[Tuple[int, Dict[str, Any], bytes, List[_ItemRow], bool]]:
+        states = {char_id: state for char_id, state in char_rows}
+        grouped: Dict[int, List[_ItemRow]] = {char_id: [] for char_id in states}
+        for char_id, slot, quantity, blob in item_rows:
+            if char_id in grouped:
+                grouped[char_id].append((slot, quantity, blob))
+        deltas: Dict[int, List[bytes]] = {}
+        for char_id, blob in delta_rows:
+            deltas.setdefault(char_id, []).append(blob)
+
+        out = []
+        for char_id, state in states.items():
+            items = grouped[char_id]
+            data = unpack(state)
+            data["inventory"] = [
+                {"item": unpack(blob), "quantity": quantity}
+                for slot, quantity, blob in items if slot is None
+            ]
+            data["equipped"] = {
+                slot: unpack(blob) for slot, _, blob in items if slot is not None
+            }
+            for blob in deltas.get(char_id, ()):
+                apply_delta(data, unpack(blob))
+            out.append((char_id, data, state, items, char_id in deltas))
+        return out
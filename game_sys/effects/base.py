@@ -2,13 +2,23 @@
 
 """
 Effect base module.
-Defines the abstract Effect class and a factory for instantiating
-concrete Effect subclasses from data dictionaries.
+Defines the abstract Effect class, the registry mapping data-file type
+names to Effect subclasses (@register_effect), and EffectSpec, a cached
+read-only compiled form of an effect dict.
 """
 
 from __future__ import annotations
+import random
 from abc import ABC, abstractmethod
-from typing import Any, Dict, TYPE_CHECKING
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from importlib import import_module
+from types import MappingProxyType
+from typing import (
+    Any, Callable, Dict, Hashable, Iterable, Iterator, List, Mapping,
+    Optional, Tuple, Type, TypeVar, TYPE_CHECKING,
+)
 
 if TYPE_CHECKING:
     from game_sys.character.actor import Actor
@@ -19,8 +29,13 @@ class Effect(ABC):
     """
     Base class for all effect types (status, damage, healing, etc.).
     Subclasses must implement `apply` and a matching `from_dict`.
+
+    `reusable` effects keep no per-application state, so one instance
+    can be applied any number of times (e.g. by every potion in a stack).
     """
 
+    reusable: bool = False
+
     @abstractmethod
     def apply(
         self,
@@ -48,38 +63,216 @@ class Effect(ABC):
         et = data.get("type")
         if not et:
             raise ValueError("Effect data missing 'type' field")
+        return resolve_effect_type(et).from_dict(data)
+
+
+# ---------------------------------------------------------------------------
+# Random rolls at apply time
+# ---------------------------------------------------------------------------
+
+_active_engine: ContextVar[Optional[CombatEngine]] = ContextVar(
+    "active_combat_engine", default=None
+)
+
+
+@contextmanager
+def active_combat_engine(engine: CombatEngine) -> Iterator[CombatEngine]:
+    """Mark `engine` as the running combat for effects applied meanwhile."""
+    token = _active_engine.set(engine)
+    try:
+        yield engine
+    finally:
+        _active_engine.reset(token)
+
+
+def effect_rng(combat_engine: Optional[CombatEngine] = None) -> Any:
+    """
+    RNG for an effect's random rolls: the given engine's, else that of the
+    combat currently running, else the global `random` module.
+    """
+    engine = combat_engine if combat_engine is not None else _active_engine.get()
+    rng = getattr(engine, "rng", None)
+    return rng if rng is not None else random
+
+
+def parse_amount(spec: Any) -> Tuple[int, int]:
+    """(low, high) from a fixed amount or a {"min", "max"} range."""
+    if isinstance(spec, Mapping):
+        lo = int(spec.get("min", 0))
+        return lo, int(spec.get("max", lo))
+    return int(spec), int(spec)
+
+
+def roll_amount(lo: int, hi: int, rng: Any) -> int:
+    return rng.randint(lo, hi) if hi > lo else lo
+
+
+# ---------------------------------------------------------------------------
+# Effect type registry
+# ---------------------------------------------------------------------------
+
+_EFFECT_TYPES: Dict[str, Type[Effect]] = {}
+
+# Modules whose classes register themselves via @register_effect. They are
+# imported on the first lookup miss so importing this module stays cheap.
+_BUILTIN_EFFECT_MODULES = (
+    "game_sys.effects.damage",
+    "game_sys.effects.damage_reduction",
+    "game_sys.effects.heal",
+    "game_sys.effects.instant",
+    "game_sys.effects.modify_weapon",
+    "game_sys.effects.statbuff",
+    "game_sys.effects.status",
+    "game_sys.effects.unlock",
+    "game_sys.effects.passives.lifesteal",
+)
+_builtins_loaded = False
+
+EFFECT_PLUGIN_GROUP = "game_sys.effects"
+
+E = TypeVar("E", bound=Type[Effect])
+
+
+def register_effect(*names: str, replace: bool = False) -> Callable[[E], E]:
+    """
+    Class decorator registering an Effect subclass under one or more
+    (case-insensitive) type names used in data files:
+
+        @register_effect("Poison", "PoisonCloud")
+        class PoisonEffect(Effect): ...
+
+    Registering a name already bound to a different class raises
+    ValueError unless `replace=True`.
+    """
+    if not names:
+        raise ValueError("register_effect needs at least one type name")
+
+    def _decorator(effect_cls: E) -> E:
+        for name in names:
+            key = name.lower()
+            existing = _EFFECT_TYPES.get(key)
+            if existing is not None and existing is not effect_cls \
+                    and not replace:
+                raise ValueError(
+                    f"Effect type '{name}' already registered to "
+                    f"{existing.__name__}"
+                )
+            _EFFECT_TYPES[key] = effect_cls
+        return effect_cls
+
+    return _decorator
+
+
+def unregister_effect(name: str) -> None:
+    _EFFECT_TYPES.pop(name.lower(), None)
+    _spec_cache.clear()
+
+
+def _load_builtin_effects() -> None:
+    global _builtins_loaded
+    if _builtins_loaded:
+        return
+    _builtins_loaded = True
+    for module in _BUILTIN_EFFECT_MODULES:
+        import_module(module)
+
+
+def load_effect_plugins(group: str = EFFECT_PLUGIN_GROUP) -> List[str]:
+    """
+    Import effect plugins advertised under the `group` entry-point group
+    (each entry point names a module that uses @register_effect).
+    Returns the names of the entry points loaded.
+    """
+    from importlib.metadata import entry_points
+
+    loaded: List[str] = []
+    for ep in entry_points(group=group):
+        ep.load()
+        loaded.append(ep.name)
+    return loaded
+
+
+def resolve_effect_type(type_name: str) -> Type[Effect]:
+    """Effect class registered for `type_name` (case-insensitive)."""
+    key = type_name.lower()
+    effect_cls = _EFFECT_TYPES.get(key)
+    if effect_cls is None and not _builtins_loaded:
+        _load_builtin_effects()
+        effect_cls = _EFFECT_TYPES.get(key)
+    if effect_cls is None:
+        raise ValueError(f"Unknown Effect type: {type_name}")
+    return effect_cls
+
+
+def effect_types() -> Dict[str, Type[Effect]]:
+    """Snapshot of the registry (type name -> class)."""
+    _load_builtin_effects()
+    return dict(_EFFECT_TYPES)
+
+
+# ---------------------------------------------------------------------------
+# Compiled, immutable effect specs
+# ---------------------------------------------------------------------------
+
+def _freeze(value: Any) -> Any:
+    """Recursively turn dicts into read-only mappings and lists into tuples."""
+    if isinstance(value, Mapping):
+        return MappingProxyType({k: _freeze(v) for k, v in value.items()})
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
+def _cache_key(value: Any) -> Hashable:
+    if isinstance(value, Mapping):
+        return tuple(sorted((k, _cache_key(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(_cache_key(v) for v in value)
+    return value
+
+
+@dataclass(frozen=True)
+class EffectSpec:
+    """
+    A validated, read-only effect definition with its class resolved.
+    `build()` creates a fresh Effect without re-resolving the type.
+    """
+    type_name: str
+    effect_cls: Type[Effect]
+    data: Mapping[str, Any]
+
+    def build(self) -> Effect:
+        return self.effect_cls.from_dict(self.data)
+
+
+_spec_cache: Dict[Hashable, EffectSpec] = {}
+
+
+def compile_effect(data: Mapping[str, Any]) -> EffectSpec:
+    """
+    Compile an effect dict into a shared EffectSpec. Equal dicts (e.g.
+    the same potion template on many items) map to the same spec.
+    """
+    if isinstance(data, EffectSpec):
+        return data
+    try:
+        key = _cache_key(data)
+        spec = _spec_cache.get(key)
+    except TypeError:  # unhashable leaf value; compile without caching
+        key, spec = None, None
+    if spec is None:
+        et = data.get("type")
+        if not et:
+            raise ValueError("Effect data missing 'type' field")
+        spec = EffectSpec(et, resolve_effect_type(et), _freeze(data))
+        if key is not None:
+            _spec_cache[key] = spec
+    return spec
+
+
+def compile_effects(effects: Iterable[Mapping[str, Any]]) -> Tuple[EffectSpec, ...]:
+    return tuple(compile_effect(data) for data in effects)
+
 
-        mrt = et.lower()
-        # Map various type strings to the correct effect class
-        if mrt in ("status", "applystatus"):
-            from game_sys.effects.status import StatusEffect
-            return StatusEffect.from_dict(data)
-        if mrt == "damage":
-            from game_sys.effects.damage import DamageEffect
-            return DamageEffect.from_dict(data)
-        if mrt.lower() == "damagereduction":
-            from game_sys.effects.damage_reduction import DamageReductionEffect
-            return DamageReductionEffect.from_dict(data)
-        if mrt in ("temporarystatbuff",):
-            from game_sys.effects.statbuff import TemporaryStatBuff
-            return TemporaryStatBuff.from_dict(data)
-        if mrt in ("modifyweapondamage",):
-            from game_sys.effects.modify_weapon import ModifyWeaponDamageEffect
-            return ModifyWeaponDamageEffect.from_dict(data)
-        if mrt in ("heal",):
-            from game_sys.effects.heal import HealEffect
-            return HealEffect.from_dict(data)
-        if mrt in ("instantheal",):
-            from game_sys.effects.instant import InstantHeal
-            return InstantHeal.from_dict(data)
-        if mrt in ("instantmana",):
-            from game_sys.effects.instant import InstantMana
-            return InstantMana.from_dict(data)
-        if mrt in ("unlock",):
-            from game_sys.effects.unlock import UnlockEffect
-            return UnlockEffect.from_dict(data)
-        if mrt in ("lifestealpassive",):
-            from game_sys.effects.passives.lifesteal import LifeStealPassive
-            return LifeStealPassive.from_dict(data)
-
-        raise ValueError(f"Unknown Effect type: {et}")
+def clear_effect_cache() -> None:
+    _spec_cache.clear()
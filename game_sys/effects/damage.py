@@ -5,20 +5,29 @@ Deals damage of one or more types, with scaling, crits, variance,
 and delegates all resistance/weakness/defend logic to Actor.take_damage.
 """
 
-import random
-from typing import Any, Dict, Optional, Union
+from typing import Any, Dict, Optional, Tuple, Union
 from game_sys.core.damage_types import DamageType
-from game_sys.effects.base import Effect
+from game_sys.effects.base import (
+    Effect, effect_rng, parse_amount, register_effect, roll_amount,
+)
 from logs.logs import get_logger
 from game_sys.hooks.hooks import hook_dispatcher
 
 log = get_logger(__name__)
 
 
+@register_effect("Damage")
 class DamageEffect(Effect):
+    """
+    Deals typed damage. Values in `damage_map` are fixed amounts or
+    (min, max) ranges rolled on each apply.
+    """
+
+    reusable = True
+
     def __init__(
         self,
-        damage_map: Dict[DamageType, int],
+        damage_map: Dict[DamageType, Union[int, Tuple[int, int]]],
         stat_name: Optional[str] = None,
         multiplier: float = 1.0,
         crit_chance: float = 0.1,
@@ -32,21 +41,16 @@ class DamageEffect(Effect):
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> Effect:
-        dm: Dict[DamageType, int] = {}
+        dm: Dict[DamageType, Union[int, Tuple[int, int]]] = {}
         raw = data.get("damage", {})
         for k, v in raw.items():
             try:
                 dt = DamageType[k.upper()]
             except KeyError:
                 continue
-            # support fixed or ranged damage
-            if isinstance(v, dict):
-                lo = int(v.get("min", 0))
-                hi = int(v.get("max", lo))
-                amt = random.randint(lo, hi)
-            else:
-                amt = int(v)
-            dm[dt] = amt
+            # support fixed or ranged damage (rolled at apply time)
+            lo, hi = parse_amount(v)
+            dm[dt] = (lo, hi) if hi > lo else lo
         return cls(
             damage_map=dm,
             stat_name=data.get("stat_name"),
@@ -55,17 +59,33 @@ class DamageEffect(Effect):
             variance=float(data.get("variance", 0.0)),
         )
 
+    def expected_damage(self, caster: Any, target: Any) -> float:
+        """Mean damage `apply` would deal to `target`, without rolling."""
+        level_scale = 1 + getattr(caster, "level", 1) * 0.02
+        bonus = 0
+        if self.stat_name:
+            bonus = int(round(getattr(caster, self.stat_name, 0) * self.multiplier))
+        total = 0.0
+        for dt, base in self._base_damage_map.items():
+            if isinstance(base, tuple):
+                base = (base[0] + base[1]) / 2
+            amt = (base * level_scale + bonus) * (1 + self.crit_chance)
+            total += amt * target._resistance_multiplier(dt)
+        return total
+
     def apply(
         self,
         caster: Any,
         target: Any,
         combat_engine: Optional[Any] = None
     ) -> str:
-        rng = getattr(combat_engine, "rng", random.Random())
+        rng = effect_rng(combat_engine)
         summary: list[str] = []
         crit = False
 
         for dt, base in self._base_damage_map.items():
+            if isinstance(base, tuple):
+                base = roll_amount(base[0], base[1], rng)
             # scale by level
             amt = int(round(base * (1 + getattr(caster, "level", 1) * 0.02)))
 
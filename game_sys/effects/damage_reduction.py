@@ -7,6 +7,7 @@ Wraps into a StatusEffect so Actor.take_damage sees it.
 
 from __future__ import annotations
 from typing import TYPE_CHECKING, Any
+from game_sys.effects.base import register_effect
 from game_sys.effects.status import StatusEffect, Effect
 from game_sys.hooks.hooks import hook_dispatcher
 
@@ -14,11 +15,14 @@ if TYPE_CHECKING:
     from game_sys.character.actor import Actor
 
 
+@register_effect("DamageReduction")
 class DamageReductionEffect(Effect):
     """
     Reduces incoming damage by a fixed percentage.
     """
 
+    reusable = True
+
     def __init__(self, percent: int, duration: int, target_side: str = "Enemy") -> None:
         self.percent = percent
         self.duration = duration
@@ -2,52 +2,58 @@
 
 """
 InstantHeal and InstantMana effects for immediate resource restoration.
+Ranged amounts are rolled on each apply (see effect_rng).
 """
 
-import random
-from typing import Any, Dict
-from game_sys.effects.base import Effect
+from typing import Any, Dict, Optional
+from game_sys.effects.base import (
+    Effect, effect_rng, parse_amount, register_effect, roll_amount,
+)
 from game_sys.hooks.hooks import hook_dispatcher
 
 
+@register_effect("InstantHeal")
 class InstantHeal(Effect):
-    def __init__(self, amount: int) -> None:
+    reusable = True
+
+    def __init__(self, amount: int, max_amount: Optional[int] = None) -> None:
         self.amount = amount
+        self.max_amount = amount if max_amount is None else max_amount
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "Effect":
-        amt = data.get("amount", 0)
-        if isinstance(amt, dict):
-            lo, hi = int(amt.get("min", 0)), int(amt.get("max", lo))
-            amount = random.randint(lo, hi)
-        else:
-            amount = int(amt)
-        return cls(amount)
+        return cls(*parse_amount(data.get("amount", 0)))
+
+    def expected_heal(self) -> float:
+        """Mean HP restored per apply (before the max-health cap)."""
+        return (self.amount + self.max_amount) / 2
 
     def apply(self, caster: Any, target: Any, combat_engine: Any = None) -> str:
+        amount = roll_amount(self.amount, self.max_amount,
+                             effect_rng(combat_engine))
         before = target.current_health
-        target.current_health = before + self.amount
+        target.current_health = before + amount
         healed = target.current_health - before
         hook_dispatcher.fire("effect.apply", target=target, effect=self)
         return f"{target.name} healed for {healed} HP."
 
+@register_effect("InstantMana")
 class InstantMana(Effect):
-    def __init__(self, amount: int) -> None:
+    reusable = True
+
+    def __init__(self, amount: int, max_amount: Optional[int] = None) -> None:
         self.amount = amount
+        self.max_amount = amount if max_amount is None else max_amount
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "InstantMana":
-        amt = data.get("amount", 0)
-        if isinstance(amt, dict):
-            lo, hi = int(amt.get("min", 0)), int(amt.get("max", lo))
-            amount = random.randint(lo, hi)
-        else:
-            amount = int(amt)
-        return cls(amount)
+        return cls(*parse_amount(data.get("amount", 0)))
 
     def apply(self, caster: Any, target: Any, combat_engine: Any = None) -> str:
+        amount = roll_amount(self.amount, self.max_amount,
+                             effect_rng(combat_engine))
         before = target.current_mana
-        target.current_mana = before + self.amount
+        target.current_mana = before + amount
         restored = target.current_mana - before
         hook_dispatcher.fire("effect.apply", target=target, effect=self)
         return f"{target.name} restored {restored} MP."
@@ -5,10 +5,13 @@ Buffs a character’s weapon damage by a percentage.
 """
 
 from typing import Any, Dict
-from game_sys.effects.base import Effect
+from game_sys.effects.base import Effect, register_effect
 from game_sys.hooks.hooks import hook_dispatcher
 
+@register_effect("ModifyWeaponDamage")
 class ModifyWeaponDamageEffect(Effect):
+    reusable = True
+
     def __init__(self, weapon_type: str, percent_bonus: float) -> None:
         self.weapon_type = weapon_type
         self.percent_bonus = percent_bonus
@@ -1,12 +1,13 @@
 # game_sys/effects/passives/lifesteal.py
 from logs.logs import get_logger
 from game_sys.hooks.hooks import hook_dispatcher
-from game_sys.effects.base import Effect
+from game_sys.effects.base import Effect, register_effect
 import math
 
 log = get_logger(__name__)
 
 
+@register_effect("LifeStealPassive")
 class LifeStealPassive(Effect):
     def __init__(self, percent: float):
         self.pct = percent / 100.0
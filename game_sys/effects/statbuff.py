@@ -5,12 +5,15 @@ Applies a temporary buff to a target’s stat for a duration.
 """
 
 from typing import Any, Dict
-from game_sys.effects.base import Effect
+from game_sys.effects.base import Effect, register_effect
 from game_sys.effects.status import StatusEffect
 from game_sys.hooks.hooks import hook_dispatcher
 
 
+@register_effect("TemporaryStatBuff")
 class TemporaryStatBuff(Effect):
+    reusable = True
+
     def __init__(self, stat_name: str, amount: int, duration: int) -> None:
         self.stat_name = stat_name
         self.amount = amount
@@ -8,25 +8,91 @@ for a fixed duration (in turns), with ticking and expiration.
 """
 
 from __future__ import annotations
-from typing import Dict, Any, TYPE_CHECKING
-from game_sys.effects.base import Effect
+import copy
+from typing import Dict, Any, Optional, TYPE_CHECKING
+from game_sys.effects.base import Effect, register_effect
 from game_sys.hooks.hooks import hook_dispatcher
 
 if TYPE_CHECKING:
     from game_sys.character.actor import Actor
     from game_sys.combat.combat_engine import CombatEngine
+    from game_sys.effects.status_scheduler import StatusScheduler
 
+# What re-applying a status the actor already has does (see
+# StatusManager.apply)
+STACK_REFRESH = "refresh"  # take the new mods, restart the duration
+STACK_COUNT = "stack"      # add a stack (up to max_stacks), restart the duration
+STACK_MAX = "max"          # keep the stronger of each mod and the longer duration
+STACKING_RULES = (STACK_REFRESH, STACK_COUNT, STACK_MAX)
 
+
+@register_effect("Status", "ApplyStatus")
 class StatusEffect(Effect):
     """
     A temporary buff/debuff that modifies stats for a set number of turns.
+
+    Once attached to an actor the status is scheduled: it stores the
+    absolute turn it expires (`expires_at`) and `duration` reports the
+    turns left on its scheduler's clock.
+
+    `stat_mods` are per stack; `stacking` decides what re-applying a
+    status of the same name does.
     """
 
-    def __init__(self, name: str, stat_mods: Dict[str, int], duration: int) -> None:
+    # Set by StatusScheduler.schedule
+    _scheduler: Optional[StatusScheduler] = None
+    _schedule_seq: int = -1
+    expires_at: Optional[int] = None
+
+    def __init__(
+        self,
+        name: str,
+        stat_mods: Dict[str, int],
+        duration: int,
+        stacking: str = STACK_REFRESH,
+        max_stacks: int = 1,
+    ) -> None:
+        if stacking not in STACKING_RULES:
+            raise ValueError(f"Unknown stacking rule for status '{name}': {stacking!r}")
         self.name = name
         self.stat_mods = stat_mods
+        self.stacking = stacking
+        self.max_stacks = max(1, max_stacks)
+        self.stacks = 1
+        self._owner: Optional[Actor] = None
         self.duration = duration
 
+    def total_mods(self) -> Dict[str, int]:
+        """`stat_mods` scaled by the current stack count."""
+        return {k: v * self.stacks for k, v in self.stat_mods.items()}
+
+    @property
+    def duration(self) -> int:
+        if self._scheduler is None:
+            return self._duration
+        return max(0, self.expires_at - self._scheduler.now)
+
+    @duration.setter
+    def duration(self, turns: int) -> None:
+        if self._scheduler is None:
+            self._duration = turns
+        else:
+            self._scheduler.schedule(self._owner, self, turns)
+
+    def is_scheduled(self) -> bool:
+        return self._scheduler is not None
+
+    def detached_copy(self) -> StatusEffect:
+        """An unscheduled copy with the same remaining duration."""
+        clone = copy.copy(self)
+        clone.stat_mods = dict(self.stat_mods)
+        clone._scheduler = None
+        clone._owner = None
+        clone.__dict__.pop("expires_at", None)
+        clone.__dict__.pop("_schedule_seq", None)
+        clone._duration = self.duration
+        return clone
+
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> StatusEffect:
         """
@@ -37,6 +103,8 @@ class StatusEffect(Effect):
           - name: str
           - stat_mods: Dict[str, int]
           - duration: int
+          - stacking: optional, one of "refresh", "stack", "max"
+          - max_stacks: optional int (for "stack")
 
         Args:
             data: The serialized effect dict.
@@ -48,9 +116,15 @@ class StatusEffect(Effect):
         if et.lower() not in ("status", "applystatus"):
             raise ValueError(f"Invalid type for StatusEffect: {data.get('type')}")
         name = data.get("name")
-        stat_mods = data.get("stat_mods", {})
+        stat_mods = dict(data.get("stat_mods") or {})
         duration = int(data.get("duration", 0))
-        return cls(name=name, stat_mods=stat_mods, duration=duration)
+        return cls(
+            name=name,
+            stat_mods=stat_mods,
+            duration=duration,
+            stacking=data.get("stacking", STACK_REFRESH),
+            max_stacks=int(data.get("max_stacks", 1)),
+        )
 
     def apply(
         self,
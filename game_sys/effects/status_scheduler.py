@@ -0,0 +1,68 @@
+# game_sys/effects/status_scheduler.py
+"""
+Turn clock for status-effect expiry.
+
+A scheduled StatusEffect stores the absolute turn it expires
+(`expires_at`); its remaining `duration` is derived from the clock.
+StatusScheduler keeps a min-heap of pending expiries, so advancing a
+turn only touches statuses that actually run out instead of ticking
+every status on every actor.
+
+Each actor has its own scheduler; CombatEngine binds all participants
+to one shared scheduler for the length of a fight.
+"""
+from __future__ import annotations
+
+import heapq
+from itertools import count
+from typing import Any, List, Tuple, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from game_sys.effects.status import StatusEffect
+
+
+class StatusScheduler:
+    """Turn counter plus a heap of (expires_at, seq, actor, status)."""
+
+    def __init__(self) -> None:
+        self.now: int = 0
+        self._heap: List[Tuple[int, int, Any, "StatusEffect"]] = []
+        self._seq = count()
+
+    def __len__(self) -> int:
+        """Pending heap entries (may include superseded ones)."""
+        return len(self._heap)
+
+    def schedule(self, actor: Any, status: "StatusEffect", turns: int) -> None:
+        """Make `status` on `actor` expire `turns` turns from now."""
+        status._scheduler = self
+        status._owner = actor
+        status.expires_at = self.now + max(0, turns)
+        # The sequence number marks the live entry; rescheduling leaves
+        # the old one behind to be skipped
+        status._schedule_seq = seq = next(self._seq)
+        heapq.heappush(self._heap, (status.expires_at, seq, actor, status))
+
+    def adopt(self, actor: Any, status: "StatusEffect") -> None:
+        """Move `status` onto this clock, keeping its remaining turns."""
+        if status._scheduler is not self:
+            self.schedule(actor, status, status.duration)
+
+    def advance(self, turns: int = 1) -> List["StatusEffect"]:
+        """
+        Move the clock forward and expire every status that is due,
+        via its actor's StatusManager. Returns the expired statuses.
+        """
+        self.now += turns
+        heap = self._heap
+        expired: List["StatusEffect"] = []
+        while heap and heap[0][0] <= self.now:
+            _, seq, actor, status = heapq.heappop(heap)
+            # Skip entries that were rescheduled, moved to another
+            # scheduler, or whose status was already removed
+            if (status._scheduler is not self or status._schedule_seq != seq
+                    or actor.statuses.get(status.name) is not status):
+                continue
+            actor.status_mgr.expire(status)
+            expired.append(status)
+        return expired
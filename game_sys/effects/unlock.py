@@ -5,10 +5,13 @@ Allows opening locked chests/doors.
 """
 
 from typing import Any, Dict
-from game_sys.effects.base import Effect
+from game_sys.effects.base import Effect, register_effect
 from game_sys.hooks.hooks import hook_dispatcher
 
+@register_effect("Unlock")
 class UnlockEffect(Effect):
+    reusable = True
+
     def __init__(self, target_type: str) -> None:
         self.target_type = target_type
 
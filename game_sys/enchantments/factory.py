@@ -1,15 +1,17 @@
 # game_sys/enchantments/factory.py
 
 import random
-from pathlib import Path
 from typing import Optional, Dict, Any
+from game_sys.core.game_data import game_data
 from game_sys.enchantments.base import BasicEnchantment
 from game_sys.core.rarity import Rarity
 from game_sys.core.damage_types import DamageType
 from game_sys.managers.scaling_manager import scale_stat, roll_rarity as rolled
 
-# Load raw enchantment templates at import
-_TEMPLATES: Dict[str, Dict[str, Any]] = BasicEnchantment.load_all(Path(__file__).parent)
+# Raw enchantment templates, indexed on first use
+_TEMPLATES: Dict[str, Dict[str, Any]] = game_data.view("enchantments", lambda: {
+    entry.get("id"): entry for entry in game_data.get("enchantments")
+})
 
 def create_enchantment(
     enchant_id: str,
@@ -2,25 +2,13 @@
 
 # game_sys/enchantments/loader.py
 
-import json
-from pathlib import Path
 from typing import Dict, Any
-from logs.logs import get_logger
-
-log = get_logger(__name__)
+from game_sys.core.game_data import game_data
 
 
 def load_templates() -> Dict[str, Any]:
     """
-    Load every JSON file under this module's data/ folder into a template dict.
+    Return enchantments.json (via the shared game_data registry) as a
+    template dict keyed by id.
     """
-    templates: Dict[str, Any] = {}
-    data_dir = Path(__file__).parent / "data"
-    for json_file in data_dir.glob("*.json"):
-        try:
-            raw = json.loads(json_file.read_text(encoding="utf-8"))
-            for entry in raw:
-                templates[entry.get("id")] = entry
-        except Exception as e:
-            log.warning(f"Could not load {json_file}: {e}")
-    return templates
+    return {entry.get("id"): entry for entry in game_data.get("enchantments")}
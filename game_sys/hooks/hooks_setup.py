@@ -28,7 +28,7 @@ def _on_passive_equip(item, user, effect_data):
             user.passive_effects = {}
         key = effect_data.get("id", effect_data.get("type"))
         user.passive_effects[key] = eff
-        log.info(f"Registered passive '{key}' for {user.name} from {item.name}")
+        log.info("Registered passive '%s' for %s from %s", key, user.name, item.name)
     except Exception as e:
         log.error(f"Failed to register passive {effect_data} for {user.name}: {e}")
 
@@ -45,7 +45,8 @@ def _on_passive_unequip(item, user, effect_data):
     if eff:
         try:
             eff.unregister(user)
-            log.info(f"Unregistered passive '{key}' for {user.name} removed {item.name}")
+            log.info("Unregistered passive '%s' for %s removed %s",
+                     key, user.name, item.name)
         except Exception as e:
             log.error(f"Failed to unregister passive {key} for {user.name}: {e}")
 
@@ -56,14 +57,14 @@ hook_dispatcher.register("item.passive.unequip", _on_passive_unequip)
 # --- Inventory Events ------------------------------------------------------
 
 def _on_item_added(inventory, item, quantity, **_):
-    log.info(f"Inventory: {inventory.owner.name} gained {quantity}× {item.name}")
+    log.info("Inventory: %s gained %s× %s", inventory.owner.name, quantity, item.name)
 
 
 hook_dispatcher.register("inventory.item_added", _on_item_added)
 
 
 def _on_item_removed(inventory, item_id, quantity, **_):
-    log.info(f"Inventory: {inventory.owner.name} lost {quantity}× {item_id}")
+    log.info("Inventory: %s lost %s× %s", inventory.owner.name, quantity, item_id)
 
 
 hook_dispatcher.register("inventory.item_removed", _on_item_removed)
@@ -72,14 +73,15 @@ hook_dispatcher.register("inventory.item_removed", _on_item_removed)
 # --- Equip/Unequip Logging ------------------------------------------------
 
 def _on_equip(inventory, slot, item, **_):
-    log.info(f"{inventory.owner.name} equipped {item.name} in slot '{slot}'")
+    log.info("%s equipped %s in slot '%s'", inventory.owner.name, item.name, slot)
 
 
 hook_dispatcher.register("inventory.equip", _on_equip)
 
 
 def _on_unequip(inventory, slot, item, **_):
-    log.info(f"{inventory.owner.name} unequipped {item.name} from slot '{slot}'")
+    log.info("%s unequipped %s from slot '%s'",
+             inventory.owner.name, item.name, slot)
 
 
 hook_dispatcher.register("inventory.unequip", _on_unequip)
@@ -88,28 +90,32 @@ hook_dispatcher.register("inventory.unequip", _on_unequip)
 # --- Combat & Effects ------------------------------------------------------
 
 def _before_effect(effect, caster, target, **_):
-    log.debug(f"{caster.name} about to apply effect {effect.get('id')} to {getattr(target,'name','')}")
+    log.debug("%s about to apply effect %s to %s",
+              caster.name, effect.get('id'), getattr(target, 'name', ''))
 
 
 hook_dispatcher.register("effect.before_apply", _before_effect)
 
 
 def _after_effect(effect, caster, target, result, **_):
-    log.debug(f"{caster.name} applied effect {effect.get('id')} with result {result}")
+    log.debug("%s applied effect %s with result %s",
+              caster.name, effect.get('id'), result)
 
 
 hook_dispatcher.register("effect.after_apply", _after_effect)
 
 
 def _before_damage(actor, amount, damage_type, **_):
-    log.debug(f"{actor.name} will take {amount} {getattr(damage_type,'name','')} damage")
+    log.debug("%s will take %s %s damage",
+              actor.name, amount, getattr(damage_type, 'name', ''))
 
 
 hook_dispatcher.register("actor.before_damage", _before_damage)
 
 
 def _after_damage(actor, amount, damage_type, **_):
-    log.debug(f"{actor.name} took {amount} {getattr(damage_type,'name','')} damage; HP now {actor.current_health}")
+    log.debug("%s took %s %s damage; HP now %s", actor.name, amount,
+              getattr(damage_type, 'name', ''), actor.current_health)
 
 
 hook_dispatcher.register("actor.after_damage", _after_damage)
@@ -118,28 +124,28 @@ hook_dispatcher.register("actor.after_damage", _after_damage)
 # --- Resource & Status -----------------------------------------------------
 
 def _on_heal(actor, amount, **_):
-    log.info(f"{actor.name} healed {amount} HP")
+    log.info("%s healed %s HP", actor.name, amount)
 
 
 hook_dispatcher.register("actor.healed", _on_heal)
 
 
 def _on_mana(actor, amount, **_):
-    log.info(f"{actor.name} used {amount} MP")
+    log.info("%s used %s MP", actor.name, amount)
 
 
 hook_dispatcher.register("actor.mana_drained", _on_mana)
 
 
 def _on_status_added(actor, effect, **_):
-    log.info(f"{actor.name} gained status '{effect.name}'")
+    log.info("%s gained status '%s'", actor.name, effect.name)
 
 
 hook_dispatcher.register("actor.status_added", _on_status_added)
 
 
 def _on_status_expired(actor, effect, **_):
-    log.info(f"{actor.name}'s status '{effect.name}' expired")
+    log.info("%s's status '%s' expired", actor.name, effect.name)
 
     
 hook_dispatcher.register("actor.status_expired", _on_status_expired)
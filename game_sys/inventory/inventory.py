@@ -7,13 +7,16 @@ passive-effect hooks on equip/unequip.
 """
 
 from __future__ import annotations
-from typing import Any, Dict, List, Optional, Union
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Set, Union
 from logs.logs import get_logger
 from game_sys.items.item_base import Item, EquipableItem, ConsumableItem
 from game_sys.items.factory import create_item, _TEMPLATES
 from game_sys.hooks.hooks import hook_dispatcher
 from game_sys.core.equipment_slot import EquipmentSlot
 
+if TYPE_CHECKING:
+    from game_sys.items.item_store import ItemHandle
+
 log = get_logger(__name__)
 
 
@@ -28,6 +31,14 @@ class Inventory:
         self.owner = owner
         self._items: Dict[str, Dict[str, Any]] = {}
         self.equipped_items: Dict[str, EquipableItem] = {}
+        # Changes since the last checkpoint: item ids whose quantity
+        # changed, ids that got a new entry, and equipment slots touched
+        self._dirty_items: Set[str] = set()
+        self._new_items: Set[str] = set()
+        self._dirty_slots: Set[str] = set()
+        # Items kept in an ItemStore, referenced by handle (ordered set)
+        self._stash: Dict["ItemHandle", None] = {}
+        self._stash_dirty = False
 
     def add_item(
         self,
@@ -45,6 +56,8 @@ class Inventory:
             entry['quantity'] += quantity
         else:
             self._items[item_obj.id] = {'item': item_obj, 'quantity': quantity}
+            self._new_items.add(item_obj.id)
+        self._dirty_items.add(item_obj.id)
 
         log.info(
             "Added %dx %s (ID=%s) to %s's inventory.",
@@ -65,6 +78,7 @@ class Inventory:
         entry['quantity'] -= quantity
         if entry['quantity'] <= 0:
             del self._items[item_id]
+        self._dirty_items.add(item_id)
 
         log.info(
             "Removed %dx %s from %s's inventory.",
@@ -96,7 +110,9 @@ class Inventory:
 
         # equip new
         self.equipped_items[item_obj.slot] = item_obj
-        log.info(f"{self.owner.name} equipped '{item_obj.name}' into slot '{item_obj.slot}'.")
+        self._dirty_slots.add(item_obj.slot)
+        log.info("%s equipped '%s' into slot '%s'.",
+                 self.owner.name, item_obj.name, item_obj.slot)
 
         # register its passive effects: pass full data dict
         if item is not None:
@@ -113,7 +129,9 @@ class Inventory:
         item_obj = self.equipped_items.pop(slot, None)
         if not item_obj:
             return
-        log.info(f"{self.owner.name} unequipped '{item_obj.name}' from slot '{slot}'.")
+        self._dirty_slots.add(slot)
+        log.info("%s unequipped '%s' from slot '%s'.",
+                 self.owner.name, item_obj.name, slot)
         # unregister passive effects
         for eff_data in item_obj.passive_effects:
             hook_dispatcher.fire(
@@ -125,7 +143,11 @@ class Inventory:
         # return to inventory
         self.add_item(item_obj, 1)
 
-    def use_item(self, item_ref: Union[str, Item]) -> bool:
+    def use_item(
+        self,
+        item_ref: Union[str, Item],
+        combat_engine: Optional[Any] = None,
+    ) -> bool:
         if isinstance(item_ref, str):
             entry = self._items.get(item_ref)
             item_obj = entry['item'] if entry else None
@@ -138,7 +160,7 @@ class Inventory:
         if not isinstance(item_obj, ConsumableItem):
             raise TypeError(f"Item '{item_obj.id}' is not consumable")
 
-        result = item_obj.apply(self.owner, None)
+        result = item_obj.apply(self.owner, None, combat_engine)
         self.remove_item(item_obj.id, 1)
         log.info(
             "%s used %s.", self.owner.name, item_obj.name
@@ -148,6 +170,63 @@ class Inventory:
         )
         return True
 
+    def stash(self, handle: "ItemHandle") -> None:
+        """Keep a stored item by handle, without materializing it."""
+        self._stash[handle] = None
+        self._stash_dirty = True
+        hook_dispatcher.fire("inventory.item_stashed", inventory=self, handle=handle)
+
+    def unstash(self, handle: "ItemHandle") -> None:
+        if handle not in self._stash:
+            raise KeyError(f"Handle {handle.index} is not in the stash")
+        del self._stash[handle]
+        self._stash_dirty = True
+        hook_dispatcher.fire("inventory.item_unstashed", inventory=self, handle=handle)
+
+    def stashed(self) -> List["ItemHandle"]:
+        return list(self._stash)
+
+    def take_from_stash(
+        self, handle: "ItemHandle", auto_equip: bool = False
+    ) -> EquipableItem:
+        """
+        Materialize a stashed item and move it into the regular
+        inventory (equipping it if `auto_equip`).
+        """
+        item_obj = handle.materialize()
+        self.unstash(handle)
+        self.add_item(item_obj, 1, auto_equip=auto_equip)
+        return item_obj
+
+    def is_dirty(self) -> bool:
+        """
+        True if any quantity, equipment slot or the stash changed since
+        the last checkpoint.
+        """
+        return bool(self._dirty_items or self._dirty_slots or self._stash_dirty)
+
+    def stash_changed(self) -> bool:
+        """True if items were stashed or unstashed since the last checkpoint."""
+        return self._stash_dirty
+
+    def dirty_item_ids(self) -> Set[str]:
+        """Item ids whose entry was added, changed or removed."""
+        return self._dirty_items
+
+    def new_item_ids(self) -> Set[str]:
+        """Item ids that got a fresh entry (a new item object)."""
+        return self._new_items
+
+    def dirty_slots(self) -> Set[str]:
+        """Equipment slots that were equipped or emptied."""
+        return self._dirty_slots
+
+    def clear_dirty(self) -> None:
+        self._dirty_items.clear()
+        self._new_items.clear()
+        self._dirty_slots.clear()
+        self._stash_dirty = False
+
     def list_items(self) -> List[Item]:
         return [entry['item'] for entry in self._items.values()]
 
@@ -13,13 +13,14 @@ from game_sys.managers.scaling_manager import (
 )
 from game_sys.core.damage_types import DamageType
 from game_sys.enchantments.base import BasicEnchantment
+from game_sys.core.game_data import game_data
 from game_sys.hooks.hooks import hook_dispatcher
 
-# Load templates once at import time
-_TEMPLATES: Dict[str, Dict[str, Any]] = {
+# Templates are indexed on first use, not at import time
+_TEMPLATES: Dict[str, Dict[str, Any]] = game_data.view("items", lambda: {
     tpl["id"]: tpl for tpl in load_templates()
     if isinstance(tpl, dict) and "id" in tpl
-}
+})
 
 
 def _roll_field(spec: Any, rng: random.Random) -> Any:
@@ -42,6 +43,19 @@ def _roll_field(spec: Any, rng: random.Random) -> Any:
     return spec
 
 
+def parse_resistances(templ: Dict[str, Any]) -> Dict[DamageType, float]:
+    """Template resistances (both singular & plural keys) by DamageType."""
+    resist_src = templ.get("resistances", templ.get("resistance", {})) or {}
+    resistances: Dict[DamageType, float] = {}
+    for k, v in resist_src.items():
+        try:
+            dt = DamageType[k.upper()]
+            resistances[dt] = float(v)
+        except Exception:
+            continue
+    return resistances
+
+
 def _instantiate(
     templ: Dict[str, Any],
     rng: random.Random,
@@ -74,15 +88,7 @@ def _instantiate(
     # Price scaling
     price = scale_stat(int(templ.get("price", 0)), level, grade, rarity)
 
-    # Parse resistances (both singular & plural keys)
-    resist_src = templ.get("resistances", templ.get("resistance", {})) or {}
-    resistances: Dict[DamageType, float] = {}
-    for k, v in resist_src.items():
-        try:
-            dt = DamageType[k.upper()]
-            resistances[dt] = float(v)
-        except Exception:
-            continue
+    resistances = parse_resistances(templ)
 
     # Build item
     if item_type == "equipable":
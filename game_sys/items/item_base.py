@@ -4,10 +4,11 @@ from game_sys.core.rarity import Rarity
 from game_sys.core.damage_types import DamageType
 from game_sys.enchantments.base import BasicEnchantment
 from game_sys.hooks.hooks import hook_dispatcher
-from game_sys.effects.base import Effect
-from typing import Dict, Any, List, Optional, Union, TYPE_CHECKING
+from game_sys.effects.base import Effect, EffectSpec, compile_effects
+from typing import Dict, Any, List, Optional, Tuple, Union, TYPE_CHECKING
 if TYPE_CHECKING:
     from game_sys.character.actor import Actor
+    from game_sys.combat.combat_engine import CombatEngine
 log = get_logger(__name__)
 
 class Item:
@@ -33,7 +34,7 @@ class Item:
         return f"{self.name} (Level {self.level})"
 
     def apply(self, user: 'Actor', target: Optional['Actor'] = None) -> Any:
-        log.debug(f"No direct effect for item {self.id}")
+        log.debug("No direct effect for item %s", self.id)
         return None
 
 class EquipableItem(Item):
@@ -89,7 +90,7 @@ class EquipableItem(Item):
         return final
 
     def apply(self, user: 'Actor', target: Optional['Actor'] = None) -> None:
-        log.debug(f"Equipable item {self.id} used; equipping logic handled elsewhere")
+        log.debug("Equipable item %s used; equipping logic handled elsewhere", self.id)
         return None
 
     def __str__(self) -> str:
@@ -144,17 +145,44 @@ class ConsumableItem(Item):
         super().__init__(id, name, description, price, level, grade, rarity)
         self.effects_data = effects_data
         self.amount = amount
+        # Compiled once: reusable effects are built here and applied on
+        # every use; stateful ones are rebuilt from their spec per use.
+        self._effect_specs: Tuple[EffectSpec, ...] = compile_effects(effects_data)
+        self._effects: Tuple[Optional[Effect], ...] = tuple(
+            spec.build() if spec.effect_cls.reusable else None
+            for spec in self._effect_specs
+        )
 
     def __str__(self) -> str:
         return f"{self.name} x{self.amount} (Effects: {len(self.effects_data)})"
 
-    def apply(self, user: 'Actor', target: Optional['Actor'] = None) -> List[Any]:
+    @property
+    def effect_specs(self) -> Tuple[EffectSpec, ...]:
+        """Compiled effects_data, shared by every item of the same template."""
+        return self._effect_specs
+
+    def expected_heal(self) -> float:
+        """Mean HP one use restores (heal effects only)."""
+        return sum(
+            eff.expected_heal() for eff in self._effects
+            if hasattr(eff, "expected_heal")
+        )
+
+    def apply(
+        self,
+        user: 'Actor',
+        target: Optional['Actor'] = None,
+        combat_engine: Optional['CombatEngine'] = None,
+    ) -> List[Any]:
         results: List[Any] = []
-        for eff_data in self.effects_data:
-            effect_obj = Effect.from_dict(eff_data)
-            actual_target = target or user
+        actual_target = target or user
+        for eff_data, spec, effect_obj in zip(
+            self.effects_data, self._effect_specs, self._effects
+        ):
+            if effect_obj is None:
+                effect_obj = spec.build()
             hook_dispatcher.fire("effect.before_apply", effect=eff_data, caster=user, target=actual_target)
-            res = effect_obj.apply(user, actual_target)
+            res = effect_obj.apply(user, actual_target, combat_engine)
             hook_dispatcher.fire("effect.after_apply", effect=eff_data, caster=user, target=actual_target, result=res)
             results.append(res)
         self.amount -= 1
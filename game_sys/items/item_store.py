@@ -0,0 +1,455 @@
+# game_sys/items/item_store.py
+
+"""
+Memory-mapped store for large numbers of rolled equipable items.
+
+An `EquipableItem` is a Python object with several nested dicts; a
+stash or auction house holding millions of them does not fit in memory.
+`ItemStore` keeps only what an item rolled, as fixed-width records in a
+memory-mapped file, and rebuilds `EquipableItem` objects on demand:
+
+  <path>            item records: template index, level, grade, rarity,
+                    price, rolled stat bonus min/max, rolled damage
+                    min/max, and refs to enchantment records
+  <path>.ench       enchantment records: template index, level, grade,
+                    rarity, rolled stat bonuses and damage modifiers
+  <path>.meta.json  template id and stat column tables the indexes
+                    refer to, fixed when the store is created
+
+Everything that is not rolled (name, description, slot, percent bonuses,
+passive effects, resistances, enchantment names and slots) comes from
+the current templates when an item is materialized.
+
+Items are referenced by `ItemHandle`, which `Inventory` can hold in its
+stash instead of full objects; saves record a stash as the store path
+plus record indexes, and `ItemStore.open` maps the path back to the
+store instance. `select` filters records by template, level or rarity
+without materializing anything.
+"""
+
+from __future__ import annotations
+import json
+import mmap
+import os
+import struct
+import weakref
+from pathlib import Path
+from typing import (
+    Any, Dict, Iterable, Iterator, List, NamedTuple, Optional, Sequence, Tuple, Union,
+)
+
+from logs.logs import get_logger
+from game_sys.core.damage_types import DamageType
+from game_sys.core.game_data import game_data
+from game_sys.core.rarity import Rarity
+from game_sys.core.stats import Stats
+from game_sys.enchantments.base import BasicEnchantment
+from game_sys.items.item_base import EquipableItem
+
+log = get_logger(__name__)
+
+STORE_VERSION = 1
+MAX_ENCHANTMENTS = 4
+_NO_REF = 0xFFFFFFFF
+_LIVE = 1
+_GROW_RECORDS = 4096
+_SCAN_RECORDS = 65536
+
+_DAMAGE_TYPES: Tuple[DamageType, ...] = tuple(DamageType)
+
+
+class ItemHandle(NamedTuple):
+    """Reference to one item record in an `ItemStore`."""
+    store: "ItemStore"
+    index: int
+
+    def materialize(self) -> EquipableItem:
+        """Build the `EquipableItem` this handle refers to."""
+        return self.store.get(self.index)
+
+
+class ItemRecord(NamedTuple):
+    """The scalar columns of an item record, read without materializing."""
+    template_id: str
+    level: int
+    grade: int
+    rarity: Rarity
+    price: int
+
+
+class _Table:
+    """A growable array of fixed-width records in a memory-mapped file."""
+
+    HEADER = struct.Struct("<4sHHQ")
+
+    def __init__(self, path: Path, record: struct.Struct, magic: bytes) -> None:
+        self.path = path
+        self.record = record
+        self.magic = magic
+        if not path.exists():
+            with open(path, "wb") as f:
+                f.write(self.HEADER.pack(magic, STORE_VERSION, record.size, 0))
+        self._file = open(path, "r+b")
+        head = self._file.read(self.HEADER.size)
+        got_magic, version, size, count = self.HEADER.unpack(head)
+        if got_magic != magic or size != record.size:
+            raise ValueError(f"{path}: not an item store table of this layout")
+        if not 1 <= version <= STORE_VERSION:
+            raise ValueError(f"{path}: unsupported store version {version}")
+        self.count = count
+        self._mm = mmap.mmap(self._file.fileno(), 0)
+
+    @property
+    def capacity(self) -> int:
+        return (len(self._mm) - self.HEADER.size) // self.record.size
+
+    def _offset(self, index: int) -> int:
+        if not 0 <= index < self.count:
+            raise IndexError(f"record {index} out of range")
+        return self.HEADER.size + index * self.record.size
+
+    def _grow(self, needed: int) -> None:
+        new_cap = max(needed, self.capacity * 2, _GROW_RECORDS)
+        self._mm.close()
+        self._file.truncate(self.HEADER.size + new_cap * self.record.size)
+        self._mm = mmap.mmap(self._file.fileno(), 0)
+
+    def append(self, values: Sequence[Any]) -> int:
+        index = self.count
+        if index >= self.capacity:
+            self._grow(index + 1)
+        self.count += 1
+        self.record.pack_into(self._mm, self._offset(index), *values)
+        self.HEADER.pack_into(self._mm, 0, self.magic, STORE_VERSION,
+                              self.record.size, self.count)
+        return index
+
+    def read(self, index: int) -> Tuple[Any, ...]:
+        return self.record.unpack_from(self._mm, self._offset(index))
+
+    def write(self, index: int, values: Sequence[Any]) -> None:
+        self.record.pack_into(self._mm, self._offset(index), *values)
+
+    def scan(self) -> Iterator[Tuple[int, Tuple[Any, ...]]]:
+        """Yield (index, record) for every record, a chunk at a time."""
+        size = self.record.size
+        for first in range(0, self.count, _SCAN_RECORDS):
+            last = min(first + _SCAN_RECORDS, self.count)
+            start = self.HEADER.size + first * size
+            chunk = self._mm[start:self.HEADER.size + last * size]
+            for i, values in enumerate(self.record.iter_unpack(chunk), first):
+                yield i, values
+
+    def flush(self) -> None:
+        self._mm.flush()
+
+    def close(self) -> None:
+        if not self._mm.closed:
+            self._mm.flush()
+            self._mm.close()
+            # Drop unused capacity so the file holds only real records
+            self._file.truncate(self.HEADER.size + self.count * self.record.size)
+        self._file.close()
+
+
+def _default_columns() -> Tuple[List[str], List[str], List[str]]:
+    """Template ids and stat columns for a new store, from game data."""
+    items = [t for t in game_data.get("items")
+             if isinstance(t, dict) and t.get("type", "").lower() == "equipable"]
+    enchants = list(game_data.get("enchantments"))
+    stats = list(Stats.stat_keys())
+    for tpl in items:
+        stats += [s for s in tpl.get("base_bonus_ranges", {}) if s not in stats]
+    for tpl in enchants:
+        stats += [s for s in tpl.get("stat_bonuses", {}) if s not in stats]
+    return ([t["id"] for t in items], [e["id"] for e in enchants], stats)
+
+
+class ItemStore:
+    """
+    Fixed-width, memory-mapped storage for rolled `EquipableItem`s.
+
+    Deleted records are tombstoned and reused by later `put`s, also
+    after the store is reopened. Call `close` (or use as a context
+    manager) to flush.
+    """
+
+    # Open stores by resolved path, so saved handles find their store
+    _open: "weakref.WeakValueDictionary[Path, ItemStore]" = weakref.WeakValueDictionary()
+
+    @classmethod
+    def open(cls, path: Union[str, Path]) -> "ItemStore":
+        """The store already open at `path`, or a newly opened one."""
+        store = cls._open.get(Path(path).resolve())
+        return store if store is not None else cls(path)
+
+    def __init__(self, path: Union[str, Path]) -> None:
+        self.path = Path(path)
+        meta_path = self.path.with_name(self.path.name + ".meta.json")
+        if meta_path.exists():
+            meta = json.loads(meta_path.read_text(encoding="utf-8"))
+            if meta.get("version", 0) > STORE_VERSION:
+                raise ValueError(f"{meta_path}: unsupported store version")
+        else:
+            templates, enchants, stats = _default_columns()
+            meta = {"version": STORE_VERSION, "templates": templates,
+                    "enchantments": enchants, "stats": stats,
+                    "max_enchantments": MAX_ENCHANTMENTS}
+            tmp = meta_path.with_name(meta_path.name + ".tmp")
+            tmp.write_text(json.dumps(meta, indent=2), encoding="utf-8")
+            os.replace(tmp, meta_path)
+
+        self._templates: List[str] = list(meta["templates"])
+        self._enchant_ids: List[str] = list(meta["enchantments"])
+        self._stats: List[str] = list(meta["stats"])
+        self._max_ench: int = meta["max_enchantments"]
+        self._template_index = {t: i for i, t in enumerate(self._templates)}
+        self._enchant_index = {e: i for i, e in enumerate(self._enchant_ids)}
+        self._stat_index = {s: i for i, s in enumerate(self._stats)}
+
+        n_stats, n_dmg = len(self._stats), len(_DAMAGE_TYPES)
+        if n_stats > 32 or n_dmg > 16:
+            raise ValueError("Too many stat or damage columns for one store")
+        # flags, template, level, grade, rarity, price, stat mask, stat
+        # min/max, damage mask, damage min/max, enchantment refs
+        self._items = _Table(self.path, struct.Struct(
+            f"<BHHBBiI{2 * n_stats}iH{2 * n_dmg}i{self._max_ench}I"
+        ), b"GSIS")
+        # flags, template, level, grade, rarity, stat mask, stats,
+        # damage mask, damage modifiers
+        self._enchants = _Table(
+            self.path.with_name(self.path.name + ".ench"),
+            struct.Struct(f"<BHHBBI{n_stats}iH{n_dmg}i"), b"GSEN",
+        )
+        # Tombstoned records, reused by put
+        self._free: List[int] = [i for i, v in self._items.scan() if not v[0] & _LIVE]
+        self._free_ench: List[int] = [
+            i for i, v in self._enchants.scan() if not v[0] & _LIVE
+        ]
+        self._open.setdefault(self.path.resolve(), self)
+
+    # ------------------------------------------------------------------
+    # Lifecycle
+    # ------------------------------------------------------------------
+
+    def flush(self) -> None:
+        self._items.flush()
+        self._enchants.flush()
+
+    def close(self) -> None:
+        self._items.close()
+        self._enchants.close()
+        key = self.path.resolve()
+        if self._open.get(key) is self:
+            del self._open[key]
+
+    def __enter__(self) -> "ItemStore":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return self._items.count - len(self._free)
+
+    # ------------------------------------------------------------------
+    # Encoding
+    # ------------------------------------------------------------------
+
+    def _stat_columns(self, values: Dict[str, int], owner: str) -> Tuple[int, List[int]]:
+        mask, cols = 0, [0] * len(self._stats)
+        for stat, amount in values.items():
+            col = self._stat_index.get(stat)
+            if col is None:
+                raise ValueError(f"{owner}: stat '{stat}' has no column in this store")
+            mask |= 1 << col
+            cols[col] = int(amount)
+        return mask, cols
+
+    @staticmethod
+    def _damage_columns(values: Dict[DamageType, int]) -> Tuple[int, List[int]]:
+        mask, cols = 0, [0] * len(_DAMAGE_TYPES)
+        for dt, amount in values.items():
+            col = _DAMAGE_TYPES.index(dt)
+            mask |= 1 << col
+            cols[col] = int(amount)
+        return mask, cols
+
+    def _put_enchantment(self, ench: BasicEnchantment) -> int:
+        tpl = self._enchant_index.get(ench.enchant_id)
+        if tpl is None:
+            raise ValueError(f"Unknown enchantment template '{ench.enchant_id}'")
+        stat_mask, stats = self._stat_columns(ench.stat_bonuses, ench.enchant_id)
+        dmg_mask, dmg = self._damage_columns(ench.damage_modifiers)
+        values = (_LIVE, tpl, ench.level, ench.grade, ench.rarity.value,
+                  stat_mask, *stats, dmg_mask, *dmg)
+        if self._free_ench:
+            index = self._free_ench.pop()
+            self._enchants.write(index, values)
+            return index
+        return self._enchants.append(values)
+
+    def put(self, item: EquipableItem) -> ItemHandle:
+        """Store the rolled state of `item`; returns its handle."""
+        tpl = self._template_index.get(item.id)
+        if tpl is None:
+            raise ValueError(f"Unknown item template '{item.id}'")
+        if len(item.enchantments) > self._max_ench:
+            raise ValueError(
+                f"{item.id}: {len(item.enchantments)} enchantments "
+                f"(store holds at most {self._max_ench})"
+            )
+        ranges = item.base_bonus_ranges
+        lo_mask, lows = self._stat_columns(
+            {s: r.get("min", 0) for s, r in ranges.items()}, item.id)
+        _, highs = self._stat_columns(
+            {s: r.get("max", 0) for s, r in ranges.items()}, item.id)
+        dmg = {DamageType[name.upper()]: spec for name, spec in item.damage_map.items()}
+        dmg_mask, dmg_lo = self._damage_columns(
+            {dt: spec.get("min", 0) for dt, spec in dmg.items()})
+        _, dmg_hi = self._damage_columns(
+            {dt: spec.get("max", 0) for dt, spec in dmg.items()})
+        refs = [self._put_enchantment(e) for e in item.enchantments]
+        refs += [_NO_REF] * (self._max_ench - len(refs))
+
+        values = (_LIVE, tpl, item.level, item.grade, item.rarity.value,
+                  item.price, lo_mask, *lows, *highs, dmg_mask, *dmg_lo,
+                  *dmg_hi, *refs)
+        if self._free:
+            index = self._free.pop()
+            self._items.write(index, values)
+        else:
+            index = self._items.append(values)
+        return ItemHandle(self, index)
+
+    def put_many(self, items: Iterable[EquipableItem]) -> List[ItemHandle]:
+        return [self.put(item) for item in items]
+
+    def delete(self, handle: Union[ItemHandle, int]) -> None:
+        """Tombstone an item record and its enchantment records."""
+        index = self._index(handle)
+        values = list(self._live(index))
+        for ref in values[-self._max_ench:]:
+            if ref != _NO_REF:
+                ench = list(self._enchants.read(ref))
+                ench[0] = 0
+                self._enchants.write(ref, ench)
+                self._free_ench.append(ref)
+        values[0] = 0
+        self._items.write(index, values)
+        self._free.append(index)
+
+    # ------------------------------------------------------------------
+    # Decoding
+    # ------------------------------------------------------------------
+
+    def _index(self, handle: Union[ItemHandle, int]) -> int:
+        if isinstance(handle, ItemHandle):
+            if handle.store is not self:
+                raise ValueError("Handle belongs to a different ItemStore")
+            return handle.index
+        return handle
+
+    def _live(self, index: int) -> Tuple[Any, ...]:
+        values = self._items.read(index)
+        if not values[0] & _LIVE:
+            raise KeyError(f"Item record {index} was deleted")
+        return values
+
+    def record(self, handle: Union[ItemHandle, int]) -> ItemRecord:
+        """Scalar columns of an item, without materializing it."""
+        v = self._live(self._index(handle))
+        return ItemRecord(self._templates[v[1]], v[2], v[3],
+                          Rarity.get_rarity_by_value(v[4]), v[5])
+
+    def _stats_from(self, mask: int, cols: Sequence[int]) -> Dict[str, int]:
+        return {s: cols[i] for i, s in enumerate(self._stats) if mask >> i & 1}
+
+    def _get_enchantment(self, index: int) -> BasicEnchantment:
+        from game_sys.enchantments.factory import _TEMPLATES as ENCHANT_TEMPLATES
+
+        v = self._enchants.read(index)
+        n_stats = len(self._stats)
+        enchant_id = self._enchant_ids[v[1]]
+        tpl = ENCHANT_TEMPLATES.get(enchant_id, {})
+        dmg_mask = v[6 + n_stats]
+        dmg = v[7 + n_stats:]
+        return BasicEnchantment(
+            enchant_id=enchant_id,
+            name=tpl.get("name", enchant_id),
+            description=tpl.get("description", ""),
+            level=v[2],
+            grade=v[3],
+            rarity=Rarity.get_rarity_by_value(v[4]),
+            applicable_slots=list(tpl.get("applicable_slots", [])),
+            stat_bonuses=self._stats_from(v[5], v[6:6 + n_stats]),
+            damage_modifiers={dt: dmg[i] for i, dt in enumerate(_DAMAGE_TYPES)
+                              if dmg_mask >> i & 1},
+        )
+
+    def get(self, handle: Union[ItemHandle, int]) -> EquipableItem:
+        """Materialize the item at `handle` as a new `EquipableItem`."""
+        from game_sys.items.factory import _TEMPLATES as ITEM_TEMPLATES, parse_resistances
+
+        v = self._live(self._index(handle))
+        n_stats, n_dmg = len(self._stats), len(_DAMAGE_TYPES)
+        item_id = self._templates[v[1]]
+        tpl = ITEM_TEMPLATES.get(item_id, {})
+
+        pos = 7
+        lows, highs = v[pos:pos + n_stats], v[pos + n_stats:pos + 2 * n_stats]
+        pos += 2 * n_stats
+        dmg_mask = v[pos]
+        dmg_lo, dmg_hi = v[pos + 1:pos + 1 + n_dmg], v[pos + 1 + n_dmg:pos + 1 + 2 * n_dmg]
+        refs = v[pos + 1 + 2 * n_dmg:]
+
+        return EquipableItem(
+            id=item_id,
+            name=tpl.get("name", item_id),
+            description=tpl.get("description", ""),
+            price=v[5],
+            level=v[2],
+            slot=tpl.get("slot", ""),
+            grade=v[3],
+            rarity=Rarity.get_rarity_by_value(v[4]),
+            base_bonus_ranges={
+                s: {"min": lows[i], "max": highs[i]}
+                for i, s in enumerate(self._stats) if v[6] >> i & 1
+            },
+            damage_map={
+                dt.name: {"min": dmg_lo[i], "max": dmg_hi[i]}
+                for i, dt in enumerate(_DAMAGE_TYPES) if dmg_mask >> i & 1
+            },
+            percent_bonuses={s: float(p) for s, p in tpl.get("percent_bonuses", {}).items()},
+            passive_effects=list(tpl.get("passive_effects", []) or []),
+            enchantments=[self._get_enchantment(r) for r in refs if r != _NO_REF],
+            resistances=parse_resistances(tpl),
+        )
+
+    def handles(self) -> Iterator[ItemHandle]:
+        """Handles of every live item, in storage order."""
+        for index, values in self._items.scan():
+            if values[0] & _LIVE:
+                yield ItemHandle(self, index)
+
+    def select(
+        self,
+        template_id: Optional[str] = None,
+        min_level: Optional[int] = None,
+        max_level: Optional[int] = None,
+        min_rarity: Optional[Rarity] = None,
+    ) -> Iterator[ItemHandle]:
+        """
+        Handles of live items matching every given filter, found by
+        scanning the fixed-width columns without building items.
+        """
+        if template_id is not None and template_id not in self._template_index:
+            return
+        tpl = self._template_index.get(template_id) if template_id else None
+        lo = min_level if min_level is not None else 0
+        hi = max_level if max_level is not None else 0xFFFF
+        rarity = min_rarity.value if min_rarity is not None else 0
+        for index, v in self._items.scan():
+            if (v[0] & _LIVE and lo <= v[2] <= hi and v[4] >= rarity
+                    and (tpl is None or v[1] == tpl)):
+                yield ItemHandle(self, index)
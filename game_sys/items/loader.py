@@ -1,34 +1,24 @@
 # game_sys/items/loader.py
 
-import json
-from pathlib import Path
 from typing import Any, Dict, List, Union
 
+from game_sys.core.game_data import game_data
+
 
 def load_templates() -> List[Dict[str, Any]]:
     """
-    Load item templates from 'items.json' and return as a list of dicts.
+    Return item templates from 'items.json' (via the shared game_data
+    registry) as a list of dicts.
     Handles:
       - Missing file or empty content → empty list
       - Invalid JSON → empty list
       - JSON array → return it directly
       - JSON object → return list(parsed.values())
     """
-    templates_path = Path(__file__).parent / "data" / "items.json"
-
-    try:
-        raw = templates_path.read_text(encoding="utf-8")
-    except FileNotFoundError:
-        return []
-
-    if not raw.strip():
+    parsed: Union[Dict[str, Any], List[Any]] = game_data.get("items")
+    if not parsed:
         return []
 
-    try:
-        parsed: Union[Dict[str, Any], List[Any]] = json.loads(raw)
-    except json.JSONDecodeError:
-        return []
-    
     from game_sys.hooks.hooks import hook_dispatcher
     hook_dispatcher.fire("data.loaded", module=__name__, data=parsed)
 
@@ -2,6 +2,6 @@
 
 from .base import Job
 from .loader import load_job_templates
-from .factory import create_job, list_job_ids
+from .factory import create_job, list_all_ids as list_job_ids
 
 __all__ = ["Job", "load_job_templates", "create_job", "list_job_ids"]
@@ -1,40 +1,35 @@
 # File: game_sys/jobs/factory.py
 
-import json
 import random
 import copy
-from pathlib import Path
 from typing import Any, Dict, List, Optional
 
+from game_sys.core.game_data import game_data
 from game_sys.items.factory import create_item
 from game_sys.core.rarity import Rarity
-from game_sys.managers.scaling_manager import scale_stat, _GRADE_STATS_MULTIPLIER as _GRADE_MODIFIERS
+from game_sys.managers.scaling_manager import scale_stat_map, _GRADE_STATS_MULTIPLIER as _GRADE_MODIFIERS
 from game_sys.jobs.base import Job
 
 
 def load_templates() -> Dict[str, Any]:
     """
-    Load all job templates from JSON files under game_sys/jobs/data/.
-    Returns a dict mapping job_id to its template.
+    Load all job templates from jobs.json (via the shared game_data
+    registry). Returns a dict mapping job_id to its template.
     """
     templates: Dict[str, Any] = {}
-    data_dir = Path(__file__).parent / "data"
-    for json_file in data_dir.glob("*.json"):
-        with json_file.open(encoding="utf-8") as f:
-            entries = json.load(f)
-            for entry in entries:
-                jid = (
-                    entry.get("id")
-                    or entry.get("job_id")
-                    or entry.get("name")
-                )
-                templates[jid] = entry
+    for entry in game_data.get("jobs"):
+        jid = (
+            entry.get("id")
+            or entry.get("job_id")
+            or entry.get("name")
+        )
+        templates[jid] = entry
     from game_sys.hooks.hooks import hook_dispatcher
     hook_dispatcher.fire("jobs.loaded", jobs=templates)
     return templates
 
 
-_TEMPLATES = load_templates()
+_TEMPLATES = game_data.view("jobs", load_templates)
 
 
 def list_all_ids() -> List[str]:
@@ -65,21 +60,22 @@ def create_job(
         raise KeyError(f"No job template for id={job_id!r}")
     templ = copy.deepcopy(template)
 
-    # Scale base stats
-    raw_stats = templ.get("base_stats", {})
-    scaled_stats: Dict[str, int] = {}
-    for stat_name, spec in raw_stats.items():
-        # Roll if spec is a dict range
-        if isinstance(spec, dict):
-            lo = int(spec.get("min", 0))
-            hi = int(spec.get("max", lo))
-            rolled = rng.randint(lo, hi) if hi >= lo else lo
-        else:
-            rolled = int(spec)
-        # Scale and apply grade multiplier
-        val = scale_stat(rolled, level, grade=grade, rarity=rarity)
-        val = int(val * _GRADE_MODIFIERS.get(grade, 1.0))
-        scaled_stats[stat_name] = val
+    # Roll any min/max ranges, then scale the whole dict in one pass and
+    # apply the grade modifier
+    raw_stats = {
+        stat_name: (
+            (int(spec.get("min", 0)), int(spec.get("max", spec.get("min", 0))))
+            if isinstance(spec, dict) else int(spec)
+        )
+        for stat_name, spec in templ.get("base_stats", {}).items()
+    }
+    grade_mod = _GRADE_MODIFIERS.get(grade, 1.0)
+    scaled_stats: Dict[str, int] = {
+        stat_name: int(val * grade_mod)
+        for stat_name, val in scale_stat_map(
+            raw_stats, level, grade=grade, rarity=rarity, rng=rng
+        ).items()
+    }
 
     # Instantiate starting items
     items: List[Any] = []
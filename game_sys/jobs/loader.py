@@ -1,16 +1,13 @@
-import json
-from pathlib import Path
 from typing import Dict, Any
 
-DATA_PATH = Path(__file__).parent / "data" / "jobs.json"
+from game_sys.core.game_data import game_data
 
 
 def load_job_templates() -> Dict[str, Dict[str, Any]]:
     """
     Load raw JSON entries into a dict of job_id -> template dict.
     """
-    with open(DATA_PATH, 'r', encoding='utf-8') as f:
-        raw = json.load(f)
+    raw = game_data.get("jobs")
     from game_sys.hooks.hooks import hook_dispatcher
     hook_dispatcher.fire("data.loaded", module=__name__, data=raw)
-    return {tpl['id']: tpl for tpl in raw}
+    return {tpl.get('id') or tpl['job_id']: tpl for tpl in raw}
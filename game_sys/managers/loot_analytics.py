@@ -0,0 +1,283 @@
+# game_sys/managers/loot_analytics.py
+"""
+Analytic (sampling-free) loot expectations.
+
+Computes exact expected drop counts, rarity distributions and gold per
+kill straight from DROP_TABLES and the scaling functions, mirroring the
+randomness in `roll_loot`, `roll_gold` and `create_character`'s enemy
+gold roll. Results are cached and each caller gets its own copy; the
+cache is cleared when `game_data.reload` picks up changed drop tables or
+item/character templates. Call `clear_loot_cache()` after editing them
+in memory at runtime.
+"""
+from __future__ import annotations
+
+import csv
+import json
+from dataclasses import dataclass, field, asdict, replace
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Union
+
+from game_sys.core.rarity import Rarity
+from game_sys.combat.loader import DROP_TABLES
+from game_sys.hooks.hooks import hook_dispatcher
+from game_sys.managers.scaling_manager import scale_stat
+
+# Template keys that take the enemy branch of create_character
+# (and therefore get a rolled gold purse).
+_ENEMY_TEMPLATE_KEYS = ("enemy", "goblin", "orc", "dragon", "zombie")
+
+
+@dataclass
+class LootExpectation:
+    """Exact per-kill loot expectations for one enemy/level/grade/rarity."""
+    enemy: str
+    level: int
+    grade: int
+    rarity: str
+    # item_id → expected number of copies dropped per kill
+    expected_items: Dict[str, float] = field(default_factory=dict)
+    # item_id → {rarity name → expected copies of that rarity}
+    rarity_distribution: Dict[str, Dict[str, float]] = field(
+        default_factory=dict
+    )
+    # item_id → expected scaled sell price of the copies dropped
+    expected_item_value: Dict[str, float] = field(default_factory=dict)
+    # Expected gold held by a freshly created enemy
+    expected_purse: float = 0.0
+    # Expected gold looted per kill via roll_gold
+    expected_gold: float = 0.0
+
+    @property
+    def expected_item_count(self) -> float:
+        """Total expected item copies per kill."""
+        return sum(self.expected_items.values())
+
+    def copy(self) -> LootExpectation:
+        """A copy whose dicts can be edited without touching this one."""
+        return replace(
+            self,
+            expected_items=dict(self.expected_items),
+            rarity_distribution={
+                k: dict(v) for k, v in self.rarity_distribution.items()
+            },
+            expected_item_value=dict(self.expected_item_value),
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        data = asdict(self)
+        data["expected_item_count"] = self.expected_item_count
+        return data
+
+
+def _select_tier(
+    tiers: List[Dict[str, Any]], level: int, grade: int
+) -> Optional[Dict[str, Any]]:
+    """Same first-match tier selection as roll_loot."""
+    return next(
+        (t for t in tiers
+         if t["min_level"] <= level <= t["max_level"]
+            and t.get("min_grade", 0) <= grade <= t.get("max_grade", grade)),
+        None
+    )
+
+
+def _drop_probability(chance: float) -> float:
+    """P(rng.random() <= chance) for rng.random() uniform on [0, 1)."""
+    return max(0.0, min(1.0, float(chance)))
+
+
+def _rarity_probabilities(weights: Dict[str, float]) -> Dict[str, float]:
+    """Normalise rarity weights the way rng.choices does."""
+    if not weights:
+        return {"COMMON": 1.0}
+    total = float(sum(weights.values()))
+    if total <= 0:
+        raise ValueError(f"Rarity weights must sum to > 0, got {weights!r}")
+    probs: Dict[str, float] = {}
+    for name, w in weights.items():
+        key = Rarity[name.upper()].name
+        probs[key] = probs.get(key, 0.0) + w / total
+    return probs
+
+
+def expected_purse(
+    template_key: str, level: int, grade: int, rarity: Rarity
+) -> float:
+    """
+    Exact expected gold of an enemy created by create_character.
+
+    Mirrors the enemy branch:
+        a, b = randint(gmin, gmax), randint(gmin, gmax)
+        gold = randint(a, b * level * grade * rarity.value)
+    falling back to randint(1, 100) * level when any of those draws is
+    invalid or the template has no gold range.
+    """
+    from game_sys.character.character_creation import _CHAR_TEMPLATES
+
+    key = template_key.capitalize()
+    if key.lower() not in _ENEMY_TEMPLATE_KEYS:
+        return 0.0
+    tpl = _CHAR_TEMPLATES.get(key, {})
+    gmin = tpl.get("gold_min", 0)
+    gmax = tpl.get("gold_max", 0)
+    fallback = 50.5 * level
+    if not (gmin and gmax) or gmax < gmin:
+        return fallback
+
+    k = level * grade * rarity.value
+    n = gmax - gmin + 1
+    total = 0.0
+    for a in range(gmin, gmax + 1):
+        # b must satisfy b * k >= a for randint(a, b*k) to be valid
+        b0 = max(gmin, -(-a // k))
+        valid = max(0, gmax - b0 + 1)
+        if valid:
+            sum_b = (b0 + gmax) * valid / 2.0
+            total += (valid * a + k * sum_b) / 2.0
+        total += (n - valid) * fallback
+    return total / (n * n)
+
+
+def expected_roll_gold(purse: float) -> float:
+    """
+    Expected roll_gold() for an enemy whose purse has mean `purse`.
+
+    roll_gold draws randint(1, gold), whose mean (1 + gold) / 2 is linear
+    in gold, so the expectation passes straight through. Purses rolled by
+    create_character are always >= 1; a zero purse yields zero gold.
+    """
+    if purse <= 0:
+        return 0.0
+    return (1.0 + purse) / 2.0
+
+
+@lru_cache(maxsize=4096)
+def _expected_loot_cached(
+    enemy_key: str, level: int, grade: int, rarity: Rarity
+) -> LootExpectation:
+    from game_sys.items.factory import _TEMPLATES as _ITEM_TEMPLATES
+
+    result = LootExpectation(
+        enemy=enemy_key, level=level, grade=grade, rarity=rarity.name
+    )
+    purse = expected_purse(enemy_key, level, grade, rarity)
+    result.expected_purse = purse
+    result.expected_gold = expected_roll_gold(purse)
+
+    tier = _select_tier(DROP_TABLES.get(enemy_key, []), level, grade)
+    if not tier:
+        return result
+
+    for drop in tier["drops"]:
+        item_id = drop["item_id"]
+        lo, hi = drop.get("min_qty", 1), drop.get("max_qty", 1)
+        copies = _drop_probability(drop.get("chance", 0)) * (lo + hi) / 2.0
+        result.expected_items[item_id] = (
+            result.expected_items.get(item_id, 0.0) + copies
+        )
+
+        base_price = int(_ITEM_TEMPLATES.get(item_id, {}).get("price", 0))
+        dist = result.rarity_distribution.setdefault(item_id, {})
+        for rar_name, p in _rarity_probabilities(
+                drop.get("rarity_weights", {})).items():
+            dist[rar_name] = dist.get(rar_name, 0.0) + copies * p
+            price = scale_stat(base_price, level, grade, Rarity[rar_name])
+            result.expected_item_value[item_id] = (
+                result.expected_item_value.get(item_id, 0.0)
+                + copies * p * price
+            )
+    return result
+
+
+def expected_loot(
+    enemy_key: str,
+    level: int,
+    grade: int = 1,
+    rarity: Union[Rarity, str] = Rarity.COMMON,
+) -> LootExpectation:
+    """
+    Exact expected loot for one kill of `enemy_key` (a DROP_TABLES key,
+    i.e. the lowercased job id) at the given level, grade and rarity.
+    """
+    if isinstance(rarity, str):
+        rarity = Rarity[rarity.upper()]
+    # The cached instance is shared, so hand out a copy
+    return _expected_loot_cached(enemy_key.lower(), int(level), int(grade),
+                                 rarity).copy()
+
+
+def expected_loot_table(
+    enemy_keys: Optional[Iterable[str]] = None,
+    levels: Iterable[int] = (1,),
+    grades: Iterable[int] = (1,),
+    rarities: Iterable[Union[Rarity, str]] = (Rarity.COMMON,),
+) -> List[LootExpectation]:
+    """Cartesian sweep of expected_loot over the given parameters."""
+    keys = list(enemy_keys) if enemy_keys is not None else list(DROP_TABLES)
+    levels, grades, rarities = list(levels), list(grades), list(rarities)
+    return [
+        expected_loot(key, lvl, grd, rar)
+        for key in keys
+        for lvl in levels
+        for grd in grades
+        for rar in rarities
+    ]
+
+
+def export_loot_table(
+    rows: Iterable[LootExpectation],
+    path: Union[str, Path],
+    fmt: Optional[str] = None,
+) -> Path:
+    """
+    Write expectations to `path` as JSON (nested) or CSV (one line per
+    enemy/level/grade/rarity/item/item-rarity). The format is taken from
+    `fmt` or the file suffix.
+    """
+    path = Path(path)
+    fmt = (fmt or path.suffix.lstrip(".") or "json").lower()
+    rows = list(rows)
+    if fmt == "json":
+        path.write_text(
+            json.dumps([r.to_dict() for r in rows], indent=2),
+            encoding="utf-8",
+        )
+    elif fmt == "csv":
+        with path.open("w", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f)
+            writer.writerow([
+                "enemy", "level", "grade", "rarity", "item_id",
+                "item_rarity", "expected_count", "expected_gold",
+            ])
+            for r in rows:
+                if not r.rarity_distribution:
+                    writer.writerow([r.enemy, r.level, r.grade, r.rarity,
+                                     "", "", 0.0, r.expected_gold])
+                for item_id, dist in r.rarity_distribution.items():
+                    for item_rarity, count in dist.items():
+                        writer.writerow([
+                            r.enemy, r.level, r.grade, r.rarity, item_id,
+                            item_rarity, count, r.expected_gold,
+                        ])
+    else:
+        raise ValueError(f"Unsupported export format: {fmt!r}")
+    return path
+
+
+def clear_loot_cache() -> None:
+    """Drop cached expectations (call after mutating drop/item data)."""
+    _expected_loot_cached.cache_clear()
+
+
+# Data files the expectations are computed from
+_SOURCES = frozenset({"drop_tables", "items", "characters"})
+
+
+def _on_data_reloaded(names: List[str], **_: Any) -> None:
+    if _SOURCES.intersection(names):
+        clear_loot_cache()
+
+
+hook_dispatcher.register("data.reloaded", _on_data_reloaded)
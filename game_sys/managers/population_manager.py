@@ -0,0 +1,310 @@
+# game_sys/managers/population_manager.py
+"""
+Vectorized stat scaling for whole populations of actors.
+
+Spawning a wave of enemies one Character at a time runs scale_stat per
+stat per actor. `scale_job_population` does the same job → stats
+pipeline for N actors in a single NumPy pass and returns a
+`PopulationStats` matrix, which `CompactActor` views can read from
+without building a per-actor stats dict.
+
+NumPy is an optional dependency (``pip install game_sys[numpy]``).
+"""
+from __future__ import annotations
+
+import random
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple, Union
+
+try:
+    import numpy as np
+except ImportError:  # optional dependency
+    np = None
+
+from game_sys.core.rarity import Rarity
+from game_sys.core.stats import Stats
+from game_sys.managers.scaling_manager import (
+    STAT_LEVEL_STEP,
+    _GRADE_STATS_MULTIPLIER,
+    _RARITY_MULTIPLIER,
+)
+
+_RESOURCES = ("health", "mana", "stamina")
+
+IntArrayLike = Union[int, Sequence[int], "np.ndarray"]
+RarityArrayLike = Union[Rarity, str, int, Sequence[Union[Rarity, str, int]],
+                        "np.ndarray"]
+
+
+def _require_numpy() -> None:
+    if np is None:
+        raise ImportError(
+            "Population scaling requires NumPy; "
+            "install it with `pip install game_sys[numpy]`."
+        )
+
+
+def _as_int_array(values: IntArrayLike, n: int, name: str) -> "np.ndarray":
+    arr = np.asarray(values, dtype=np.int64)
+    if arr.ndim == 0:
+        return np.full(n, int(arr), dtype=np.int64)
+    if arr.shape != (n,):
+        raise ValueError(f"'{name}' must be a scalar or have shape ({n},)")
+    return arr
+
+
+def _rarity_values(rarities: RarityArrayLike, n: int) -> "np.ndarray":
+    def _value(r: Union[Rarity, str, int]) -> int:
+        if isinstance(r, Rarity):
+            return r.value
+        if isinstance(r, str):
+            return Rarity[r.upper()].value
+        return int(r)
+
+    if isinstance(rarities, (Rarity, str, int)):
+        return np.full(n, _value(rarities), dtype=np.int64)
+    if isinstance(rarities, np.ndarray) and rarities.dtype.kind in "iu":
+        return _as_int_array(rarities, n, "rarities")
+    return _as_int_array([_value(r) for r in rarities], n, "rarities")
+
+
+def _lookup_table(mults: Dict[int, float], size: int) -> "np.ndarray":
+    """Dense index → multiplier array, 1.0 for unknown keys."""
+    table = np.ones(size, dtype=np.float64)
+    for key, mult in mults.items():
+        if 0 <= key < size:
+            table[key] = mult
+    return table
+
+
+class PopulationStats:
+    """
+    Stat matrix for a population: one row per actor, one column per stat.
+
+    Also holds per-actor level/grade/rarity and current resource pools,
+    so lightweight `CompactActor` views can share one set of arrays.
+    """
+
+    def __init__(
+        self,
+        stat_keys: Tuple[str, ...],
+        matrix: "np.ndarray",
+        levels: "np.ndarray",
+        grades: "np.ndarray",
+        rarities: "np.ndarray",
+        job_id: Optional[str] = None,
+    ) -> None:
+        self.stat_keys = stat_keys
+        self.matrix = matrix
+        self.levels = levels
+        self.grades = grades
+        self.rarities = rarities
+        self.job_id = job_id
+        self._columns: Dict[str, int] = {k: i for i, k in enumerate(stat_keys)}
+        # Current HP/MP/ST start full, like Actor.restore_all()
+        self.current: Dict[str, "np.ndarray"] = {
+            res: self.column(res).copy() for res in _RESOURCES
+        }
+
+    def __len__(self) -> int:
+        return self.matrix.shape[0]
+
+    def column(self, stat: str) -> "np.ndarray":
+        """View of one stat across the whole population."""
+        idx = self._columns.get(stat)
+        if idx is None:
+            return np.zeros(len(self), dtype=self.matrix.dtype)
+        return self.matrix[:, idx]
+
+    def value(self, index: int, stat: str) -> int:
+        idx = self._columns.get(stat)
+        return 0 if idx is None else int(self.matrix[index, idx])
+
+    def row(self, index: int) -> Dict[str, int]:
+        """Materialize one actor's stats as a plain dict."""
+        return {k: int(v) for k, v in zip(self.stat_keys, self.matrix[index])}
+
+    def to_stats(self, index: int) -> Stats:
+        """Materialize one actor's row as a full Stats object."""
+        return Stats(self.row(index))
+
+    def alive(self) -> "np.ndarray":
+        """Boolean mask of actors with HP left."""
+        return self.current["health"] > 0
+
+    def actors(self, name: str = "Enemy") -> List["CompactActor"]:
+        return [CompactActor(self, i, f"{name} {i + 1}")
+                for i in range(len(self))]
+
+    def __iter__(self) -> Iterator["CompactActor"]:
+        return iter(self.actors())
+
+
+class CompactActor:
+    """
+    A slotted, matrix-backed actor view: stats are read straight from the
+    population matrix and current resources live in shared arrays.
+    """
+
+    __slots__ = ("population", "index", "name")
+
+    def __init__(self, population: PopulationStats, index: int,
+                 name: str = "Enemy") -> None:
+        self.population = population
+        self.index = index
+        self.name = name
+
+    @property
+    def level(self) -> int:
+        return int(self.population.levels[self.index])
+
+    @property
+    def grade(self) -> int:
+        return int(self.population.grades[self.index])
+
+    @property
+    def rarity(self) -> Rarity:
+        return Rarity(int(self.population.rarities[self.index]))
+
+    @property
+    def stats(self) -> Stats:
+        return self.population.to_stats(self.index)
+
+    @property
+    def attack(self) -> int:
+        return self.population.value(self.index, "attack")
+
+    @property
+    def defense(self) -> int:
+        return self.population.value(self.index, "defense")
+
+    @property
+    def speed(self) -> int:
+        return self.population.value(self.index, "speed")
+
+    @property
+    def intellect(self) -> int:
+        return self.population.value(self.index, "intellect")
+
+    @property
+    def max_health(self) -> int:
+        return self.population.value(self.index, "health")
+
+    @property
+    def max_mana(self) -> int:
+        return self.population.value(self.index, "mana")
+
+    @property
+    def max_stamina(self) -> int:
+        return self.population.value(self.index, "stamina")
+
+    @property
+    def current_health(self) -> int:
+        return int(self.population.current["health"][self.index])
+
+    @current_health.setter
+    def current_health(self, value: int) -> None:
+        self.population.current["health"][self.index] = max(
+            0, min(value, self.max_health))
+
+    @property
+    def current_mana(self) -> int:
+        return int(self.population.current["mana"][self.index])
+
+    @current_mana.setter
+    def current_mana(self, value: int) -> None:
+        self.population.current["mana"][self.index] = max(
+            0, min(value, self.max_mana))
+
+    @property
+    def current_stamina(self) -> int:
+        return int(self.population.current["stamina"][self.index])
+
+    @current_stamina.setter
+    def current_stamina(self, value: int) -> None:
+        self.population.current["stamina"][self.index] = max(
+            0, min(value, self.max_stamina))
+
+    def __repr__(self) -> str:
+        return (f"CompactActor({self.name!r}, level={self.level}, "
+                f"HP={self.current_health}/{self.max_health})")
+
+
+def scale_job_population(
+    job_id: str,
+    levels: IntArrayLike,
+    grades: IntArrayLike = 1,
+    rarities: RarityArrayLike = Rarity.COMMON,
+    rng: Optional[Union[int, "np.random.Generator", random.Random]] = None,
+) -> PopulationStats:
+    """
+    Scale a job template's base stats for a whole population at once.
+
+    Reproduces what `Character.assign_job_by_id` does per actor —
+    `create_job(job_id, level)` followed by scaling the job's stats by
+    the actor's level, grade and rarity — as array operations. Range
+    specs (``{"min", "max"}``) are rolled once per actor from `rng`
+    (a seed, a NumPy Generator, or a random.Random used to seed one).
+
+    Args:
+        job_id: Job template id (as in jobs.json).
+        levels: Level per actor; its length sets the population size.
+        grades: Grade per actor, or one grade for everyone.
+        rarities: Rarity per actor (enum, name or value), or one for all.
+
+    Returns:
+        PopulationStats with columns ordered like Stats.stat_keys().
+    """
+    _require_numpy()
+    from game_sys.jobs.factory import _TEMPLATES as _JOB_TEMPLATES
+    from game_sys.jobs.base import Job as BaseJob
+
+    template = _JOB_TEMPLATES.get(job_id.lower())
+    if template is None:
+        raise KeyError(f"No job template for id={job_id!r}")
+
+    lv = np.atleast_1d(np.asarray(levels, dtype=np.int64))
+    n = lv.shape[0]
+    gr = _as_int_array(grades, n, "grades")
+    rv = _rarity_values(rarities, n)
+
+    if isinstance(rng, random.Random):
+        rng = np.random.default_rng(rng.getrandbits(64))
+    elif not isinstance(rng, np.random.Generator):
+        rng = np.random.default_rng(rng)
+
+    base_stats: Dict[str, Any] = template.get("base_stats", {})
+    keys: List[str] = list(Stats.stat_keys())
+    for key in list(base_stats) + list(BaseJob.base_stats):
+        if key not in keys:
+            keys.append(key)
+
+    # Raw template values, rolling any ranges per actor
+    raw = np.zeros((n, len(keys)), dtype=np.float64)
+    for col, key in enumerate(keys):
+        spec = base_stats.get(key)
+        if spec is None:
+            continue
+        if isinstance(spec, dict):
+            lo = int(spec.get("min", 0))
+            hi = int(spec.get("max", lo))
+            raw[:, col] = (rng.integers(lo, hi, size=n, endpoint=True)
+                           if hi > lo else lo)
+        else:
+            raw[:, col] = int(spec)
+
+    # Same float operations (and order) as the scalar factor tables, so
+    # rounding matches scale_stat exactly.
+    level_mult = (1.0 + (lv * STAT_LEVEL_STEP))[:, None]
+    grade_mult = _lookup_table(_GRADE_STATS_MULTIPLIER, 64)[
+        np.clip(gr, 0, 63)][:, None]
+    rarity_mult = _lookup_table(
+        {r.value: m for r, m in _RARITY_MULTIPLIER.items()}, 64)[
+        np.clip(rv, 0, 63)][:, None]
+
+    # 1) create_job(job_id, level): grade 1 / COMMON, so level only
+    job_stats = np.rint(raw * level_mult)
+    # 2) assign_job_by_id: scale job stats by the actor's level/grade/rarity
+    matrix = np.rint(job_stats * level_mult * grade_mult * rarity_mult)
+    matrix = matrix.astype(np.int64)
+    # Keys absent from the template stay 0 (as assign_job_by_id pads them)
+    return PopulationStats(tuple(keys), matrix, lv, gr, rv, job_id=job_id)
@@ -1,13 +1,117 @@
 # game_sys/managers/scaling_manager.py
 
-from typing import Tuple, Dict, Union, List
+from typing import Tuple, Dict, Union, List, Optional, Sequence
 import random
 from game_sys.core.rarity import Rarity
 from game_sys.config.config import (
     RARITY_STATS_MULTIPLIER as _RARITY_STATS_MULTIPLIER,
     GRADE_STATS_MULTIPLIER as _GRADE_STATS_MULTIPLIER,
+    DEFAULT_MAX_LEVEL as _DEFAULT_MAX_LEVEL,
 )
 
+# Per-level growth used by scale_stat and scale_damage_map respectively
+STAT_LEVEL_STEP: float = 0.10
+DAMAGE_LEVEL_STEP: float = 0.05
+
+# (level multiplier, grade multiplier, rarity multiplier)
+ScaleFactors = Tuple[float, float, float]
+_FactorKey = Tuple[int, int, Rarity]
+
+# Enum-keyed view of the config table (config keys are rarity names)
+_RARITY_MULTIPLIER: Dict[Rarity, float] = {}
+_STAT_FACTORS: Dict[_FactorKey, ScaleFactors] = {}
+_DAMAGE_FACTORS: Dict[_FactorKey, ScaleFactors] = {}
+
+
+def _coerce_rarity(rarity: Union[Rarity, str, None]) -> Optional[Rarity]:
+    if isinstance(rarity, Rarity):
+        return rarity
+    if isinstance(rarity, str) and rarity.upper() in Rarity.__members__:
+        return Rarity[rarity.upper()]
+    return None
+
+
+def _build_rarity_multipliers() -> None:
+    _RARITY_MULTIPLIER.clear()
+    for name, mult in _RARITY_STATS_MULTIPLIER.items():
+        rarity = _coerce_rarity(name)
+        if rarity is not None:
+            _RARITY_MULTIPLIER[rarity] = mult
+
+
+def build_multiplier_tables(max_level: int = _DEFAULT_MAX_LEVEL) -> None:
+    """
+    (Re)build the level × grade × rarity factor tables from config.
+    The tables otherwise fill in lazily as keys are looked up, so this is
+    only needed for eager warm-up (game_sys.init) or after changing the
+    config multipliers. Levels above `max_level` are computed on demand.
+    """
+    _build_rarity_multipliers()
+    _STAT_FACTORS.clear()
+    _DAMAGE_FACTORS.clear()
+    for level in range(0, max_level + 1):
+        stat_lm = 1.0 + (level * STAT_LEVEL_STEP)
+        dmg_lm = 1.0 + (level * DAMAGE_LEVEL_STEP)
+        for grade, grade_mult in _GRADE_STATS_MULTIPLIER.items():
+            for rarity in Rarity:
+                rarity_mult = _RARITY_MULTIPLIER.get(rarity, 1.0)
+                key = (level, grade, rarity)
+                _STAT_FACTORS[key] = (stat_lm, grade_mult, rarity_mult)
+                _DAMAGE_FACTORS[key] = (dmg_lm, grade_mult, rarity_mult)
+
+
+def _lookup(
+    table: Dict[_FactorKey, ScaleFactors],
+    step: float,
+    level: int,
+    grade: int,
+    rarity: Union[Rarity, str],
+) -> ScaleFactors:
+    try:
+        return table[(level, grade, rarity)]
+    except (KeyError, TypeError):
+        # Not built yet, out-of-table level/grade, or a rarity given by name
+        rarity_enum = _coerce_rarity(rarity)
+        factors = (
+            1.0 + (level * step),
+            _GRADE_STATS_MULTIPLIER.get(grade, 1.0),
+            _RARITY_MULTIPLIER.get(rarity_enum, 1.0),
+        )
+        if (rarity_enum is rarity and grade in _GRADE_STATS_MULTIPLIER
+                and 0 <= level <= _DEFAULT_MAX_LEVEL):
+            table[(level, grade, rarity_enum)] = factors
+        return factors
+
+
+def stat_factors(
+    level: int, grade: int, rarity: Union[Rarity, str]
+) -> ScaleFactors:
+    """Level, grade and rarity multipliers applied by scale_stat."""
+    return _lookup(_STAT_FACTORS, STAT_LEVEL_STEP, level, grade, rarity)
+
+
+def damage_factors(
+    level: int, grade: int, rarity: Union[Rarity, str]
+) -> ScaleFactors:
+    """Level, grade and rarity multipliers applied by scale_damage_map."""
+    return _lookup(_DAMAGE_FACTORS, DAMAGE_LEVEL_STEP, level, grade, rarity)
+
+
+def stat_multiplier(level: int, grade: int, rarity: Union[Rarity, str]) -> float:
+    """Combined scale_stat multiplier for (level, grade, rarity)."""
+    lm, gm, rm = stat_factors(level, grade, rarity)
+    return lm * gm * rm
+
+
+def _split_range(base_range: Union[int, Tuple[int, int]]) -> Tuple[int, int]:
+    if isinstance(base_range, int):
+        return base_range, base_range
+    try:
+        min_base, max_base = base_range
+    except Exception as e:
+        raise ValueError(f"Invalid base_range {base_range!r}") from e
+    return min_base, max_base
+
 
 def scale_stat(
     base_range: Union[int, Tuple[int, int]],
@@ -19,20 +123,46 @@ def scale_stat(
     Pick a “raw” value from base_range, then bump it
     by level, grade, and rarity multipliers.
     """
-    if isinstance(base_range, int):
-        min_base, max_base = base_range, base_range
-    else:
-        try:
-            min_base, max_base = base_range
-        except Exception as e:
-            raise ValueError(f"Invalid base_range {base_range!r}") from e
-
+    min_base, max_base = _split_range(base_range)
     raw = random.randint(min_base, max_base)
-    level_mult = 1.0 + (level * 0.10)  # 10% per level
-    grade_mult = _GRADE_STATS_MULTIPLIER.get(grade, 1.0)
-    rarity_mult = _RARITY_STATS_MULTIPLIER.get(rarity, 1.0)
+    lm, gm, rm = stat_factors(level, grade, rarity)
+    return int(round(raw * lm * gm * rm))
+
+
+def scale_values(
+    values: Sequence[int],
+    level: int,
+    grade: int,
+    rarity: Rarity,
+) -> List[int]:
+    """
+    Scale a sequence of already-rolled raw values in one pass with a
+    single factor lookup. Equivalent to scale_stat(v, ...) for each v.
+    """
+    lm, gm, rm = stat_factors(level, grade, rarity)
+    return [int(round(v * lm * gm * rm)) for v in values]
 
-    return int(round(raw * level_mult * grade_mult * rarity_mult))
+
+def scale_stat_map(
+    base_map: Dict[str, Union[int, Tuple[int, int]]],
+    level: int,
+    grade: int,
+    rarity: Rarity,
+    rng: Optional[random.Random] = None,
+) -> Dict[str, int]:
+    """
+    Scale a whole stat dict with a single factor lookup. Range entries
+    are rolled with `rng` (or the global random module, like scale_stat);
+    a range whose max is below its min yields its min.
+    """
+    roll = (rng or random).randint
+    lm, gm, rm = stat_factors(level, grade, rarity)
+    scaled: Dict[str, int] = {}
+    for stat, spec in base_map.items():
+        lo, hi = _split_range(spec)
+        raw = lo if hi <= lo else roll(lo, hi)
+        scaled[stat] = int(round(raw * lm * gm * rm))
+    return scaled
 
 
 def scale_damage_map(
@@ -41,14 +171,14 @@ def scale_damage_map(
     grade: int,
     rarity: Rarity,
 ) -> Dict[str, int]:
-    scaled = {}
-    for dtype_str, amt in base_damage_map.items():
-        level_mult = 1.0 + (item_level * 0.05)
-        grade_mult = _GRADE_STATS_MULTIPLIER.get(grade, 1.0)
-        rarity_mult = _RARITY_STATS_MULTIPLIER.get(rarity, 1.0)
-        final_amt = int(round(amt * level_mult * grade_mult * rarity_mult))
-        scaled[dtype_str] = final_amt
-    return scaled
+    lm, gm, rm = damage_factors(item_level, grade, rarity)
+    return {
+        dtype: int(round(amt * lm * gm * rm))
+        for dtype, amt in base_damage_map.items()
+    }
+
+
+_build_rarity_multipliers()
 
 
 def get_rarity_weight(r: Rarity) -> float:
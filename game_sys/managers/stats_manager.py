@@ -19,6 +19,11 @@ class StatsManager:
       - Emit hooks for other systems to react
     """
 
+    # (stats, base at origin, multiplier at origin, base last written)
+    # for rescale(); a class default so __new__-built managers (save
+    # loading, spawner clones) start without one
+    _scale_origin = None
+
     def __init__(self, actor: Any) -> None:
         """
         Initialize the StatsManager with the owning actor.
@@ -43,10 +48,9 @@ class StatsManager:
         Returns:
             Stats: The recalculated stats for the actor.
         """
-        from game_sys.managers.scaling_manager import scale_stat
+        from game_sys.managers.scaling_manager import scale_stat_map
         from game_sys.core.rarity import Rarity
 
-        stats_data: Dict[str, int] = {}
         # Use job-defined stat_mods (base value per stat) for scaling
         job = getattr(self.actor, 'job', None)
         if job and hasattr(job, 'stats_mods'):
@@ -54,18 +58,13 @@ class StatsManager:
         else:
             base_mods = {}
 
-        # Scale each stat using existing scale_stat logic
-        level = self.levels.lvl
-        grade = getattr(self.actor, 'grade', 1)
-        rarity = getattr(self.actor, 'rarity', Rarity.COMMON)
-        for stat_name, base_value in base_mods.items():
-            # Wrap single value into tuple for deterministic scaling
-            stats_data[stat_name] = scale_stat(
-                (base_value, base_value),
-                level=level,
-                grade=grade,
-                rarity=rarity,
-            )
+        # Scale the whole stat dict with one multiplier-table lookup
+        stats_data: Dict[str, int] = scale_stat_map(
+            base_mods,
+            level=self.levels.lvl,
+            grade=getattr(self.actor, 'grade', 1),
+            rarity=getattr(self.actor, 'rarity', Rarity.COMMON),
+        )
 
         # Ensure all stats from BaseJob exist
         try:
@@ -77,9 +76,47 @@ class StatsManager:
 
         return Stats(stats_data)
 
+    def rescale(self, old_level: int) -> None:
+        """
+        Rescale base stats in place after a level change from
+        `old_level`. Named and simple modifiers (equipment, statuses,
+        enchantments) are kept, and rolled job stats are not re-rolled:
+        each base value is scaled by the ratio of the stat multipliers.
+
+        The scaling starts from the base values as they were when they
+        were last set from outside, so repeated level-ups do not
+        accumulate rounding error.
+        """
+        from game_sys.managers.scaling_manager import stat_multiplier
+        from game_sys.core.rarity import Rarity
+
+        stats = self.stats
+        grade = getattr(self.actor, 'grade', 1)
+        rarity = getattr(self.actor, 'rarity', Rarity.COMMON)
+        origin = self._scale_origin
+        if (origin is None or origin[0] is not stats
+                or stats.base != origin[3]):
+            # Base was (re)built or edited since our last rescale
+            origin_base = dict(stats.base)
+            origin_mult = stat_multiplier(old_level, grade, rarity)
+        else:
+            _, origin_base, origin_mult, _ = origin
+        factor = stat_multiplier(self.levels.lvl, grade, rarity) / origin_mult
+        stats.set_bases({
+            stat: int(round(value * factor))
+            for stat, value in origin_base.items()
+        })
+        self._scale_origin = (stats, origin_base, origin_mult, dict(stats.base))
+        hook_dispatcher.fire(
+            "actor.stats_updated", actor=self.actor, stats=stats
+        )
+
     def add_experience(self, amount: int) -> None:
         """
-        Add experience points and handle level-ups.
+        Add experience points and handle level-ups. This is the single
+        entry point for XP: Levels works out the new level in one step
+        and, on a level change, calls `rescale` once and fires one
+        aggregated `character.level_up`.
 
         Args:
             amount: Experience points to add (must be non-negative).
@@ -90,25 +127,11 @@ class StatsManager:
         if amount < 0:
             raise ValueError("Experience amount must be non-negative.")
 
-        old_lvl = self.levels.lvl
-        # Increase experience
-        self.levels.experience = self.levels.experience + amount
+        self.levels.add_experience(amount)
         hook_dispatcher.fire(
             "character.experience_added", actor=self.actor, amount=amount
         )
 
-        # Check for level-up
-        new_lvl = self.levels.lvl
-        if new_lvl > old_lvl:
-            hook_dispatcher.fire(
-                "character.level_up", actor=self.actor, new_level=new_lvl
-            )
-            # Recalculate stats on level-up
-            self.stats = self.calculate_stats()
-            hook_dispatcher.fire(
-                "actor.stats_updated", actor=self.actor, stats=self.stats
-            )
-
     def assign_job(self, job_id: str) -> None:
         """
         Assign a new job to the actor and recalculate stats.
@@ -125,8 +148,8 @@ class StatsManager:
             from game_sys.jobs.factory import create_job
             self.actor.job = create_job(job_id)
 
-        # Recalculate stats after job change
-        self.stats = self.calculate_stats()
+        # Recalculate base stats after job change, keeping modifiers
+        self.stats.set_bases(self.calculate_stats().base)
         hook_dispatcher.fire(
             "actor.stats_updated", actor=self.actor, stats=self.stats
         )
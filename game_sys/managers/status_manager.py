@@ -0,0 +1,125 @@
+# game_sys/managers/status_manager.py
+"""
+StatusManager: applies, stacks and expires an actor's status effects.
+
+A status's stat mods live in the actor's Stats as the named modifier
+"status:<name>" for as long as the status is active, so buffs show up
+in every effective stat without per-access work. Mods that are not
+stats (currently only "DamageReduction", a percentage) are summed into
+`damage_reduction` whenever the set of statuses changes, so damage
+calculation reads one precomputed number per hit.
+"""
+from typing import Any, Dict, List
+
+from game_sys.core.stats import Stats
+from game_sys.effects.status import STACK_COUNT, STACK_MAX, StatusEffect
+from game_sys.hooks.hooks import hook_dispatcher
+from logs.logs import get_logger
+
+log = get_logger(__name__)
+
+# Cap on the fraction of damage statuses can prevent
+MAX_STATUS_REDUCTION = 0.75
+
+
+def _modifier_id(name: str) -> str:
+    return f"status:{name}"
+
+
+class StatusManager:
+    """
+    Owns the stacking rules and Stats bookkeeping for `actor.statuses`.
+    Expiry timing is left to the actor's StatusScheduler.
+    """
+
+    def __init__(self, actor: Any) -> None:
+        self.actor = actor
+        # Fraction of incoming damage prevented by active statuses
+        self.damage_reduction: float = 0.0
+
+    def apply(self, status: StatusEffect) -> StatusEffect:
+        """
+        Attach `status`, or merge it into the active status of the same
+        name according to the active one's stacking rule. Returns the
+        status instance that is now active.
+        """
+        actor = self.actor
+        active = actor.statuses.get(status.name)
+        if active is None:
+            if status.is_scheduled():
+                # Shared instance already running on another actor
+                status = status.detached_copy()
+            actor.statuses[status.name] = status
+            actor.status_scheduler.schedule(actor, status, status.duration)
+        else:
+            self._merge(active, status)
+            status = active
+        self._sync(status)
+        return status
+
+    def _merge(self, active: StatusEffect, incoming: StatusEffect) -> None:
+        if active.stacking == STACK_MAX:
+            mods = dict(active.stat_mods)
+            for stat, amount in incoming.stat_mods.items():
+                mods[stat] = max(mods.get(stat, amount), amount)
+            active.stat_mods = mods
+            if incoming.duration > active.duration:
+                active.duration = incoming.duration
+            return
+        if active.stacking == STACK_COUNT:
+            active.stacks = min(active.stacks + incoming.stacks, active.max_stacks)
+        active.stat_mods = dict(incoming.stat_mods)
+        active.duration = incoming.duration
+
+    def expire(self, status: StatusEffect) -> None:
+        """Called by the scheduler when `status` runs out."""
+        actor = self.actor
+        actor.statuses.pop(status.name, None)
+        self._sync(status, active=False)
+        actor.mark_dirty("statuses")
+        log.info("%s's status '%s' has expired.", actor.name, status.name)
+        hook_dispatcher.fire("actor.status_expired", actor=actor, effect=status)
+
+    def remove(self, name: str) -> bool:
+        """Drop the status called `name` before it expires."""
+        status = self.actor.statuses.pop(name, None)
+        if status is None:
+            return False
+        status._scheduler = None
+        self._sync(status, active=False)
+        self.actor.mark_dirty("statuses")
+        return True
+
+    def clear(self) -> None:
+        """Drop every status and its modifiers."""
+        actor = self.actor
+        if not actor.statuses:
+            return
+        for name, status in actor.statuses.items():
+            status._scheduler = None
+            actor.stats.remove_modifier(_modifier_id(name))
+        actor.statuses.clear()
+        self.damage_reduction = 0.0
+        actor.mark_dirty("statuses")
+
+    def active(self) -> List[StatusEffect]:
+        return list(self.actor.statuses.values())
+
+    def _sync(self, status: StatusEffect, active: bool = True) -> None:
+        """Mirror `status` into Stats and refresh the damage reduction."""
+        stats = self.actor.stats
+        keys = Stats.stat_keys()
+        mods: Dict[str, int] = {}
+        if active:
+            mods = {k: v for k, v in status.total_mods().items() if k in keys}
+        if mods:
+            stats.set_modifiers(_modifier_id(status.name), mods)
+        else:
+            stats.remove_modifier(_modifier_id(status.name))
+        self._refresh_reduction()
+
+    def _refresh_reduction(self) -> None:
+        percent = 0
+        for status in self.actor.statuses.values():
+            percent += status.stat_mods.get("DamageReduction", 0) * status.stacks
+        self.damage_reduction = min(percent / 100.0, MAX_STATUS_REDUCTION)
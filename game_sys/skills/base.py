@@ -1,8 +1,9 @@
 # game_sys/skills/skill_base.py
 
-from typing import List, Any, Dict
+from typing import List, Any, Dict, Optional
 from game_sys.character.actor import Actor
 from game_sys.combat.combat import CombatCapabilities
+from game_sys.skills.cooldowns import CooldownManager
 
 
 class Skill:
@@ -28,8 +29,69 @@ class Skill:
         self.stamina_cost: int = stamina_cost
         self.cooldown: int = cooldown
         self.effects: List[Any] = list(effects)
-        self._current_cooldown: int = 0
+        # Absolute turn (on self.cooldowns' clock) the skill is ready
+        self._ready_at: int = 0
+        self._cooldown_seq: int = -1
+        self._cooldowns: Optional[CooldownManager] = None
+        self._cooldown_owner: Optional[Actor] = None
         self.requirements: Dict[str, int] = requirements or {}
+        # Set for skills created from a compiled definition
+        self.definition: Any = None
+
+    @classmethod
+    def from_definition(cls, definition: Any, effects: Any) -> "Skill":
+        """
+        A skill instance over a shared SkillDefinition. Its attributes
+        reference the definition's values (and `effects` is shared), so
+        creating one allocates nothing but the instance itself.
+        """
+        skill = cls.__new__(cls)
+        skill.__dict__.update(
+            id=definition.skill_id,
+            name=definition.name,
+            description=definition.description,
+            mana_cost=definition.mana_cost,
+            stamina_cost=definition.stamina_cost,
+            cooldown=definition.cooldown,
+            effects=effects,
+            _ready_at=0,
+            _cooldown_seq=-1,
+            _cooldowns=None,
+            _cooldown_owner=None,
+            requirements=definition.requirements,
+            definition=definition,
+        )
+        return skill
+
+    @property
+    def cooldowns(self) -> CooldownManager:
+        """
+        The clock this skill's cooldown runs on: its LearningSystem's
+        (or a combat engine's) manager, or a private one until adopted.
+        """
+        if self._cooldowns is None:
+            self._cooldowns = CooldownManager()
+        return self._cooldowns
+
+    @property
+    def _current_cooldown(self) -> int:
+        """Turns left until the skill is ready."""
+        return max(0, self._ready_at - self.cooldowns.now)
+
+    @_current_cooldown.setter
+    def _current_cooldown(self, turns: int) -> None:
+        self.cooldowns.start(self, turns)
+
+    def __copy__(self) -> "Skill":
+        # A copy starts on its own clock with the same remaining turns;
+        # adopt it into a LearningSystem to share that clock.
+        clone = Skill.__new__(type(self))
+        clone.__dict__.update(self.__dict__)
+        clone._cooldowns = None
+        clone._cooldown_seq = -1
+        clone._ready_at = 0
+        clone._current_cooldown = self._current_cooldown
+        return clone
 
     def can_cast(self, caster: Actor) -> bool:
         """
@@ -38,13 +100,27 @@ class Skill:
         if (caster.current_mana < self.mana_cost or
                 caster.current_stamina < self.stamina_cost):
             return False
-        if self._current_cooldown > 0:
+        if self._cooldowns is not None and self._ready_at > self._cooldowns.now:
             return False
         for req, amount in self.requirements.items():
             if getattr(caster, req, 0) < amount:
                 return False
         return True
 
+    def expected_damage(self, caster: Actor, target: Actor) -> float:
+        """Mean damage of this skill's damage effects on `target`."""
+        return sum(
+            eff.expected_damage(caster, target)
+            for eff in self.effects if hasattr(eff, "expected_damage")
+        )
+
+    def expected_heal(self) -> float:
+        """Mean HP restored by this skill's heal effects."""
+        return sum(
+            eff.expected_heal()
+            for eff in self.effects if hasattr(eff, "expected_heal")
+        )
+
     def use(
         self,
         caster: Actor,
@@ -78,7 +154,10 @@ class Skill:
                 )
 
         # (C) Set cooldown
-        self._current_cooldown = self.cooldown
+        self.cooldowns.start(self, self.cooldown, caster)
+        learning = getattr(caster, "learning", None)
+        if learning is not None:
+            learning.dirty = True
         from game_sys.hooks.hooks import hook_dispatcher
         hook_dispatcher.fire("skill.after_use", actor=caster, skill=self, result="\n".join(log_parts))
         # (D) Combine all logs into one response string
@@ -88,10 +167,18 @@ class Skill:
 
     def tick_cooldown(self) -> None:
         """
-        Decrement cooldown by 1 (clamped at zero).
+        Take one turn off this skill's cooldown only (clamped at zero),
+        without advancing its clock. Fires `skill.cooldown_ready` if
+        that ends the cooldown. Turn-based code should advance the
+        CooldownManager instead.
         """
-        if self._current_cooldown > 0:
-            self._current_cooldown -= 1
-        from game_sys.hooks.hooks import hook_dispatcher
-        hook_dispatcher.fire("skill.tick_cooldown", skill=self, remaining_cooldown=self._current_cooldown)
-        
+        remaining = self._current_cooldown
+        if remaining <= 0:
+            return
+        self.cooldowns.start(self, remaining - 1)
+        if remaining == 1:
+            from game_sys.hooks.hooks import hook_dispatcher
+            hook_dispatcher.fire(
+                "skill.cooldown_ready", skill=self, actor=self._cooldown_owner
+            )
+
@@ -0,0 +1,103 @@
+# game_sys/skills/cooldowns.py
+"""
+Turn clock for skill cooldowns.
+
+Instead of decrementing every skill's counter each turn, a skill stores
+the absolute turn it is ready again (`_ready_at`) and a CooldownManager
+keeps the clock plus a min-heap of pending ready-turns. Checking a
+cooldown is one comparison, advancing the clock only touches skills
+that actually become ready, and `skill.cooldown_ready` fires once per
+skill as its cooldown ends.
+
+Each LearningSystem owns a manager; CombatEngine binds all
+participants to one shared manager for the length of a fight.
+"""
+from __future__ import annotations
+
+import heapq
+from itertools import count
+from typing import Any, List, Optional, Tuple, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from game_sys.skills.base import Skill
+
+
+class CooldownManager:
+    """Turn counter plus a heap of (ready_turn, seq, skill)."""
+
+    def __init__(self) -> None:
+        self.now: int = 0
+        self._heap: List[Tuple[int, int, "Skill"]] = []
+        self._seq = count()
+
+    def __len__(self) -> int:
+        """Pending heap entries (may include superseded ones)."""
+        return len(self._heap)
+
+    def start(self, skill: "Skill", turns: int, owner: Any = None) -> None:
+        """
+        Put `skill` on cooldown for `turns` turns from now. `owner` is
+        reported with `skill.cooldown_ready`; it is kept from earlier
+        calls when omitted.
+        """
+        skill._cooldowns = self
+        if owner is not None:
+            skill._cooldown_owner = owner
+        skill._ready_at = self.now + max(0, turns)
+        # The sequence number marks the live entry; older entries for
+        # the same skill are skipped when popped
+        skill._cooldown_seq = seq = next(self._seq)
+        if turns > 0:
+            heapq.heappush(self._heap, (skill._ready_at, seq, skill))
+
+    def remaining(self, skill: "Skill") -> int:
+        return max(0, skill._ready_at - self.now)
+
+    def adopt(self, skill: "Skill", owner: Any = None) -> None:
+        """Move `skill` onto this clock, keeping its remaining turns."""
+        if skill._cooldowns is not self:
+            self.start(skill, skill._current_cooldown, owner)
+
+    def release(self, skill: "Skill") -> None:
+        """
+        Take `skill` off this clock; its pending entry is skipped and
+        no `skill.cooldown_ready` fires for it.
+        """
+        if skill._cooldowns is self:
+            skill._cooldowns = None
+            skill._cooldown_seq = -1
+            skill._ready_at = 0
+            skill._cooldown_owner = None
+
+    def advance(self, turns: int = 1) -> List["Skill"]:
+        """
+        Move the clock forward and return the skills whose cooldown
+        ended, firing `skill.cooldown_ready` for each.
+        """
+        self.now += turns
+        heap = self._heap
+        if not heap or heap[0][0] > self.now:
+            return []
+        from game_sys.hooks.hooks import hook_dispatcher
+        ready: List["Skill"] = []
+        while heap and heap[0][0] <= self.now:
+            _, seq, skill = heapq.heappop(heap)
+            # Entries superseded by a later start() or a move to
+            # another manager are skipped
+            if skill._cooldowns is not self or skill._cooldown_seq != seq:
+                continue
+            ready.append(skill)
+            hook_dispatcher.fire(
+                "skill.cooldown_ready", skill=skill, actor=skill._cooldown_owner
+            )
+        return ready
+
+    def next_ready(self) -> Optional[int]:
+        """Turn at which the next pending cooldown ends, if any."""
+        heap = self._heap
+        while heap:
+            ready_at, seq, skill = heap[0]
+            if skill._cooldowns is self and skill._cooldown_seq == seq:
+                return ready_at
+            heapq.heappop(heap)
+        return None
@@ -0,0 +1,162 @@
+# game_sys/skills/definition.py
+"""
+Compiled, shared skill definitions.
+
+A SkillDefinition is built once per skills.json template: costs,
+requirements and effect specs are resolved and frozen, damage specs are
+parsed into (DamageType, low, high) rolls, and effects that need no
+per-actor numbers are built once and shared. Learning a skill then only
+rolls and scales the damage numbers; every distinct result is cached on
+the definition, so thousands of actors with the same kit share their
+effect objects instead of each building their own.
+"""
+from __future__ import annotations
+
+import random
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import Any, Dict, Hashable, Mapping, Optional, Tuple
+
+from game_sys.core.damage_types import DamageType
+from game_sys.core.rarity import Rarity
+from game_sys.effects.base import Effect, EffectSpec, compile_effect
+from game_sys.managers.scaling_manager import (
+    _GRADE_STATS_MULTIPLIER as _GRADE_MODIFIERS,
+    scale_damage_map,
+)
+
+# (damage type, low, high, ranged) per entry of a Damage effect; ranged
+# entries were {"min", "max"} specs and consume one RNG roll
+DamageRoll = Tuple[DamageType, int, int, bool]
+
+# Scaled effect tuples kept per definition before the cache is reset
+MAX_VARIANTS = 1024
+
+
+def _damage_rolls(spec: EffectSpec, skill_id: str) -> Tuple[DamageRoll, ...]:
+    rolls = []
+    for dt_str, amount in spec.data.get("damage", {}).items():
+        try:
+            dt = DamageType[dt_str.upper()]
+        except KeyError:
+            # A typo would otherwise compile to a skill without that damage
+            raise ValueError(
+                f"Skill '{skill_id}': unknown damage type {dt_str!r}"
+            ) from None
+        if isinstance(amount, Mapping):
+            lo = int(amount.get("min", 0))
+            rolls.append((dt, lo, int(amount.get("max", lo)), True))
+        else:
+            rolls.append((dt, int(amount), int(amount), False))
+    return tuple(rolls)
+
+
+@dataclass(frozen=True)
+class SkillDefinition:
+    """
+    The immutable part of a skill, shared by every instance.
+
+    `effects` holds one unscaled effect per slot (shared when the effect
+    type is reusable). Damage slots are rebuilt with scaled numbers by
+    `effects_for`.
+    """
+    skill_id: str
+    name: str
+    description: str
+    mana_cost: int
+    stamina_cost: int
+    cooldown: int
+    requirements: Mapping[str, int]
+    effect_specs: Tuple[EffectSpec, ...]
+    effects: Tuple[Effect, ...]
+    # Damage rolls per effect slot; None for slots that are not scaled
+    damage_rolls: Tuple[Optional[Tuple[DamageRoll, ...]], ...]
+    # The template dict this was compiled from, to detect reloads
+    source: Mapping[str, Any] = field(repr=False, compare=False)
+    _variants: Dict[Hashable, Tuple[Effect, ...]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+
+    @classmethod
+    def compile(cls, template: Mapping[str, Any]) -> SkillDefinition:
+        specs = tuple(compile_effect(e) for e in template.get("effects", []))
+        return cls(
+            skill_id=template["skill_id"],
+            name=template.get("name", ""),
+            description=template.get("description", ""),
+            mana_cost=int(template.get("mana_cost", 0)),
+            stamina_cost=int(template.get("stamina_cost", 0)),
+            cooldown=int(template.get("cooldown", 0)),
+            requirements=MappingProxyType(
+                {k: int(v) for k, v in (template.get("requirements") or {}).items()}
+            ),
+            effect_specs=specs,
+            effects=tuple(spec.build() for spec in specs),
+            damage_rolls=tuple(
+                _damage_rolls(spec, template["skill_id"])
+                if spec.type_name == "Damage" else None
+                for spec in specs
+            ),
+            source=template,
+        )
+
+    @property
+    def reusable(self) -> bool:
+        """True if every effect can be shared between skill instances."""
+        return all(spec.effect_cls.reusable for spec in self.effect_specs)
+
+    def effects_for(
+        self,
+        level: Optional[int],
+        grade: int = 1,
+        rarity: Rarity = Rarity.COMMON,
+        rng: Optional[random.Random] = None,
+    ) -> Tuple[Effect, ...]:
+        """
+        Effects for one skill instance: damage rolled (ranged specs use
+        `rng`) and scaled by level, grade and rarity. Equal results share
+        the same effect objects.
+        """
+        if level is None or not any(self.damage_rolls):
+            return self._fresh(self.effects)
+        if rng is None:
+            rng = random.Random()
+
+        key = []
+        for rolls in self.damage_rolls:
+            if rolls is None:
+                key.append(None)
+                continue
+            raw = {
+                dt: (rng.randint(lo, hi) if ranged and hi >= lo else lo)
+                for dt, lo, hi, ranged in rolls
+            }
+            scaled = scale_damage_map(raw, level, grade=grade, rarity=rarity)
+            modifier = _GRADE_MODIFIERS.get(grade, 1.0)
+            key.append(tuple((dt.name, int(dmg * modifier)) for dt, dmg in scaled.items()))
+        key = tuple(key)
+
+        effects = self._variants.get(key)
+        if effects is None:
+            if len(self._variants) >= MAX_VARIANTS:
+                self._variants.clear()
+            effects = self._variants[key] = tuple(
+                effect if scaled is None else self._build_scaled(spec, scaled)
+                for effect, spec, scaled in zip(self.effects, self.effect_specs, key)
+            )
+        return self._fresh(effects)
+
+    @staticmethod
+    def _build_scaled(spec: EffectSpec, scaled: Tuple[Tuple[str, int], ...]) -> Effect:
+        data = dict(spec.data)
+        data["damage"] = dict(scaled)
+        return spec.effect_cls.from_dict(data)
+
+    def _fresh(self, effects: Tuple[Effect, ...]) -> Tuple[Effect, ...]:
+        # Effects that keep per-application state are never shared
+        if self.reusable:
+            return effects
+        return tuple(
+            effect if spec.effect_cls.reusable else spec.build()
+            for effect, spec in zip(effects, self.effect_specs)
+        )
@@ -1,15 +1,21 @@
 # File: game_sys/skills/learning.py
 
 from __future__ import annotations
+import hashlib
 import json
+import threading
 from pathlib import Path
-from typing import Dict, List, Optional, Set, Union
+from typing import Any, Dict, List, Optional, Set, Union
 import random
 
+from game_sys.core.game_data import game_data
 from game_sys.core.rarity import Rarity
 from game_sys.effects.base import Effect
 from game_sys.skills.base import Skill
+from game_sys.skills.cooldowns import CooldownManager
+from game_sys.skills.definition import SkillDefinition
 from game_sys.skills.factory import create_skill
+from game_sys.skills.skill_tree import SkillFrontier, SkillTree
 from typing import TYPE_CHECKING
 if TYPE_CHECKING:
     from game_sys.character.actor import Actor
@@ -52,6 +58,8 @@ class SkillRecord:
         self.requirements = requirements or {}
         self.grade = grade
         self.rarity = rarity
+        # Compiled form when loaded from skill data (load_from_data)
+        self.definition: Optional[SkillDefinition] = None
 
     def can_character_learn(
         self,
@@ -65,6 +73,10 @@ class SkillRecord:
             return False
         if not self.prereq_skills.issubset(known_skills):
             return False
+        return self.meets_requirements(actor)
+
+    def meets_requirements(self, actor: Actor) -> bool:
+        """Stat thresholds only (level, SP and prerequisites aside)."""
         for stat_name, threshold in self.requirements.items():
             if not hasattr(actor, stat_name):
                 raise ValueError(f"Actor does not have stat '{stat_name}'")
@@ -96,9 +108,8 @@ class SkillRecord:
         cls, path: Union[str, Path]
     ) -> List[SkillRecord]:
         """
-        Read a JSON array of skill definitions (UTF-8), convert each “effects”
-        entry via Effect.from_dict(...),
-        and return a list of SkillRecord instances.
+        Read a JSON array of skill definitions (UTF-8), compile each one
+        (see load_from_data) and return a list of SkillRecord instances.
         """
         path_obj = Path(path)
         if not path_obj.is_file():
@@ -111,6 +122,17 @@ class SkillRecord:
             data = json.loads(raw_text)
         except json.JSONDecodeError as e:
             raise ValueError(f"Invalid JSON in skill file {path}: {e}") from e
+        return cls.load_from_data(data)
+
+    @classmethod
+    def load_from_data(
+        cls, data: List[Dict[str, Any]]
+    ) -> List[SkillRecord]:
+        """
+        Convert an already-parsed JSON array of skill definitions into
+        SkillRecord instances. Each record shares the effects of its
+        compiled SkillDefinition rather than building its own.
+        """
         from game_sys.hooks.hooks import hook_dispatcher
         hook_dispatcher.fire("data.loaded", module=__name__, data=data)
         records: List[SkillRecord] = []
@@ -129,11 +151,9 @@ class SkillRecord:
 
             # Effects
             effs = entry.get("effects", [])
-            effect_objs: List[Effect] = []
             if not isinstance(effs, list):
                 raise ValueError(f"'effects' must be a list for skill '{sid}'")
-            for eff in effs:
-                effect_objs.append(Effect.from_dict(eff.copy()))
+            definition = SkillDefinition.compile(entry)
 
             # SP cost
             spc = int(entry.get("sp_cost", 1))
@@ -168,7 +188,7 @@ class SkillRecord:
                 mana_cost=m_cost,
                 stamina_cost=s_cost,
                 cooldown=cd,
-                effects=effect_objs,
+                effects=definition.effects,
                 sp_cost=spc,
                 min_level=minl,
                 prereq_skills=set(prereqs),
@@ -176,6 +196,7 @@ class SkillRecord:
                 grade=g,
                 rarity=r,
             )
+            rec.definition = definition
             records.append(rec)
 
         return records
@@ -184,14 +205,41 @@ class SkillRecord:
 class SkillRegistry:
     """
     Global registry mapping skill_id → SkillRecord.
+
+    `ensure_loaded()` fills the registry from skills.json once per process
+    and is free afterwards (no disk access). `reload()` re-reads the file
+    and only rebuilds the records when its SHA-256 digest has changed.
+    `tree()` returns the prerequisite/level index for the current records.
     """
+    DEFAULT_PATH = Path(__file__).resolve().parent / "data" / "skills.json"
+
     _registry: Dict[str, SkillRecord] = {}
+    _source: Optional[Path] = None
+    _digest: Optional[str] = None
+    _loaded_ids: frozenset = frozenset()
+    _lock = threading.RLock()
+    # Bumped by register(); with the record count it keys the tree()
+    # cache, so direct edits of _registry are noticed too
+    _generation: int = 0
+    _tree: Optional[SkillTree] = None
+    _tree_key: Any = None
 
     @classmethod
     def register(cls, record: SkillRecord) -> None:
         if record.skill_id in cls._registry:
             raise ValueError(f"Skill '{record.skill_id}' already registered.")
         cls._registry[record.skill_id] = record
+        cls._generation += 1
+
+    @classmethod
+    def tree(cls) -> SkillTree:
+        """Prerequisite DAG and min_level index, rebuilt on change."""
+        key = (cls._generation, len(cls._registry))
+        if cls._tree is None or cls._tree_key != key:
+            with cls._lock:
+                cls._tree = SkillTree(cls._registry.values())
+                cls._tree_key = key
+        return cls._tree
 
     @classmethod
     def get(cls, skill_id: str) -> SkillRecord:
@@ -203,26 +251,123 @@ class SkillRegistry:
     def all_ids(cls) -> List[str]:
         return list(cls._registry.keys())
 
+    @classmethod
+    def digest(cls) -> Optional[str]:
+        """SHA-256 of the file the registry was last loaded from."""
+        return cls._digest
+
+    @classmethod
+    def is_loaded(cls, path: Union[str, Path, None] = None) -> bool:
+        """
+        True if the registry still holds everything loaded from `path`
+        (default: skills.json). Does not touch the disk.
+        """
+        source = Path(path).resolve() if path else cls.DEFAULT_PATH
+        return (
+            cls._source == source
+            and bool(cls._loaded_ids)
+            and cls._loaded_ids <= cls._registry.keys()
+        )
+
+    @classmethod
+    def ensure_loaded(cls, path: Union[str, Path, None] = None) -> None:
+        """Load skills from `path` unless they are already registered."""
+        if cls.is_loaded(path):
+            return
+        with cls._lock:
+            if not cls.is_loaded(path):
+                cls.reload(path, force=True)
+
+    @classmethod
+    def is_stale(cls) -> bool:
+        """True if the loaded file's contents have changed on disk."""
+        if cls._source is None:
+            return True
+        try:
+            raw = cls._source.read_bytes()
+        except OSError:
+            return True
+        return hashlib.sha256(raw).hexdigest() != cls._digest
+
+    @classmethod
+    def reload(
+        cls, path: Union[str, Path, None] = None, force: bool = False
+    ) -> bool:
+        """
+        Re-read the skill JSON and replace the registry contents if the
+        file's digest changed (or `force` is set). Returns True if the
+        records were rebuilt.
+        """
+        source = Path(path).resolve() if path else cls.DEFAULT_PATH
+        if not source.is_file():
+            raise FileNotFoundError(f"Skill JSON file not found at: {source}")
+        is_default = source == cls.DEFAULT_PATH
+        if is_default:
+            # skills.json is owned by the shared game_data registry
+            game_data.reload(["skills"])
+            data = game_data.get("skills")
+            digest = game_data.digest("skills")
+        else:
+            raw = source.read_bytes()
+            digest = hashlib.sha256(raw).hexdigest()
+        with cls._lock:
+            if (not force and digest == cls._digest
+                    and cls.is_loaded(source)):
+                return False
+            if not is_default:
+                try:
+                    data = json.loads(raw.decode("utf-8"))
+                except json.JSONDecodeError as e:
+                    raise ValueError(
+                        f"Invalid JSON in skill file {source}: {e}"
+                    ) from e
+            records = SkillRecord.load_from_data(data)
+            cls._registry.clear()
+            for rec in records:
+                cls.register(rec)
+            cls._source = source
+            cls._digest = digest
+            cls._loaded_ids = frozenset(cls._registry)
+
+            # Keep create_skill's templates in step with the registry
+            if is_default:
+                from game_sys.skills import factory
+                factory._skill_defs.clear()
+                factory._skill_defs.update(
+                    {t["skill_id"]: t for t in data}
+                )
+                factory._compiled.clear()
+                factory._compiled.update(
+                    {r.skill_id: r.definition for r in records}
+                )
+        return True
+
     @classmethod
     def load_from_file(cls, path: Union[str, Path]) -> None:
         """
         Clear the registry, then load all SkillRecords from the JSON at path.
         """
-        cls._registry.clear()
-        records = SkillRecord.load_from_json_array(path)
-        for rec in records:
-            cls.register(rec)
+        cls.reload(path, force=True)
 
 
 class LearningSystem:
     """
     Tracks a character's known skills and unspent skill points (SP).
     """
+
+    # Learnable-skill frontier, built on the first available_to_learn()
+    _frontier: Optional[SkillFrontier] = None
+
     def __init__(self, owner: Actor, initial_sp: int = 0) -> None:
         self.owner = owner
         self.available_sp = initial_sp
         self.known_skills: Set[str] = set()
         self.instantiated_skills: Dict[str, Skill] = {}
+        # Clock for this character's skill cooldowns; a combat engine
+        # swaps in its own for the length of a fight (bind_cooldowns)
+        self.cooldowns = CooldownManager()
+        # Set when skills, SP or cooldowns change; cleared on checkpoint
+        self.dirty = True
 
     def unspent_sp(self) -> int:
         return self.available_sp
@@ -231,6 +376,7 @@ class LearningSystem:
         if amount < 0:
             raise ValueError(f"Cannot add negative SP: {amount}")
         self.available_sp += amount
+        self.dirty = True
 
     def spend_sp(self, amount: int) -> None:
         if amount > self.available_sp:
@@ -241,6 +387,7 @@ class LearningSystem:
                 )
             )
         self.available_sp -= amount
+        self.dirty = True
 
     def learn(self, skill_id: str) -> None:
         if skill_id in self.known_skills:
@@ -254,19 +401,40 @@ class LearningSystem:
             )
         self.spend_sp(rec.sp_cost)
         self.known_skills.add(skill_id)
-        self.instantiated_skills[skill_id] = rec.build_skill_instance(
-            self.owner
-        )
+        if self._frontier is not None and self._frontier.known is self.known_skills:
+            self._frontier.learned(skill_id)
+        self.add_skill(skill_id, rec.build_skill_instance(self.owner))
         from game_sys.hooks.hooks import hook_dispatcher
         hook_dispatcher.fire("skill.learned", actor=self.owner, skill=skill_id)
 
+    def add_skill(self, skill_id: str, skill: Skill) -> None:
+        """Store an instantiated skill and put it on this clock."""
+        self.instantiated_skills[skill_id] = skill
+        self.cooldowns.adopt(skill, self.owner)
+        self.dirty = True
+
+    def bind_cooldowns(self, manager: CooldownManager) -> CooldownManager:
+        """
+        Move every skill onto `manager`'s clock (keeping remaining
+        turns) and return the previous manager.
+        """
+        previous, self.cooldowns = self.cooldowns, manager
+        for skill in self.instantiated_skills.values():
+            manager.adopt(skill, self.owner)
+        if manager is not previous:
+            self.dirty = True
+        return previous
+
     def unlearn(self, skill_id: str) -> None:
         if skill_id not in self.known_skills:
             raise RuntimeError(f"'{skill_id}' is not known.")
         rec = SkillRegistry.get(skill_id)
         self.available_sp += rec.sp_cost
         self.known_skills.remove(skill_id)
-        del self.instantiated_skills[skill_id]
+        self.cooldowns.release(self.instantiated_skills.pop(skill_id))
+        if self._frontier is not None and self._frontier.known is self.known_skills:
+            self._frontier.unlearned(skill_id)
+        self.dirty = True
         from game_sys.hooks.hooks import hook_dispatcher
         hook_dispatcher.fire("skill.unlearned", actor=self.owner, skill=skill_id)
 
@@ -280,23 +448,43 @@ class LearningSystem:
             )
         return self.instantiated_skills[skill_id]
 
+    def frontier(self) -> SkillFrontier:
+        """
+        Unknown skills whose level and prerequisites are met, kept up to
+        date across learn/unlearn and level changes. Rebuilt if the
+        registry or the known set was replaced or edited directly.
+        """
+        tree = SkillRegistry.tree()
+        level = self.owner.level
+        frontier = self._frontier
+        if frontier is None or not frontier.is_current(tree, self.known_skills):
+            frontier = self._frontier = SkillFrontier(tree, self.known_skills, level)
+        elif frontier.level != level:
+            frontier.set_level(level)
+        return frontier
+
     def available_to_learn(self) -> List[str]:
-        can_learn: List[str] = []
-        for sid in SkillRegistry.all_ids():
-            if sid in self.known_skills:
-                continue
-            rec = SkillRegistry.get(sid)
-            if rec.can_character_learn(
-                self.owner, self.known_skills, self.available_sp
-            ):
-                can_learn.append(sid)
+        """
+        Skills that can be learned right now, in registry order. Only
+        the frontier is checked against SP and stat requirements.
+        """
+        frontier = self.frontier()
+        records = frontier.tree.records
+        sp = self.available_sp
+        can_learn = [
+            sid for sid in frontier.skills
+            if records[sid].sp_cost <= sp
+            and records[sid].meets_requirements(self.owner)
+        ]
+        can_learn.sort(key=frontier.tree.position.__getitem__)
         return can_learn
 
-    def tick_all_cooldowns(self) -> None:
-        for skill in self.instantiated_skills.values():
-            try:
-                skill.tick_cooldown()
-            except AttributeError:
-                pass
-        from game_sys.hooks.hooks import hook_dispatcher
-        hook_dispatcher.fire("skill.cooldown_tick", actor=self.owner)
\ No newline at end of file
+    def tick_all_cooldowns(self) -> List[Skill]:
+        """
+        Advance this character's cooldown clock by one turn. Only skills
+        whose cooldown ends are touched (each fires
+        `skill.cooldown_ready`); they are returned.
+        """
+        if self.cooldowns.next_ready() is not None:
+            self.dirty = True
+        return self.cooldowns.advance()
\ No newline at end of file
@@ -0,0 +1,146 @@
+# game_sys/skills/skill_tree.py
+"""
+Indexes over the skill registry for learnability queries.
+
+SkillTree is built once per registry state: the prerequisite DAG
+(skill → skills that require it, plus a topological order) and the
+skills sorted by `min_level`. SkillFrontier uses it to keep, per
+character, the set of unknown skills whose level and prerequisites are
+met, updating it incrementally on learn, unlearn and level change
+instead of rescanning the whole registry.
+"""
+from __future__ import annotations
+
+from bisect import bisect_left, bisect_right
+from collections import deque
+from typing import Dict, FrozenSet, Iterable, List, Set, TYPE_CHECKING
+
+from logs.logs import get_logger
+
+if TYPE_CHECKING:
+    from game_sys.skills.learning import SkillRecord
+
+log = get_logger(__name__)
+
+
+class SkillTree:
+    """Prerequisite DAG and min_level index over a set of SkillRecords."""
+
+    def __init__(self, records: Iterable[SkillRecord]) -> None:
+        self.records: Dict[str, SkillRecord] = {r.skill_id: r for r in records}
+        # Registry order, used to report skills in a stable order
+        self.position: Dict[str, int] = {
+            sid: i for i, sid in enumerate(self.records)
+        }
+        self.dependents: Dict[str, List[str]] = {}
+        for sid, rec in self.records.items():
+            for pre in rec.prereq_skills:
+                self.dependents.setdefault(pre, []).append(sid)
+
+        by_level = sorted(self.records.values(), key=lambda r: r.min_level)
+        self._levels: List[int] = [r.min_level for r in by_level]
+        self._level_ids: List[str] = [r.skill_id for r in by_level]
+
+        self.order: List[str] = self._topological_order()
+        # Skills on a prerequisite cycle, behind a missing prerequisite,
+        # or depending on either; they can never be learned
+        self.unreachable: FrozenSet[str] = frozenset(
+            self.records.keys() - set(self.order)
+        )
+        if self.unreachable:
+            log.warning(
+                "Skills with unsatisfiable prerequisites: %s",
+                ", ".join(sorted(self.unreachable)),
+            )
+
+    def _topological_order(self) -> List[str]:
+        # Kahn's algorithm; unknown prerequisites are never satisfied,
+        # so skills behind them stay out of the order like cycles do
+        missing = {
+            sid: len(rec.prereq_skills) for sid, rec in self.records.items()
+        }
+        queue = deque(sid for sid, n in missing.items() if n == 0)
+        order: List[str] = []
+        while queue:
+            sid = queue.popleft()
+            order.append(sid)
+            for dep in self.dependents.get(sid, ()):
+                missing[dep] -= 1
+                if missing[dep] == 0:
+                    queue.append(dep)
+        return order
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    def levels_between(self, low: int, high: int) -> List[str]:
+        """Skills with `low` < min_level <= `high`."""
+        start = bisect_right(self._levels, low)
+        stop = bisect_right(self._levels, high)
+        return self._level_ids[start:stop]
+
+    def up_to_level(self, level: int) -> List[str]:
+        """Skills with min_level <= `level`."""
+        return self._level_ids[:bisect_right(self._levels, level)]
+
+    def above_level(self, level: int) -> List[str]:
+        """Skills with min_level > `level`."""
+        return self._level_ids[bisect_left(self._levels, level + 1):]
+
+    def is_open(self, skill_id: str, known: Set[str], level: int) -> bool:
+        """Level and prerequisites met (SP and stats are not checked)."""
+        rec = self.records[skill_id]
+        return rec.min_level <= level and rec.prereq_skills <= known
+
+
+class SkillFrontier:
+    """
+    Unknown skills whose min_level and prerequisites a character meets.
+    Bound to one `known` set; the owning LearningSystem reports changes.
+    """
+
+    def __init__(self, tree: SkillTree, known: Set[str], level: int) -> None:
+        self.tree = tree
+        self.known = known
+        # Copy of `known` as of the last report; set equality catches any
+        # direct edit, including swaps that keep the size unchanged
+        self.seen: Set[str] = set(known)
+        self.level = level
+        self.skills: Set[str] = {
+            sid for sid in tree.up_to_level(level)
+            if sid not in known and tree.records[sid].prereq_skills <= known
+        }
+
+    def is_current(self, tree: SkillTree, known: Set[str]) -> bool:
+        """False if the registry or the known set changed behind our back."""
+        return (
+            self.tree is tree
+            and self.known is known
+            and self.seen == known
+        )
+
+    def learned(self, skill_id: str) -> None:
+        self.seen.add(skill_id)
+        self.skills.discard(skill_id)
+        tree, known = self.tree, self.known
+        for dep in tree.dependents.get(skill_id, ()):
+            if dep not in known and tree.is_open(dep, known, self.level):
+                self.skills.add(dep)
+
+    def unlearned(self, skill_id: str) -> None:
+        self.seen.discard(skill_id)
+        tree = self.tree
+        for dep in tree.dependents.get(skill_id, ()):
+            self.skills.discard(dep)
+        if skill_id in tree.records and tree.is_open(skill_id, self.known, self.level):
+            self.skills.add(skill_id)
+
+    def set_level(self, level: int) -> None:
+        tree, known = self.tree, self.known
+        if level > self.level:
+            for sid in tree.levels_between(self.level, level):
+                if sid not in known and tree.records[sid].prereq_skills <= known:
+                    self.skills.add(sid)
+        elif level < self.level:
+            self.skills.difference_update(tree.above_level(level))
+        self.level = level
@@ -0,0 +1,332 @@
+# File: log_analytics.py
+"""
+Streaming analytics over the rotating JSON logs (logs/game.json.log*).
+
+Files are read line by line (optionally through mmap) and fed through
+a generator pipeline: raw lines → prefiltered records → combat/loot
+events → running per-actor totals. Only the aggregates are kept, so
+memory stays constant however many GB of logs are scanned.
+
+Run from the repository root:
+    python -m logs.log_analytics [--mmap] [--json] [files...]
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import mmap
+import re
+import sys
+from collections import Counter
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, NamedTuple, Optional, Union
+
+from logs.logs import LOG_DIR
+
+PathLike = Union[str, Path]
+
+# Cheap byte-level prefilter: lines without one of these are never
+# JSON-decoded.
+_MARKERS = (b" hits ", b" deals ", b" looted ", b"--- Turn ")
+
+# "A hits B for 12 physical damage (resist×0.80) (CRITICAL!)"
+_HIT_RE = re.compile(
+    r"^(?P<attacker>.+?) hits (?P<target>.+?) for (?P<amount>\d+) "
+    r"(?P<type>\w+) damage(?P<rest>.*)$"
+)
+# "A deals 76 (FIRE) + 12 (ICE) damage to B (CRITICAL HIT!)" and the
+# older "A deals 92 ice + 29 magic to B (CRITICAL!)"
+_SPELL_RE = re.compile(
+    r"^(?P<attacker>.+?) deals (?P<parts>.*?) (?:damage )?to "
+    r"(?P<target>.+?)(?P<rest>(?: \(CRITICAL(?: HIT)?!\))?(?: and defeats them!)?)$"
+)
+_SPELL_PART_RE = re.compile(r"(\d+) (?:\((\w+)\)|(\w+))")
+_ITEM_LOOT_RE = re.compile(
+    r"^(?P<winner>.+?) looted (?P<qty>\d+)x (?P<item>.+) from (?P<source>.+)\.$"
+)
+_GOLD_LOOT_RE = re.compile(
+    r"^(?P<winner>.+?) looted (?P<gold>\d+) gold from (?P<source>.+)\.$"
+)
+_TURN_RE = re.compile(r"^--- Turn (\d+) ---$")
+
+
+class HitEvent(NamedTuple):
+    """One damage instance (one damage type) landed by `attacker`."""
+    time: float
+    attacker: str
+    target: str
+    amount: int
+    damage_type: str
+    crit: bool
+
+
+class LootEvent(NamedTuple):
+    """Items (`item` set) or gold (`gold` > 0) taken from `source`."""
+    time: float
+    winner: str
+    source: str
+    item: Optional[str]
+    quantity: int
+    gold: int
+
+
+class TurnEvent(NamedTuple):
+    time: float
+    turn: int
+
+
+@dataclass
+class ActorStats:
+    """Running combat totals for one attacker."""
+    name: str
+    damage: int = 0
+    hits: int = 0
+    crits: int = 0
+    damage_by_type: Dict[str, int] = field(default_factory=dict)
+    turns: int = 0
+    # Distinct log-timestamp seconds in which the actor landed a hit;
+    # idle time between fights and sessions does not count.
+    active_seconds: int = 0
+    _last_turn: int = field(default=-1, repr=False)
+    _last_second: float = field(default=-1.0, repr=False)
+
+    @property
+    def crit_rate(self) -> float:
+        return self.crits / self.hits if self.hits else 0.0
+
+    @property
+    def dps(self) -> float:
+        """Damage per second of activity (log timestamps are 1s)."""
+        return self.damage / self.active_seconds if self.active_seconds else 0.0
+
+    @property
+    def damage_per_turn(self) -> float:
+        """Damage per combat turn in which the actor landed a hit."""
+        return self.damage / self.turns if self.turns else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            "damage": self.damage,
+            "hits": self.hits,
+            "crits": self.crits,
+            "crit_rate": self.crit_rate,
+            "damage_by_type": dict(self.damage_by_type),
+            "turns": self.turns,
+            "active_seconds": self.active_seconds,
+            "dps": self.dps,
+            "damage_per_turn": self.damage_per_turn,
+        }
+
+
+@dataclass
+class LogSummary:
+    """Aggregated combat and loot figures for a set of log files."""
+    actors: Dict[str, ActorStats] = field(default_factory=dict)
+    items_looted: Counter = field(default_factory=Counter)
+    gold_looted: Counter = field(default_factory=Counter)
+    loot_by_source: Counter = field(default_factory=Counter)
+    turns: int = 0
+    lines: int = 0
+    bad_lines: int = 0
+
+    def add(self, event: Union[HitEvent, LootEvent, TurnEvent]) -> None:
+        if type(event) is HitEvent:
+            actor = self.actors.get(event.attacker)
+            if actor is None:
+                actor = self.actors[event.attacker] = ActorStats(event.attacker)
+            actor.damage += event.amount
+            actor.hits += 1
+            actor.crits += event.crit
+            by_type = actor.damage_by_type
+            by_type[event.damage_type] = by_type.get(event.damage_type, 0) + event.amount
+            if actor._last_turn != self.turns:
+                actor._last_turn = self.turns
+                actor.turns += 1
+            if actor._last_second != event.time:
+                actor._last_second = event.time
+                actor.active_seconds += 1
+        elif type(event) is LootEvent:
+            if event.item is not None:
+                self.items_looted[event.item] += event.quantity
+                self.loot_by_source[event.source] += event.quantity
+            else:
+                self.gold_looted[event.winner] += event.gold
+        else:
+            self.turns += 1
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "actors": {n: a.to_dict() for n, a in sorted(self.actors.items())},
+            "items_looted": dict(self.items_looted.most_common()),
+            "gold_looted": dict(self.gold_looted.most_common()),
+            "loot_by_source": dict(self.loot_by_source.most_common()),
+            "turns": self.turns,
+            "lines": self.lines,
+            "bad_lines": self.bad_lines,
+        }
+
+
+def rotated_logs(base: PathLike = LOG_DIR / "game.json.log") -> List[Path]:
+    """
+    The rotated files for `base`, oldest first (base.N … base.1, base),
+    skipping any that do not exist.
+    """
+    base = Path(base)
+    backups = []
+    for path in base.parent.glob(base.name + ".*"):
+        suffix = path.name[len(base.name) + 1:]
+        if suffix.isdigit():
+            backups.append((int(suffix), path))
+    ordered = [p for _, p in sorted(backups, reverse=True)]
+    if base.exists():
+        ordered.append(base)
+    return ordered
+
+
+def iter_lines(path: PathLike, use_mmap: bool = False) -> Iterator[bytes]:
+    """Yield the raw lines of `path` without loading the whole file."""
+    with open(path, "rb") as fp:
+        if use_mmap:
+            try:
+                mm = mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:
+                # Empty files cannot be mapped
+                return
+            with mm:
+                yield from iter(mm.readline, b"")
+        else:
+            yield from fp
+
+
+def iter_records(
+    paths: Iterable[PathLike],
+    use_mmap: bool = False,
+    summary: Optional[LogSummary] = None,
+) -> Iterator[Dict[str, Any]]:
+    """
+    Decode the JSON records that may hold combat or loot events.
+    Line and decode-error counts are kept on `summary` when given.
+    """
+    for path in paths:
+        for line in iter_lines(path, use_mmap):
+            if summary is not None:
+                summary.lines += 1
+            if not any(marker in line for marker in _MARKERS):
+                continue
+            try:
+                yield json.loads(line)
+            except ValueError:
+                if summary is not None:
+                    summary.bad_lines += 1
+
+
+_stamp_cache: Dict[str, float] = {}
+
+
+def _epoch(stamp: str) -> float:
+    # Consecutive records share a timestamp; keep one entry
+    seconds = _stamp_cache.get(stamp)
+    if seconds is None:
+        try:
+            seconds = datetime.fromisoformat(stamp).timestamp()
+        except (TypeError, ValueError):
+            seconds = 0.0
+        _stamp_cache.clear()
+        _stamp_cache[stamp] = seconds
+    return seconds
+
+
+def parse_events(
+    records: Iterable[Dict[str, Any]],
+) -> Iterator[Union[HitEvent, LootEvent, TurnEvent]]:
+    """Turn log records into combat, loot and turn events."""
+    for record in records:
+        message = record.get("message")
+        if not isinstance(message, str):
+            continue
+        when = _epoch(record.get("timestamp"))
+
+        m = _HIT_RE.match(message)
+        if m:
+            yield HitEvent(when, m["attacker"], m["target"], int(m["amount"]),
+                           m["type"].upper(), "(CRITICAL" in m["rest"])
+            continue
+
+        m = _SPELL_RE.match(message)
+        if m:
+            crit = "(CRITICAL" in m["rest"]
+            for amount, bracketed, bare in _SPELL_PART_RE.findall(m["parts"]):
+                yield HitEvent(when, m["attacker"], m["target"], int(amount),
+                               (bracketed or bare).upper(), crit)
+            continue
+
+        m = _GOLD_LOOT_RE.match(message)
+        if m:
+            yield LootEvent(when, m["winner"], m["source"], None, 0, int(m["gold"]))
+            continue
+
+        m = _ITEM_LOOT_RE.match(message)
+        if m:
+            yield LootEvent(when, m["winner"], m["source"], m["item"],
+                            int(m["qty"]), 0)
+            continue
+
+        m = _TURN_RE.match(message)
+        if m:
+            yield TurnEvent(when, int(m.group(1)))
+
+
+def analyze_logs(
+    paths: Optional[Iterable[PathLike]] = None,
+    use_mmap: bool = False,
+) -> LogSummary:
+    """
+    Stream `paths` (default: every rotated game.json.log, oldest first)
+    and return the aggregated per-actor and loot summary.
+    """
+    summary = LogSummary()
+    files = rotated_logs() if paths is None else paths
+    for event in parse_events(iter_records(files, use_mmap, summary)):
+        summary.add(event)
+    return summary
+
+
+def _print_summary(summary: LogSummary) -> None:
+    print(f"{summary.lines} lines, {summary.turns} turns, "
+          f"{summary.bad_lines} undecodable")
+    print(f"{'actor':<20} {'damage':>8} {'hits':>6} {'crit%':>6} "
+          f"{'dps':>8} {'dmg/turn':>9}  types")
+    for actor in sorted(summary.actors.values(), key=lambda a: -a.damage):
+        types = ", ".join(f"{t.lower()} {d}" for t, d in
+                          sorted(actor.damage_by_type.items(), key=lambda kv: -kv[1]))
+        print(f"{actor.name:<20} {actor.damage:>8} {actor.hits:>6} "
+              f"{actor.crit_rate * 100:>5.1f}% {actor.dps:>8.1f} "
+              f"{actor.damage_per_turn:>9.1f}  {types}")
+    if summary.items_looted:
+        print("items looted:", ", ".join(
+            f"{name} ×{n}" for name, n in summary.items_looted.most_common()))
+    if summary.gold_looted:
+        print("gold looted:", ", ".join(
+            f"{name} {g}" for name, g in summary.gold_looted.most_common()))
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("files", nargs="*", help="log files (default: rotated game.json.log*)")
+    parser.add_argument("--mmap", action="store_true", help="read files through mmap")
+    parser.add_argument("--json", action="store_true", help="print the summary as JSON")
+    args = parser.parse_args(argv)
+
+    summary = analyze_logs(args.files or None, use_mmap=args.mmap)
+    if args.json:
+        json.dump(summary.to_dict(), sys.stdout, indent=2)
+        print()
+    else:
+        _print_summary(summary)
+
+
+if __name__ == "__main__":
+    main()
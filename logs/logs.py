@@ -1,11 +1,16 @@
 # File: logs.py
 
+import atexit
 import logging
 import logging.config
+import logging.handlers
 import os
 import json
+import queue
+import threading
+import time
 from pathlib import Path
-from typing import Optional
+from typing import Any, Callable, Iterable, List, Optional
 
 
 # ─── Configuration ────────────────────────────────────────
@@ -17,27 +22,242 @@ LOG_DIR.mkdir(exist_ok=True)
 # You can override the console/root level via the LOG_LEVEL env var:
 ENV_LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO").upper()
 
+# Async pipeline: handlers run on a background thread fed by a bounded
+# queue. LOG_ASYNC=0 keeps the old synchronous handlers.
+ENV_LOG_ASYNC = os.getenv("LOG_ASYNC", "1") != "0"
+ENV_LOG_QUEUE_SIZE = int(os.getenv("LOG_QUEUE_SIZE", "10000"))
+# "drop": discard records while the queue is full (never blocks)
+# "block": wait up to LOG_QUEUE_TIMEOUT seconds for space, then drop
+ENV_LOG_QUEUE_POLICY = os.getenv("LOG_QUEUE_POLICY", "drop").lower()
+ENV_LOG_QUEUE_TIMEOUT = float(os.getenv("LOG_QUEUE_TIMEOUT", "0.05"))
+
 # ─── JSON Formatter ────────────────────────────────────────
 
 
+# Same escaping json.dumps applies to a str (ensure_ascii), without
+# building an encoder per call
+_json_str = json.encoder.encode_basestring_ascii
+
+
 class JsonFormatter(logging.Formatter):
     """
     Outputs each LogRecord as a single-line JSON object.
+
+    The level/module fragment is serialized once per (level, logger)
+    pair and the timestamp once per second; only the message, line
+    number and args are encoded per record.
     """
+
+    DATEFMT = "%Y-%m-%dT%H:%M:%S"
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self._fields: dict = {}
+        self._second = -1
+        self._stamp = ""
+
+    def _timestamp(self, created: float) -> str:
+        second = int(created)
+        if second != self._second:
+            self._stamp = _json_str(
+                time.strftime(self.DATEFMT, self.converter(created))
+            )
+            self._second = second
+        return self._stamp
+
     def format(self, record: logging.LogRecord) -> str:
-        payload = {
-            "timestamp": self.formatTime(record, datefmt="%Y-%m-%dT%H:%M:%S"),
-            "level":     record.levelname,
-            "module":    record.name,
-            "lineno":    record.lineno,
-            "message":   record.getMessage(),
-        }
-        # Include any extra/contextual fields if you use them:
-        if record.args:
-            payload["args"] = record.args
-        safe_args = [str(a) for a in record.args]
-        payload["args"] = safe_args
-        return json.dumps(payload)
+        key = (record.levelname, record.name)
+        fields = self._fields.get(key)
+        if fields is None:
+            fields = self._fields[key] = (
+                f', "level": {_json_str(record.levelname)}'
+                f', "module": {_json_str(record.name)}, "lineno": '
+            )
+        # Records that went through the async queue carry
+        # pre-stringified args.
+        safe_args = getattr(record, "str_args", None)
+        if safe_args is None:
+            safe_args = [str(a) for a in record.args or ()]
+        return (
+            f'{{"timestamp": {self._timestamp(record.created)}{fields}'
+            f'{record.lineno}, "message": {_json_str(record.getMessage())}'
+            f', "args": [{", ".join(map(_json_str, safe_args))}]}}'
+        )
+
+
+def lazy(fn: Callable[..., Any], *args: Any) -> "LazyStr":
+    """
+    Defer an expensive log argument until a handler formats it:
+    `log.debug("%s", lazy(describe, char))` never calls `describe`
+    when DEBUG is disabled. Objects such as a Character or Inventory
+    can be passed as %s arguments directly; their __str__ already runs
+    only when the record is emitted.
+    """
+    return LazyStr(fn, args)
+
+
+class LazyStr:
+    """Log argument whose text is `str(fn(*args))`, computed on demand."""
+
+    __slots__ = ("fn", "args")
+
+    def __init__(self, fn: Callable[..., Any], args: tuple = ()) -> None:
+        self.fn = fn
+        self.args = args
+
+    def __str__(self) -> str:
+        return str(self.fn(*self.args))
+
+
+def log_enabled(logger: logging.Logger, level: int = logging.DEBUG) -> bool:
+    """
+    Guard for log calls whose arguments are costly to build (f-strings,
+    joined lists, several lines of output). Plain attribute reads do not
+    need it: Logger.debug and friends check the level themselves.
+    isEnabledFor caches its answer per level, so this is cheap on hot
+    paths.
+    """
+    return logger.isEnabledFor(level)
+
+
+# ─── Async Queue Pipeline ─────────────────────────────────────
+
+
+class BoundedQueueHandler(logging.handlers.QueueHandler):
+    """
+    QueueHandler for a bounded queue. When the queue is full, records
+    are dropped ("drop" policy) or the caller waits up to `timeout`
+    seconds before dropping ("block" policy, i.e. backpressure). Drops
+    are counted and reported by a WARNING record once space frees up.
+    """
+
+    POLICIES = ("drop", "block")
+
+    def __init__(
+        self,
+        log_queue: queue.Queue,
+        policy: str = "drop",
+        timeout: float = 0.05,
+    ) -> None:
+        if policy not in self.POLICIES:
+            raise ValueError(f"Invalid queue policy: {policy}")
+        super().__init__(log_queue)
+        self.policy = policy
+        self.timeout = timeout
+        self.dropped = 0
+        self._unreported = 0
+        self._drop_lock = threading.Lock()
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # Args may be mutable game objects; snapshot them for the JSON
+        # log before the record crosses to the listener thread. When
+        # the message only uses %s, build it from the same strings so
+        # each arg is stringified once.
+        args = record.args
+        if args and isinstance(args, tuple):
+            str_args = record.str_args = [str(a) for a in args]
+            msg = record.msg
+            if isinstance(msg, str) and "%" not in msg.replace("%s", ""):
+                record.msg = msg % tuple(str_args)
+                record.args = None
+        return super().prepare(record)
+
+    def _put(self, record: logging.LogRecord) -> bool:
+        try:
+            if self.policy == "block":
+                self.queue.put(record, timeout=self.timeout)
+            else:
+                self.queue.put_nowait(record)
+            return True
+        except queue.Full:
+            return False
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        if self._unreported:
+            with self._drop_lock:
+                count, self._unreported = self._unreported, 0
+            if count and not self._put(self._drop_report(count)):
+                with self._drop_lock:
+                    self._unreported += count
+        if not self._put(record):
+            with self._drop_lock:
+                self.dropped += 1
+                self._unreported += 1
+
+    def _drop_report(self, count: int) -> logging.LogRecord:
+        return logging.LogRecord(
+            __name__, logging.WARNING, __file__, 0,
+            "Log queue full: dropped %d records", (count,), None,
+        )
+
+
+class _DrainingListener(logging.handlers.QueueListener):
+    """QueueListener whose stop sentinel waits for room in a full queue."""
+
+    def enqueue_sentinel(self) -> None:
+        self.queue.put(self._sentinel)
+
+
+_listener: Optional[logging.handlers.QueueListener] = None
+_queue_handler: Optional[BoundedQueueHandler] = None
+_queue_logger: Optional[logging.Logger] = None
+
+
+def start_async_logging(
+    handlers: Optional[Iterable[logging.Handler]] = None,
+    logger: Optional[logging.Logger] = None,
+    maxsize: int = ENV_LOG_QUEUE_SIZE,
+    policy: str = ENV_LOG_QUEUE_POLICY,
+    timeout: float = ENV_LOG_QUEUE_TIMEOUT,
+) -> BoundedQueueHandler:
+    """
+    Move `handlers` (default: the logger's current ones) behind a
+    bounded queue served by a QueueListener thread. The logger then
+    only enqueues records; formatting and I/O happen on the listener.
+    """
+    global _listener, _queue_handler, _queue_logger
+    stop_async_logging()
+    logger = logger or logging.getLogger()
+    targets: List[logging.Handler] = list(
+        logger.handlers if handlers is None else handlers
+    )
+    for handler in targets:
+        logger.removeHandler(handler)
+
+    log_queue: queue.Queue = queue.Queue(maxsize=maxsize)
+    _queue_handler = BoundedQueueHandler(log_queue, policy, timeout)
+    _listener = _DrainingListener(
+        log_queue, *targets, respect_handler_level=True
+    )
+    _queue_logger = logger
+    logger.addHandler(_queue_handler)
+    _listener.start()
+    return _queue_handler
+
+
+def stop_async_logging() -> None:
+    """
+    Drain the queue, stop the listener thread and put its handlers
+    back on the logger synchronously.
+    """
+    global _listener, _queue_handler, _queue_logger
+    if _listener is None:
+        return
+    listener, handler, logger = _listener, _queue_handler, _queue_logger
+    _listener = _queue_handler = _queue_logger = None
+    logger.removeHandler(handler)
+    listener.stop()
+    for target in listener.handlers:
+        target.flush()
+        logger.addHandler(target)
+
+
+def dropped_log_records() -> int:
+    """Records dropped by the async pipeline since it was started."""
+    return _queue_handler.dropped if _queue_handler is not None else 0
+
+
+atexit.register(stop_async_logging)
 
 # ─── Logging Configuration Dict ───────────────────────────────────────────
 
@@ -99,12 +319,17 @@ LOGGING_CONFIG = {
 }
 
 
-def setup_logging():
+def setup_logging(async_logging: bool = ENV_LOG_ASYNC):
     """
     Call once at program startup to configure all loggers.
-    Honors LOG_LEVEL env var for console & root level.
+    Honors LOG_LEVEL env var for console & root level. With
+    `async_logging` (default; LOG_ASYNC=0 turns it off) the console and
+    file handlers run behind a bounded queue on a background thread.
     """
+    stop_async_logging()
     logging.config.dictConfig(LOGGING_CONFIG)
+    if async_logging:
+        start_async_logging()
 
 
 def get_logger(name: Optional[str] = None) -> logging.Logger:
@@ -1,6 +1,6 @@
 # playground.py
 
-from logs.logs import setup_logging, get_logger
+from logs.logs import setup_logging, get_logger, lazy
 from game_sys.character.character_creation import create_character
 from game_sys.skills.learning import SkillRegistry
 from game_sys.items.factory import create_item
@@ -17,8 +17,8 @@ log = get_logger(__name__)
 # ------------------------------------------------------------------------------
 # We assume 'skills.json' lives in 'game_sys/skills/data/skills.json' and is
 # UTF-8 encoded.
-SkillRegistry.load_from_file("game_sys/skills/data/skills.json")
-log.info("Skills loaded into registry: %s", SkillRegistry.all_ids())
+SkillRegistry.ensure_loaded()
+log.info("Skills loaded into registry: %s", lazy(SkillRegistry.all_ids))
 
 
 def view_character_test():
@@ -125,9 +125,9 @@ def learning_system_test():
         player.learning.unlearn(to_unlearn)
         log.info("Unlearned '%s'; SP refunded. Remaining SP: %d",
                  to_unlearn, player.learning.unspent_sp())
-        log.info("Known skills now: %s", player.learning.get_known_skills())
+        log.info("Known skills now: %s", lazy(player.learning.get_known_skills))
 
-    log.info(f"Final Player State{player}:")
+    log.info("Final Player State:\n%s", player)
 
 
 def inventory_system_test():
@@ -153,16 +153,16 @@ def inventory_system_test():
     hero.inventory.add_item(health_potion, quantity=3)
     hero.inventory.add_item(mana_potion, quantity=2)
 
-    log.info("Inventory after adding items (no auto-equip):")
+    log.info("Inventory after adding items (no auto-equip):\n%s", hero.inventory)
     # 4) Manually equip sword and armor
     # hero.inventory.equip_item(iron_sword)
     hero.inventory.equip_item(leather_armor)
-    log.info("Equipped iron_sword and leather_armor:")
+    log.info("Equipped iron_sword and leather_armor:\n%s", hero.inventory)
 
     # 5) Add + auto-equip a special ring in one call
     item = create_item("ruby_band")
     hero.inventory.add_item(item, quantity=1, auto_equip=True)
-    log.info("Added and auto-equipped:")
+    log.info("Added and auto-equipped:\n%s", hero.inventory)
 
     # 6) Simulate taking damage, then use a health potion
     hero.take_damage(random.randint(1, 100), damage_type=DamageType.FIRE)
@@ -0,0 +1,112 @@
+import random
+
+import pytest
+
+from game_sys.character.character_creation import create_character
+from game_sys.combat.ai import ATTACK, HEAL_WEIGHT, ITEM, SKILL, Action, attack_damage_map
+from game_sys.combat.combat_engine import CombatEngine
+from game_sys.core.damage_types import DamageType
+from game_sys.effects.damage import DamageEffect
+from game_sys.items.item_base import ConsumableItem
+from game_sys.skills.base import Skill
+
+
+def _bolt(damage=500, cooldown=3, mana=0):
+    return Skill("bolt", "Bolt", "", mana, 0, cooldown,
+                 [DamageEffect({DamageType.FIRE: damage}, crit_chance=0.0)])
+
+
+@pytest.fixture
+def duel():
+    hero = create_character("player", name="Ayla")
+    foe = create_character("goblin", name="g", level=1)
+    return hero, foe, CombatEngine([hero], [foe], rng=random.Random(5))
+
+
+def test_expected_damage_matches_average_roll(duel):
+    hero, foe, engine = duel
+    foe.stats.add_modifier("test", "health", 10_000)  # no overkill clamping
+    # A real level-1 attack, where rounding and the 1-damage floor matter
+    dmg_map = attack_damage_map(hero, foe)
+    expected = engine.combat.expected_damage(hero, foe, dmg_map, stat_name=None)
+
+    total, rounds = 0, 4000
+    for _ in range(rounds):
+        foe.current_health = foe.max_health
+        engine.combat.calculate_damage(hero, foe, dmg_map, stat_name=None)
+        total += foe.max_health - foe.current_health
+    # Sampling error of the mean over 4000 hits is well under 3%
+    assert total / rounds == pytest.approx(expected, rel=0.03)
+
+
+def test_prefers_stronger_skill_then_attacks_on_cooldown(duel):
+    hero, foe, engine = duel
+    hero.learning.add_skill("bolt", _bolt())
+    action = engine.evaluator.choose(hero, [foe])
+    assert action.kind == SKILL and action.target is foe
+
+    action.skill.use(hero, foe, engine)
+    foe.current_health = foe.max_health
+    engine.turn += 1
+    assert engine.evaluator.choose(hero, [foe]).kind == ATTACK
+
+
+def test_finishes_off_weakest_foe(duel):
+    hero, foe, engine = duel
+    # Level-1 goblins can roll low enough health to die to one hit too
+    foe.stats.add_modifier("test", "health", 10_000)
+    foe.current_health = foe.max_health
+    other = create_character("goblin", name="h", level=1)
+    other.current_health = 1
+    action = engine.evaluator.choose(hero, [foe, other])
+    assert action.target is other
+
+
+def test_heals_with_consumable_only_when_hurt(duel):
+    hero, foe, engine = duel
+    potion = ConsumableItem("potion", "Potion", "", 1, 1,
+                            [{"type": "Heal", "amount": {"min": 40, "max": 60}}])
+    hero.inventory.add_item(potion)
+    assert engine.evaluator.choose(hero, [foe]).kind == ATTACK
+
+    hero.current_health = 1
+    action = engine.evaluator.choose(hero, [foe])
+    assert action.kind == ITEM and action.item is potion and action.target is hero
+    assert action.score == HEAL_WEIGHT * min(50, hero.max_health - 1)
+
+
+def test_instant_heal_consumables_are_considered(duel):
+    hero, foe, engine = duel
+    elixir = ConsumableItem("elixir", "Elixir", "", 1, 1,
+                            [{"type": "InstantHeal", "amount": 30}])
+    hero.inventory.add_item(elixir)
+    hero.current_health = 1
+    action = engine.evaluator.choose(hero, [foe])
+    assert action.kind == ITEM and action.item is elixir
+    assert action.score == HEAL_WEIGHT * min(30, hero.max_health - 1)
+
+
+def test_scores_are_cached_per_turn(duel):
+    hero, foe, engine = duel
+    first = engine.evaluator.attack_damage(hero, foe)
+    hero.stats.add_modifier("test", "attack", 1000)
+    assert engine.evaluator.attack_damage(hero, foe) == first
+    engine.turn += 1
+    assert engine.evaluator.attack_damage(hero, foe) > first
+
+
+def test_engine_runs_action_fn():
+    hero = create_character("player", name="Ayla")
+    foe = create_character("goblin", name="g", level=1)
+    calls = []
+
+    def skip_party(engine, actor, foes):
+        calls.append(actor.name)
+        if actor is hero:
+            return Action(SKILL, foes[0], skill=_bolt(damage=10_000, cooldown=0))
+        return None
+
+    result = CombatEngine([hero], [foe], rng=random.Random(1),
+                          action_fn=skip_party).start()
+    assert calls[0] == "Ayla"
+    assert result.startswith("Party wins")
@@ -0,0 +1,102 @@
+import logging
+import threading
+import time
+
+import pytest
+
+from logs.logs import (
+    BoundedQueueHandler,
+    JsonFormatter,
+    dropped_log_records,
+    start_async_logging,
+    stop_async_logging,
+)
+
+
+class _Collect(logging.Handler):
+    def __init__(self, gate=None):
+        super().__init__()
+        self.records = []
+        self.threads = set()
+        self.gate = gate
+
+    def emit(self, record):
+        if self.gate is not None:
+            self.gate.wait(5)
+        self.threads.add(threading.get_ident())
+        self.records.append(record)
+
+
+@pytest.fixture
+def logger():
+    lg = logging.getLogger("test.async_logging")
+    lg.propagate = False
+    lg.setLevel(logging.DEBUG)
+    yield lg
+    stop_async_logging()
+    lg.handlers.clear()
+
+
+def test_records_are_handled_on_listener_thread(logger):
+    sink = _Collect()
+    sink.setFormatter(JsonFormatter())
+    logger.addHandler(sink)
+    start_async_logging(logger=logger, maxsize=100)
+    assert sink not in logger.handlers
+
+    payload = [1, 2]
+    logger.info("hit %s for %d", payload, 5)
+    payload.append(3)
+    stop_async_logging()
+
+    (record,) = sink.records
+    assert record.getMessage() == "hit [1, 2] for 5"
+    assert '"args": ["[1, 2]", "5"]' in sink.format(record)
+    assert threading.get_ident() not in sink.threads
+    # Handlers go back on the logger once the pipeline stops
+    assert sink in logger.handlers
+
+
+def test_drop_policy_counts_and_reports(logger):
+    gate = threading.Event()
+    sink = _Collect(gate)
+    handler = start_async_logging([sink], logger=logger, maxsize=2,
+                                  policy="drop")
+
+    for i in range(20):
+        logger.info("msg %d", i)
+    dropped = dropped_log_records()
+    # The listener holds at most one record, the queue two more
+    assert dropped >= 17
+    gate.set()
+    while not handler.queue.empty():
+        time.sleep(0.001)
+    logger.info("after")
+    stop_async_logging()
+
+    messages = [r.getMessage() for r in sink.records]
+    assert f"Log queue full: dropped {dropped} records" in messages
+    assert messages[-1] == "after"
+
+
+def test_block_policy_applies_backpressure(logger):
+    gate = threading.Event()
+    sink = _Collect(gate)
+    start_async_logging([sink], logger=logger, maxsize=1,
+                        policy="block", timeout=5)
+    timer = threading.Timer(0.05, gate.set)
+    timer.start()
+    for i in range(10):
+        logger.info("msg %d", i)
+    stop_async_logging()
+    timer.join()
+
+    assert [r.getMessage() for r in sink.records] == [
+        f"msg {i}" for i in range(10)
+    ]
+
+
+def test_rejects_unknown_policy():
+    import queue
+    with pytest.raises(ValueError):
+        BoundedQueueHandler(queue.Queue(), policy="spill")
@@ -0,0 +1,75 @@
+import random
+
+from game_sys.character.character_creation import create_character
+from game_sys.combat.combat_engine import CombatEngine
+from game_sys.effects.base import active_combat_engine, effect_rng
+from game_sys.effects.status import StatusEffect
+from game_sys.items.item_base import ConsumableItem
+
+
+def _potion(effects, amount=99):
+    return ConsumableItem("potion", "Potion", "", 1, 1, effects, amount=amount)
+
+
+def _wounded():
+    actor = create_character("goblin")
+    actor.current_health = 1
+    return actor
+
+
+def test_effects_are_compiled_once_at_creation(monkeypatch):
+    potion = _potion([{"type": "Heal", "amount": {"min": 1, "max": 1}}])
+    effect = potion._effects[0]
+    assert effect is not None
+
+    def _no_parse(*args, **kwargs):
+        raise AssertionError("effect rebuilt on use")
+
+    monkeypatch.setattr(type(effect), "from_dict", classmethod(_no_parse))
+    actor = _wounded()
+    for _ in range(5):
+        potion.apply(actor)
+    assert actor.current_health == 6
+    assert potion.amount == 94
+
+
+def test_ranged_amounts_roll_from_engine_rng_at_apply_time():
+    effects = [{"type": "InstantHeal", "amount": {"min": 1, "max": 1000}}]
+
+    class _Target:
+        name = "Dummy"
+        current_health = 0
+
+    def _heals(seed):
+        potion = _potion(effects)
+        engine = CombatEngine([], [], rng=random.Random(seed))
+        target = _Target()
+        healed = []
+        for _ in range(5):
+            before = target.current_health
+            potion.apply(target, combat_engine=engine)
+            healed.append(target.current_health - before)
+        return healed
+
+    first = _heals(7)
+    assert first == _heals(7)
+    assert len(set(first)) > 1  # rolled per use, not once per item
+
+
+def test_active_engine_supplies_rng_without_passing_it():
+    engine = CombatEngine([], [], rng=random.Random(1))
+    assert effect_rng() is random
+    with active_combat_engine(engine):
+        assert effect_rng() is engine.rng
+    assert effect_rng() is random
+
+
+def test_stateful_effects_are_rebuilt_per_use():
+    potion = _potion([{"type": "ApplyStatus", "name": "Regen",
+                       "duration": 3}])
+    assert potion._effects == (None,)
+    first, second = _wounded(), _wounded()
+    potion.apply(first)
+    potion.apply(second)
+    assert isinstance(first.statuses["Regen"], StatusEffect)
+    assert first.statuses["Regen"] is not second.statuses["Regen"]
@@ -0,0 +1,101 @@
+import copy
+
+import pytest
+
+from game_sys.character.character_creation import create_character
+from game_sys.combat.combat_engine import CombatEngine
+from game_sys.hooks.hooks import hook_dispatcher
+from game_sys.skills.base import Skill
+from game_sys.skills.cooldowns import CooldownManager
+from game_sys.skills.learning import SkillRegistry
+
+
+def _skill(sid, cooldown):
+    return Skill(sid, sid.title(), "", 0, 0, cooldown, [])
+
+
+@pytest.fixture
+def ready_events():
+    events = []
+
+    def on_ready(skill, actor):
+        events.append((skill.id, actor))
+
+    hook_dispatcher.register("skill.cooldown_ready", on_ready)
+    yield events
+    hook_dispatcher.unregister("skill.cooldown_ready", on_ready)
+
+
+def test_cooldowns_only_fire_when_ready(ready_events):
+    hero = create_character("player", name="Ayla")
+    learning = hero.learning
+    for sid, cd in (("slash", 2), ("nova", 3), ("wait", 0)):
+        learning.add_skill(sid, _skill(sid, cd))
+    for sid in ("slash", "nova", "wait"):
+        learning.instantiated_skills[sid].use(hero, hero, None)
+
+    slash = learning.get_skill_object("slash")
+    assert not slash.can_cast(hero) and slash._current_cooldown == 2
+    assert learning.get_skill_object("wait").can_cast(hero)
+
+    assert learning.tick_all_cooldowns() == []
+    assert ready_events == []
+    assert learning.tick_all_cooldowns() == [slash]
+    assert ready_events == [("slash", hero)] and slash.can_cast(hero)
+    learning.tick_all_cooldowns()
+    assert ready_events[-1] == ("nova", hero)
+    assert learning.tick_all_cooldowns() == [] and len(ready_events) == 2
+
+    # Recasting supersedes the pending entry instead of firing twice
+    slash.use(hero, hero, None)
+    slash._current_cooldown = 1
+    learning.tick_all_cooldowns()
+    learning.tick_all_cooldowns()
+    assert [e for e in ready_events if e[0] == "slash"] == [("slash", hero)] * 2
+
+
+def test_unlearned_skills_leave_the_clock(ready_events):
+    hero = create_character("player", name="Ayla")
+    learning = hero.learning
+    sid = SkillRegistry.all_ids()[0]
+    learning.known_skills.add(sid)
+    learning.add_skill(sid, _skill(sid, 2))
+    skill = learning.get_skill_object(sid)
+    skill.use(hero, hero, None)
+
+    learning.unlearn(sid)
+    assert skill._cooldowns is None
+    learning.tick_all_cooldowns()
+    learning.tick_all_cooldowns()
+    assert ready_events == []
+
+
+def test_copies_and_rebinding_keep_remaining_turns():
+    clock = CooldownManager()
+    skill = _skill("slash", 5)
+    clock.start(skill, 4)
+    clock.advance()
+    twin = copy.copy(skill)
+    assert twin._current_cooldown == 3 and twin.cooldowns is not clock
+
+    other = CooldownManager()
+    other.advance(10)
+    other.adopt(skill)
+    assert skill._current_cooldown == 3
+    clock.advance(5)
+    assert skill._current_cooldown == 3
+    assert other.advance(3) == [skill]
+
+
+def test_engine_shares_one_clock_during_combat():
+    hero = create_character("player", name="Ayla")
+    own_clock = hero.learning.cooldowns
+    hero.learning.add_skill("slash", _skill("slash", 9))
+    hero.learning.get_skill_object("slash")._current_cooldown = 4
+    goblin = create_character("goblin", name="g", level=1)
+    goblin.current_health = 0
+
+    engine = CombatEngine([hero], [goblin], max_turns=2)
+    engine.start()
+    assert hero.learning.cooldowns is own_clock
+    assert hero.learning.get_skill_object("slash")._current_cooldown == 2
@@ -0,0 +1,100 @@
+import pytest
+
+from game_sys.effects.base import (
+    Effect,
+    EffectSpec,
+    compile_effect,
+    effect_types,
+    register_effect,
+    resolve_effect_type,
+    unregister_effect,
+)
+from game_sys.effects.damage import DamageEffect
+from game_sys.effects.heal import HealEffect
+from game_sys.effects.instant import InstantHeal, InstantMana
+from game_sys.effects.status import StatusEffect
+from game_sys.effects.passives.lifesteal import LifeStealPassive
+from game_sys.items.item_base import ConsumableItem
+from game_sys.character.character_creation import create_character
+
+
+@pytest.mark.parametrize("type_name,cls", [
+    ("Damage", DamageEffect),
+    ("status", StatusEffect),
+    ("ApplyStatus", StatusEffect),
+    ("HEAL", HealEffect),
+    ("InstantHeal", InstantHeal),
+    ("instantmana", InstantMana),
+    ("LifeStealPassive", LifeStealPassive),
+])
+def test_builtin_types_resolve_case_insensitively(type_name, cls):
+    assert resolve_effect_type(type_name) is cls
+    assert isinstance(Effect.from_dict({"type": type_name, "amount": 1,
+                                        "name": "x"}), cls)
+
+
+def test_registry_lists_all_builtins():
+    assert {"damage", "damagereduction", "temporarystatbuff",
+            "modifyweapondamage", "unlock"} <= set(effect_types())
+
+
+def test_unknown_and_missing_type_raise():
+    with pytest.raises(ValueError):
+        Effect.from_dict({"type": "Nope"})
+    with pytest.raises(ValueError):
+        Effect.from_dict({})
+
+
+def test_plugin_registration_and_conflicts():
+    @register_effect("TestBlink")
+    class Blink(Effect):
+        def __init__(self, turns):
+            self.turns = turns
+
+        @classmethod
+        def from_dict(cls, data):
+            return cls(data.get("turns", 1))
+
+        def apply(self, caster, target, combat_engine=None):
+            return "blink"
+
+    try:
+        eff = Effect.from_dict({"type": "testblink", "turns": 3})
+        assert isinstance(eff, Blink) and eff.turns == 3
+
+        with pytest.raises(ValueError):
+            register_effect("TestBlink")(HealEffect)
+        register_effect("TestBlink", replace=True)(HealEffect)
+        assert resolve_effect_type("TestBlink") is HealEffect
+    finally:
+        unregister_effect("TestBlink")
+    with pytest.raises(ValueError):
+        resolve_effect_type("TestBlink")
+
+
+def test_compiled_specs_are_shared_and_read_only():
+    data = {"type": "Heal", "amount": {"min": 1, "max": 3}}
+    spec = compile_effect(data)
+    assert isinstance(spec, EffectSpec)
+    assert spec.effect_cls is HealEffect
+    assert compile_effect(dict(data)) is spec
+    with pytest.raises(TypeError):
+        spec.data["amount"]["min"] = 99
+    eff = spec.build()
+    assert (eff.amount, eff.max_amount) == (1, 3)
+    assert spec.build() is not eff
+
+
+def test_consumables_reuse_compiled_effects():
+    effects = [{"type": "InstantHeal", "amount": 5}]
+    first = ConsumableItem("p", "Potion", "", 1, 1, effects, amount=3)
+    second = ConsumableItem("p", "Potion", "", 1, 1, list(effects))
+    assert first.effect_specs is first.effect_specs
+    assert first.effect_specs[0] is second.effect_specs[0]
+
+    user = create_character("goblin")
+    user.current_health = 1
+    first.apply(user)
+    first.apply(user)
+    assert user.current_health == min(11, user.max_health)
+    assert first.amount == 1
@@ -0,0 +1,132 @@
+import random
+
+import pytest
+
+from game_sys.core.experience import (
+    Levels,
+    experience_to_reach,
+    level_for_experience,
+)
+from game_sys.hooks.hooks import hook_dispatcher
+
+
+class _Thing:
+    name = "Dummy"
+
+
+def _stepwise(lvl, xp, max_level):
+    while lvl < max_level and xp >= 100 * lvl ** 2 + 100 * lvl:
+        xp -= 100 * lvl ** 2 + 100 * lvl
+        lvl += 1
+    return lvl, xp
+
+
+def test_prefix_sum_matches_required_experience():
+    levels = Levels(_Thing())
+    total = 0
+    for lvl in range(1, 100):
+        assert experience_to_reach(lvl) == total
+        levels.lvl = lvl
+        total += levels.required_experience()
+    for lvl in range(1, 60):
+        t = experience_to_reach(lvl)
+        assert level_for_experience(t) == lvl
+        assert level_for_experience(t - 1) == max(1, lvl - 1)
+    assert level_for_experience(10 ** 12, max_level=50) == 50
+
+
+@pytest.fixture
+def level_events():
+    events = []
+
+    def on_level_up(**kwargs):
+        events.append(kwargs)
+
+    hook_dispatcher.register("character.level_up", on_level_up)
+    yield events
+    hook_dispatcher.unregister("character.level_up", on_level_up)
+
+
+def test_large_award_levels_up_once(level_events):
+    rng = random.Random(7)
+    for _ in range(200):
+        start, xp, award = rng.randint(1, 40), rng.randint(0, 500), rng.randint(0, 10 ** 7)
+        levels = Levels(_Thing(), level=start, experience=xp, max_level=60)
+        levels.add_experience(award)
+        assert (levels.lvl, levels.experience) == _stepwise(start, xp + award, 60)
+
+    level_events.clear()
+    thing = _Thing()
+    levels = Levels(thing)
+    levels.add_experience(experience_to_reach(12) + 5)
+    assert (levels.lvl, levels.experience) == (12, 5)
+    assert level_events == [{
+        "character": thing, "old_level": 1, "new_level": 12, "levels_gained": 11,
+    }]
+
+    levels.add_experience(1)
+    assert len(level_events) == 1
+
+
+def test_actor_level_up_rescales_base_and_keeps_modifiers(level_events):
+    from game_sys.character.character_creation import create_character
+    from game_sys.core.rarity import Rarity
+    from game_sys.managers.scaling_manager import stat_multiplier
+
+    hero = create_character("player", name="Ayla", job_id="knight",
+                            rarity="COMMON")
+    stats = hero.stats_mgr.stats
+    stats.add_modifier("ring", "attack", 7)
+    base = dict(stats.base)
+    m1 = stat_multiplier(1, 1, Rarity.COMMON)
+
+    level_events.clear()
+    for _ in range(30):
+        hero.stats_mgr.add_experience(5_000)
+    assert level_events[0]["old_level"] == 1
+    assert level_events[-1]["new_level"] == hero.level > 10
+    assert all(a["new_level"] == b["old_level"]
+               for a, b in zip(level_events, level_events[1:]))
+    assert hero.stats_mgr.stats is stats
+    assert stats._modifiers == {"ring": {"attack": 7}}
+
+    # Scaled from the original base, not compounded per level-up
+    factor = stat_multiplier(hero.level, 1, Rarity.COMMON) / m1
+    assert stats.base == {s: int(round(v * factor)) for s, v in base.items()}
+    assert stats.effective()["attack"] == stats.base["attack"] + 7
+    assert hero.current_health == hero.max_health
+
+    with pytest.raises(ValueError):
+        hero.stats_mgr.add_experience(-1)
+
+
+def test_combat_xp_is_settled_once_per_recipient():
+    from game_sys.character.spawner import EnemySpawner
+    from game_sys.combat.combat_engine import CombatEngine
+
+    spawner = EnemySpawner(level_band=5, variants=2)
+    raid = [spawner.spawn("goblin", level=1, name=f"r{i}") for i in range(40)]
+    foes = [spawner.spawn("goblin", level=1, name=f"f{i}") for i in range(5)]
+    for foe in foes:
+        foe.stats_mgr.levels.experience = 4_000
+        foe.current_health = 0
+
+    calls = []
+
+    def on_xp(actor, amount, **_):
+        calls.append((actor, amount))
+
+    engine = CombatEngine(raid, foes)
+    hook_dispatcher.register("character.experience_added", on_xp)
+    try:
+        for foe in foes:
+            engine.award_kill_xp(foe)
+        assert calls == []
+        awarded = engine.settle_xp()
+    finally:
+        hook_dispatcher.unregister("character.experience_added", on_xp)
+
+    assert calls == [(m, 5 * (4_000 // 40)) for m in raid]
+    assert awarded == dict(calls)
+    assert all(m.level == level_for_experience(500) for m in raid)
+    assert engine.settle_xp() == {}
@@ -0,0 +1,143 @@
+import json
+import os
+
+import pytest
+
+from game_sys.core.game_data import GameData, game_data
+from game_sys.hooks.hooks import hook_dispatcher
+
+FILES = {
+    "items": ("items.json", []),
+    "jobs": ("jobs.json", []),
+    "skills": ("skills.json", []),
+}
+
+
+def _write(root, name, data):
+    (root / name).write_text(json.dumps(data), encoding="utf-8")
+
+
+@pytest.fixture
+def data_root(tmp_path):
+    _write(tmp_path, "items.json", [{"id": "knife"}])
+    _write(tmp_path, "jobs.json", [
+        {"job_id": "rogue", "starting_items": ["knife"],
+         "starting_skills": ["stab"]},
+    ])
+    _write(tmp_path, "skills.json", [{"skill_id": "stab"}])
+    return tmp_path
+
+
+def _registry(root, **kwargs):
+    return GameData(files=FILES, root=root,
+                    cache_path=root / "cache" / "data.pickle", **kwargs)
+
+
+def test_loads_lazily_and_once(data_root):
+    gd = _registry(data_root)
+    assert not gd._loaded
+    items = gd.get("items")
+    assert items == [{"id": "knife"}]
+    assert gd.get("items") is items
+    with pytest.raises(KeyError):
+        gd.get("nope")
+
+
+def test_second_start_is_served_from_cache(data_root):
+    _registry(data_root).load()
+    assert (data_root / "cache" / "data.pickle").is_file()
+
+    warm = _registry(data_root)
+    warm.load()
+    assert warm.cache_hits == set(FILES)
+    assert warm.get("jobs")[0]["job_id"] == "rogue"
+
+
+def test_touched_file_hits_cache_by_hash_edited_file_is_reparsed(data_root):
+    _registry(data_root).load()
+    path = data_root / "items.json"
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 10_000_000))
+    _write(data_root, "skills.json", [{"skill_id": "stab"},
+                                      {"skill_id": "slash"}])
+
+    gd = _registry(data_root)
+    gd.load()
+    assert "items" in gd.cache_hits
+    assert "skills" not in gd.cache_hits
+    assert len(gd.get("skills")) == 2
+
+
+def test_reload_reports_changed_files(data_root):
+    gd = _registry(data_root)
+    old_digest = gd.digest("items")
+    assert gd.reload() == []
+    _write(data_root, "items.json", [{"id": "knife"}, {"id": "axe"}])
+    events = []
+    listener = hook_dispatcher.register(
+        "data.reloaded", lambda names: events.append(names))
+    try:
+        assert gd.reload() == ["items"]
+    finally:
+        hook_dispatcher.unregister("data.reloaded", listener)
+    assert events == [["items"]]
+    assert gd.digest("items") != old_digest
+    assert len(gd.get("items")) == 2
+
+
+def test_validate_reports_broken_references(data_root):
+    _write(data_root, "jobs.json", [
+        {"job_id": "rogue", "starting_items": ["sword"],
+         "starting_skills": ["stab", "vanish"]},
+    ])
+    gd = _registry(data_root)
+    gd.load()
+    assert gd.validate() == [
+        "job 'rogue': unknown item 'sword'",
+        "job 'rogue': unknown skill 'vanish'",
+    ]
+    # Strict mode re-validates even when served from the cache
+    with pytest.raises(ValueError):
+        _registry(data_root, strict=True).get("items")
+
+
+def test_missing_file_and_corrupt_cache_fall_back(data_root):
+    (data_root / "skills.json").unlink()
+    cache = data_root / "cache" / "data.pickle"
+    cache.parent.mkdir()
+    cache.write_bytes(b"not a pickle")
+    gd = _registry(data_root)
+    assert gd.get("skills") == []
+    assert gd.get("items") == [{"id": "knife"}]
+
+
+def test_shipped_data_is_shared_by_modules():
+    from game_sys.combat.loader import DROP_TABLES
+    from game_sys.skills import factory
+
+    assert dict(DROP_TABLES) == game_data.get("drop_tables")
+    assert DROP_TABLES["goblin"] is game_data.get("drop_tables")["goblin"]
+    assert set(factory._skill_defs) == {
+        s["skill_id"] for s in game_data.get("skills")
+    }
+
+
+def test_views_build_on_first_access_and_reset_on_reload(data_root):
+    gd = _registry(data_root)
+    builds = []
+
+    def _index():
+        builds.append(1)
+        return {i["id"]: i for i in gd.get("items")}
+
+    items = gd.view("items", _index)
+    assert not items.loaded and not gd._loaded
+    assert "knife" in items
+    assert items.get("knife") == {"id": "knife"}
+    assert len(builds) == 1
+
+    _write(data_root, "items.json", [{"id": "axe"}])
+    gd.reload()
+    assert not items.loaded
+    assert list(items) == ["axe"]
+    assert len(builds) == 2
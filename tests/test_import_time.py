@@ -0,0 +1,78 @@
+import os
+import re
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# Self time of game_sys/logs modules only (stdlib excluded), in ms.
+# Generous so slow CI machines pass; override with GAME_SYS_IMPORT_BUDGET_MS.
+IMPORT_BUDGET_MS = float(os.environ.get("GAME_SYS_IMPORT_BUDGET_MS", 250))
+
+_IMPORTTIME_RE = re.compile(r"import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)")
+
+
+def _run(code, *flags):
+    env = dict(os.environ, PYTHONPATH=str(ROOT))
+    return subprocess.run(
+        [sys.executable, *flags, "-c", code],
+        cwd=ROOT, env=env, capture_output=True, text=True, check=True,
+    )
+
+
+def _importtime(module):
+    """{module: (self_us, cumulative_us)} from `python -X importtime`."""
+    proc = _run(f"import {module}", "-X", "importtime")
+    times = {}
+    for line in proc.stderr.splitlines():
+        m = _IMPORTTIME_RE.match(line)
+        if m:
+            times[m.group(4)] = (int(m.group(1)), int(m.group(2)))
+    return times
+
+
+def test_import_does_no_eager_work():
+    out = _run(
+        "import sys, game_sys.character.character_creation\n"
+        "import game_sys\n"
+        "from game_sys.core.game_data import game_data\n"
+        "from game_sys.skills.learning import SkillRegistry\n"
+        "print(game_sys.is_initialized(), game_data._loaded,\n"
+        "      'game_sys.hooks.hooks_setup' in sys.modules,\n"
+        "      bool(SkillRegistry.all_ids()))\n"
+    ).stdout.split()
+    assert out == ["False", "False", "False", "False"]
+
+
+def test_first_actor_and_init_warm_everything():
+    out = _run(
+        "import sys, game_sys\n"
+        "from game_sys.character.character_creation import create_character\n"
+        "from game_sys.core.game_data import game_data\n"
+        "from game_sys.skills.learning import SkillRegistry\n"
+        "create_character('goblin', job_id='goblin')\n"
+        "print(game_sys.is_initialized(), game_data._loaded,\n"
+        "      'game_sys.hooks.hooks_setup' in sys.modules,\n"
+        "      SkillRegistry.is_loaded())\n"
+        "game_sys.init()\n"
+    ).stdout.split()
+    assert out == ["True", "True", "True", "True"]
+
+
+@pytest.mark.parametrize("module", [
+    "game_sys",
+    "game_sys.character.character_creation",
+])
+def test_import_time_budget(module):
+    times = _importtime(module)
+    assert module in times
+    own_ms = sum(
+        self_us for name, (self_us, _) in times.items()
+        if name.split(".")[0] in ("game_sys", "logs")
+    ) / 1000
+    assert own_ms < IMPORT_BUDGET_MS, (
+        f"importing {module} spent {own_ms:.1f}ms in project modules"
+    )
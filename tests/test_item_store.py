@@ -0,0 +1,130 @@
+import pytest
+
+from game_sys.character.character_creation import create_character
+from game_sys.character.spawner import clone_character
+from game_sys.core.save_load import character_delta, dumps_binary, loads_binary
+from game_sys.core.damage_types import DamageType
+from game_sys.core.rarity import Rarity
+from game_sys.enchantments.base import BasicEnchantment
+from game_sys.items.factory import create_item
+from game_sys.items.item_base import EquipableItem
+from game_sys.items.item_store import ItemHandle, ItemStore
+
+
+def _state(item):
+    return (
+        item.id, item.name, item.slot, item.level, item.grade, item.rarity,
+        item.price, item.base_bonus_ranges, item.damage_map, item.bonuses,
+        item.percent_bonuses, item.resistances,
+        [(e.enchant_id, e.level, e.grade, e.rarity, e.stat_bonuses,
+          e.damage_modifiers) for e in item.enchantments],
+    )
+
+
+def _enchanted_sword():
+    sword = create_item("steel_sword", level=7, grade=2, rarity="RARE")
+    sword.enchantments = [BasicEnchantment(
+        "flamebrand", "Flamebrand", "", 3, 2, Rarity.EPIC, ["weapon"],
+        {"cold_resistance": 4}, {DamageType.FIRE: 9},
+    )]
+    sword.bonuses = sword._calculate_bonus_totals()
+    return sword
+
+
+def test_round_trip_and_reopen(tmp_path):
+    path = tmp_path / "stash.items"
+    items = [create_item(i) for i in ("iron_sword", "plate_armor", "bow")]
+    items.append(_enchanted_sword())
+    with ItemStore(path) as store:
+        handles = store.put_many(items)
+        assert [h.index for h in handles] == [0, 1, 2, 3]
+        assert all(isinstance(h, ItemHandle) for h in handles)
+        assert len(store) == 4
+        for item, handle in zip(items, handles):
+            assert _state(handle.materialize()) == _state(item)
+
+    with ItemStore(path) as store:
+        assert len(store) == 4
+        again = store.get(3)
+        assert _state(again) == _state(items[3])
+        assert store.record(3).template_id == "steel_sword"
+        assert store.record(3).rarity is Rarity.RARE
+
+
+def test_grows_selects_and_reuses_deleted_records(tmp_path):
+    with ItemStore(tmp_path / "ah.items") as store:
+        handles = [store.put(create_item("dagger", level=1 + i % 10))
+                   for i in range(5000)]
+        assert len(list(store.select(template_id="dagger", min_level=10))) == 500
+        assert list(store.select(template_id="nope")) == []
+        assert len(list(store.select(max_level=1))) == 500
+
+        store.delete(handles[7])
+        with pytest.raises(KeyError):
+            store.get(handles[7])
+        with pytest.raises(KeyError):
+            store.delete(handles[7])
+        assert len(store) == 4999
+        assert store.put(create_item("bow")).index == 7
+        assert store.record(7).template_id == "bow"
+
+
+def test_rejects_items_that_do_not_fit(tmp_path):
+    with ItemStore(tmp_path / "x.items") as store:
+        stray = EquipableItem("homebrew", "Homebrew", "", 1, 1, "weapon")
+        with pytest.raises(ValueError):
+            store.put(stray)
+        odd = create_item("iron_sword")
+        odd.base_bonus_ranges = {"charisma": {"min": 1, "max": 1}}
+        with pytest.raises(ValueError):
+            store.put(odd)
+        other = ItemStore(tmp_path / "y.items")
+        with pytest.raises(ValueError):
+            store.get(other.put(create_item("bow")))
+        other.close()
+
+
+def test_inventory_stash_by_handle(tmp_path):
+    hero = create_character("player", name="Hero", job_id="knight")
+    with ItemStore(tmp_path / "stash.items") as store:
+        sword = _enchanted_sword()
+        handle = store.put(sword)
+        hero.inventory.stash(handle)
+        assert hero.inventory.stashed() == [handle]
+
+        taken = hero.inventory.take_from_stash(handle, auto_equip=True)
+        assert hero.inventory.stashed() == []
+        assert hero.inventory.get_equipped_item("weapon") is taken
+        assert _state(taken) == _state(sword)
+        with pytest.raises(KeyError):
+            hero.inventory.unstash(handle)
+
+
+def test_reopen_reuses_deleted_records(tmp_path):
+    path = tmp_path / "ah.items"
+    with ItemStore(path) as store:
+        handles = store.put_many(create_item(i) for i in ("bow", "dagger", "iron_sword"))
+        handles.append(store.put(_enchanted_sword()))
+        store.delete(handles[1])
+        store.delete(handles[3])
+
+    with ItemStore(path) as store:
+        assert len(store) == 2
+        assert store.put(_enchanted_sword()).index in (1, 3)
+        assert store.put(create_item("bow")).index in (1, 3)
+        assert not store._free and not store._free_ench
+        assert len(store) == 4
+
+
+def test_stash_survives_save_and_is_not_cloned(tmp_path):
+    hero = create_character("player", name="Hero", job_id="knight")
+    hero.clear_dirty()
+    with ItemStore(tmp_path / "stash.items") as store:
+        handle = store.put(_enchanted_sword())
+        hero.inventory.stash(handle)
+        assert "inventory" in hero.dirty_fields()
+        assert character_delta(hero)["stash"] == {str(store.path.resolve()): [0]}
+
+        loaded = loads_binary(dumps_binary(hero))
+        assert loaded.inventory.stashed() == [handle]
+        assert clone_character(hero).inventory.stashed() == []
@@ -0,0 +1,65 @@
+import json
+
+from logs.log_analytics import analyze_logs, rotated_logs
+
+
+def _line(message, second=0):
+    return json.dumps({
+        "timestamp": f"2025-06-19T19:41:{second:02d}", "level": "INFO",
+        "module": "game_sys.combat.combat", "lineno": 80,
+        "message": message, "args": [],
+    }) + "\n"
+
+
+def _write_logs(tmp_path):
+    base = tmp_path / "game.json.log"
+    (tmp_path / "game.json.log.2").write_text(
+        _line("--- Turn 1 ---")
+        + _line("Hero hits Goblin for 10 physical damage (CRITICAL!)")
+        + _line("Hero hits Goblin for 4 fire damage (resist×0.80) (CRITICAL!)")
+        + _line("Hero hits Goblin:\n  → 10 physical\n  [HP: 1/20]")
+    )
+    (tmp_path / "game.json.log.1").write_text(
+        _line("--- Turn 2 ---", 1)
+        + _line("Goblin hits Hero for 3 physical damage", 1)
+        + "not json at all — hits \n"
+        + _line("Mage deals 76 (FIRE) + 12 (ICE) damage to Goblin (CRITICAL HIT!)", 2)
+        + _line("Mage deals 9 magic to Goblin and defeats them!", 3)
+    )
+    base.write_text(
+        _line("Hero looted 1x Health Potion from Goblin.", 4)
+        + _line("Hero looted 2x Goblin Dagger from Goblin.", 4)
+        + _line("Hero looted 35 gold from Goblin.", 4)
+        + _line("Hero fully restored: HP=20, MP=0, ST=20.", 4)
+    )
+    return base
+
+
+def test_rotated_logs_are_oldest_first(tmp_path):
+    base = _write_logs(tmp_path)
+    assert [p.name for p in rotated_logs(base)] == [
+        "game.json.log.2", "game.json.log.1", "game.json.log",
+    ]
+
+
+def test_analyze_logs_aggregates_combat_and_loot(tmp_path):
+    files = rotated_logs(_write_logs(tmp_path))
+    summary = analyze_logs(files)
+    assert summary.to_dict() == analyze_logs(files, use_mmap=True).to_dict()
+
+    hero = summary.actors["Hero"]
+    assert (hero.damage, hero.hits, hero.crits) == (14, 2, 2)
+    assert hero.damage_by_type == {"PHYSICAL": 10, "FIRE": 4}
+    assert hero.turns == 1 and hero.dps == 14.0
+
+    mage = summary.actors["Mage"]
+    assert mage.damage_by_type == {"FIRE": 76, "ICE": 12, "MAGIC": 9}
+    assert mage.crit_rate == 2 / 3
+    assert mage.active_seconds == 2
+
+    assert summary.actors["Goblin"].damage == 3
+    assert summary.turns == 2
+    assert summary.bad_lines == 1
+    assert summary.items_looted == {"Health Potion": 1, "Goblin Dagger": 2}
+    assert summary.gold_looted == {"Hero": 35}
+    assert summary.loot_by_source == {"Goblin": 3}
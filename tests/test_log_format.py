@@ -0,0 +1,53 @@
+import json
+import logging
+
+from logs.logs import JsonFormatter, lazy, log_enabled
+
+
+def _reference(formatter, record):
+    payload = {
+        "timestamp": formatter.formatTime(record, datefmt="%Y-%m-%dT%H:%M:%S"),
+        "level": record.levelname,
+        "module": record.name,
+        "lineno": record.lineno,
+        "message": record.getMessage(),
+        "args": [str(a) for a in record.args or ()],
+    }
+    return json.dumps(payload)
+
+
+def _record(msg, args, created=None):
+    record = logging.LogRecord("game.test", logging.WARNING, __file__, 42,
+                               msg, args, None)
+    if created is not None:
+        record.created = created
+    return record
+
+
+def test_json_formatter_matches_json_dumps():
+    formatter = JsonFormatter()
+    for record in (
+        _record("plain", None),
+        _record('%s said "%s"\n', ("Ayla", "héllo → ☃")),
+        _record("%d× %s", (3, {"a": [1, 2]})),
+        _record("tick", None, created=1_700_000_000.2),
+        _record("tock", None, created=1_700_000_000.9),
+        _record("next second", None, created=1_700_000_001.1),
+    ):
+        assert formatter.format(record) == _reference(formatter, record)
+
+
+def test_lazy_args_only_render_when_enabled():
+    calls = []
+
+    def describe():
+        calls.append(1)
+        return "expensive"
+
+    logger = logging.getLogger("game.test.lazy")
+    logger.setLevel(logging.INFO)
+    assert not log_enabled(logger)
+    logger.debug("%s", lazy(describe))
+    assert calls == []
+    assert log_enabled(logger, logging.INFO)
+    assert str(lazy(describe)) == "expensive" and calls == [1]
@@ -0,0 +1,120 @@
+import json
+import pytest
+
+from game_sys.core.rarity import Rarity
+from game_sys.combat.loader import DROP_TABLES
+from game_sys.hooks.hooks import hook_dispatcher
+from game_sys.managers import loot_analytics
+from game_sys.managers.loot_analytics import (
+    expected_loot,
+    expected_loot_table,
+    expected_purse,
+    export_loot_table,
+    clear_loot_cache,
+)
+
+
+@pytest.fixture(autouse=True)
+def fresh_cache():
+    clear_loot_cache()
+    yield
+    clear_loot_cache()
+
+
+def _brute_force_purse(gmin, gmax, level, grade, rarity):
+    """Enumerate every (a, b) pair create_character can draw."""
+    k = level * grade * rarity.value
+    n = gmax - gmin + 1
+    total = 0.0
+    for a in range(gmin, gmax + 1):
+        for b in range(gmin, gmax + 1):
+            if a <= b * k:
+                total += (a + b * k) / 2
+            else:
+                total += 50.5 * level
+    return total / (n * n)
+
+
+@pytest.mark.parametrize("level,grade,rarity", [
+    (1, 1, Rarity.COMMON),
+    (3, 2, Rarity.RARE),
+    (20, 7, Rarity.DIVINE),
+])
+def test_expected_purse_matches_enumeration(level, grade, rarity):
+    # Goblin template: gold_min=1, gold_max=50
+    assert expected_purse("goblin", level, grade, rarity) == pytest.approx(
+        _brute_force_purse(1, 50, level, grade, rarity)
+    )
+
+
+def test_non_enemy_templates_have_no_purse():
+    assert expected_purse("player", 5, 1, Rarity.COMMON) == 0.0
+
+
+def test_expected_items_and_rarity_split():
+    exp = expected_loot("goblin", level=1, grade=1)
+    # first tier: dagger 0.75 × 1, potion 0.30 × 2
+    assert exp.expected_items["goblin_dagger"] == pytest.approx(0.75)
+    assert exp.expected_items["health_potion"] == pytest.approx(0.60)
+    dagger = exp.rarity_distribution["goblin_dagger"]
+    assert dagger["COMMON"] == pytest.approx(0.75 * 0.70)
+    assert sum(dagger.values()) == pytest.approx(0.75)
+    # expected gold per kill is (1 + E[purse]) / 2
+    assert exp.expected_gold == pytest.approx((1 + exp.expected_purse) / 2)
+
+
+def test_chance_above_one_is_clamped():
+    exp = expected_loot("orc", level=1)
+    assert exp.expected_items["mana_potion"] == pytest.approx(1.0)
+
+
+def test_results_are_cached_until_cleared(monkeypatch):
+    first = expected_loot("goblin", 1)
+    assert expected_loot("goblin", 1) == first
+    monkeypatch.setitem(DROP_TABLES, "goblin", [])
+    assert expected_loot("goblin", 1) == first
+    clear_loot_cache()
+    assert expected_loot("goblin", 1).expected_items == {}
+
+
+def test_callers_get_their_own_copy():
+    first = expected_loot("goblin", 1)
+    first.expected_items.clear()
+    first.rarity_distribution.clear()
+    again = expected_loot("goblin", 1)
+    assert again.expected_items and again.rarity_distribution
+
+
+def test_data_reload_clears_cache(monkeypatch):
+    first = expected_loot("goblin", 1)
+    monkeypatch.setitem(DROP_TABLES, "goblin", [])
+    hook_dispatcher.fire("data.reloaded", names=["jobs"])
+    assert expected_loot("goblin", 1) == first
+    hook_dispatcher.fire("data.reloaded", names=["drop_tables"])
+    assert expected_loot("goblin", 1).expected_items == {}
+
+
+def test_export_json_and_csv(tmp_path):
+    rows = expected_loot_table(["goblin", "orc"], levels=[1, 7])
+    assert len(rows) == 4
+    out = export_loot_table(rows, tmp_path / "loot.json")
+    data = json.loads(out.read_text(encoding="utf-8"))
+    assert data[0]["enemy"] == "goblin"
+    assert "expected_item_count" in data[0]
+
+    csv_out = export_loot_table(rows, tmp_path / "loot.csv")
+    lines = csv_out.read_text(encoding="utf-8").splitlines()
+    assert lines[0].startswith("enemy,level,grade,rarity,item_id")
+    assert len(lines) > len(rows)
+
+    with pytest.raises(ValueError):
+        export_loot_table(rows, tmp_path / "loot.xml")
+
+
+def test_module_does_not_sample(monkeypatch):
+    # Analytic mode must never touch the loot RNG path
+    def boom(*args, **kwargs):
+        raise AssertionError("roll_loot should not be called")
+    monkeypatch.setattr(loot_analytics, "DROP_TABLES", DROP_TABLES)
+    monkeypatch.setattr("game_sys.managers.loot_manager.roll_loot", boom)
+    expected_loot("orc", level=12)
@@ -0,0 +1,61 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from game_sys.core.rarity import Rarity
+from game_sys.character.character_creation import Enemy
+from game_sys.managers.population_manager import (
+    scale_job_population,
+    CompactActor,
+)
+
+
+def _scalar_enemy(job_id, level, grade, rarity):
+    enemy = Enemy(name="Ref", level=level)
+    enemy.grade = grade
+    enemy.rarity = rarity
+    enemy.assign_job_by_id(job_id)
+    return enemy.stats.base
+
+
+@pytest.mark.parametrize("job_id", ["goblin", "orc", "dragon"])
+def test_population_matches_per_actor_pipeline(job_id):
+    levels = [1, 7, 15, 42, 100]
+    grades = [1, 2, 3, 5, 7]
+    rarities = [Rarity.COMMON, Rarity.UNCOMMON, Rarity.RARE, Rarity.EPIC,
+                Rarity.DIVINE]
+    pop = scale_job_population(job_id, levels, grades, rarities)
+    assert pop.matrix.shape == (5, len(pop.stat_keys))
+    for i, (lvl, grd, rar) in enumerate(zip(levels, grades, rarities)):
+        expected = _scalar_enemy(job_id, lvl, grd, rar)
+        row = pop.row(i)
+        for stat, value in expected.items():
+            assert row[stat] == value, (stat, lvl, grd, rar)
+
+
+def test_scalar_grade_and_rarity_broadcast():
+    pop = scale_job_population("goblin", np.arange(1, 10_001), 2, "rare")
+    assert len(pop) == 10_000
+    assert (pop.grades == 2).all()
+    assert (pop.rarities == Rarity.RARE.value).all()
+    # health grows monotonically with level
+    assert (np.diff(pop.column("health")) >= 0).all()
+
+
+def test_compact_actor_reads_and_writes_shared_arrays():
+    pop = scale_job_population("orc", [10, 20])
+    first, second = pop.actors("Orc")
+    assert isinstance(first, CompactActor)
+    assert first.max_health == pop.row(0)["health"]
+    assert first.current_health == first.max_health
+    first.current_health -= 10_000
+    assert first.current_health == 0
+    assert pop.alive().tolist() == [False, True]
+    assert second.stats.effective()["attack"] == pop.row(1)["attack"]
+
+
+def test_mismatched_shapes_raise():
+    with pytest.raises(ValueError):
+        scale_job_population("goblin", [1, 2, 3], grades=[1, 2])
+    with pytest.raises(KeyError):
+        scale_job_population("nope", [1])
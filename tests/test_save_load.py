@@ -0,0 +1,182 @@
+import gc
+import io
+import json
+import weakref
+
+import pytest
+
+from game_sys.character.character_creation import Player, create_character
+from game_sys.core import packing
+from game_sys.core.damage_types import DamageType
+from game_sys.core.save_load import (
+    SAVE_VERSION,
+    apply_delta,
+    character_delta,
+    character_to_dict,
+    dumps_binary,
+    dumps_json,
+    iter_characters,
+    load_character,
+    loads_binary,
+    loads_json,
+    read_characters,
+    save_character,
+    save_characters,
+)
+from game_sys.effects.status import StatusEffect
+from game_sys.enchantments.base import BasicEnchantment
+from game_sys.hooks.hooks import hook_dispatcher
+from game_sys.items.item_base import ConsumableItem, EquipableItem
+from game_sys.skills.learning import SkillRegistry
+
+
+@pytest.mark.parametrize("value", [
+    None, True, False, 0, 127, 128, -1, -32, -33, -129, 70000, -2**40, 2**63,
+    1.5, "", "x" * 31, "y" * 300, "é", b"\x00\x01", [], list(range(20)),
+    {"a": {"b": [1, "c", None]}}, {str(i): i for i in range(40)},
+])
+def test_pack_round_trip(value):
+    assert packing.unpack(packing.pack(value)) == value
+
+
+def test_pack_rejects_unknown_types_and_garbage():
+    with pytest.raises(packing.PackError):
+        packing.pack(object())
+    with pytest.raises(packing.PackError):
+        packing.unpack(packing.pack("abcdef")[:-1])
+    with pytest.raises(packing.PackError):
+        packing.unpack(packing.pack(1) + b"\x00")
+
+
+def _hero():
+    hero = create_character("player", name="Ayla", job_id="knight")
+    sword = EquipableItem(
+        "rune_blade", "Rune Blade", "", 200, 3, "weapon",
+        base_bonus_ranges={"attack": {"min": 7, "max": 9}},
+        damage_map={"PHYSICAL": {"min": 4, "max": 6}},
+        enchantments=[BasicEnchantment.from_dict({
+            "id": "flame", "name": "Flame", "rarity": "RARE",
+            "stat_bonuses": {"attack": 3},
+            "damage_modifiers": {"FIRE": 5},
+        })],
+        resistances={DamageType.ICE: 0.75},
+    )
+    hero.inventory.add_item(sword)
+    hero.inventory.equip_item(sword)
+    potion = ConsumableItem("elixir", "Elixir", "", 10, 1,
+                            [{"type": "InstantHeal", "amount": 5}], amount=2)
+    hero.inventory.add_item(potion, quantity=4)
+    hero.add_status(StatusEffect("Blessed", {"defense": 2}, 3))
+    hero.stats_mgr.stats.add_modifier("ring", "speed", 4)
+    hero.gold = 77
+    hero.current_health = hero.max_health - 1
+
+    sid = SkillRegistry.all_ids()[0]
+    skill = SkillRegistry.get(sid).build_skill_instance(hero)
+    skill._current_cooldown = 2
+    hero.learning.known_skills.add(sid)
+    hero.learning.instantiated_skills[sid] = skill
+    hero.learning.available_sp = 5
+    return hero
+
+
+@pytest.mark.parametrize("dumps,loads", [
+    (dumps_json, loads_json),
+    (dumps_binary, loads_binary),
+])
+def test_character_round_trip(dumps, loads):
+    hero = _hero()
+    loaded = loads(dumps(hero))
+
+    assert isinstance(loaded, Player)
+    assert character_to_dict(loaded) == character_to_dict(hero)
+    assert loaded.stats_mgr.stats.effective() == hero.stats_mgr.stats.effective()
+    assert loaded.current_health == hero.current_health
+
+    blade = loaded.inventory.get_equipped_item("weapon")
+    assert blade.bonuses == hero.inventory.get_equipped_item("weapon").bonuses
+    assert blade.enchantments[0].damage_modifiers == {DamageType.FIRE: 5}
+    assert blade.resistances == {DamageType.ICE: 0.75}
+
+    entry = loaded.inventory._items["elixir"]
+    assert entry["quantity"] == 4 and entry["item"].amount == 2
+    assert loaded.statuses["Blessed"].duration == 3
+
+    (sid,) = loaded.learning.known_skills
+    assert loaded.learning.get_skill_object(sid)._current_cooldown == 2
+    assert loaded.learning.available_sp == 5
+    assert loaded.job.job_id == "knight"
+
+
+def test_loaded_characters_can_be_freed():
+    data = dumps_binary(_hero())
+    loads_binary(data)  # first load wires shared hooks
+    listeners = {e: len(fns) for e, fns in hook_dispatcher._listeners.items()}
+    ref = weakref.ref(loads_binary(data))
+    gc.collect()
+    assert ref() is None
+    assert listeners == {e: len(fns) for e, fns in hook_dispatcher._listeners.items()}
+
+
+def test_binary_is_smaller_than_json():
+    hero = _hero()
+    assert len(dumps_binary(hero)) < len(dumps_json(hero, indent=None))
+
+
+def test_files_and_streaming(tmp_path):
+    hero = _hero()
+    json_path = tmp_path / "hero.json"
+    bin_path = tmp_path / "hero.sav"
+    save_character(hero, json_path)
+    save_character(hero, bin_path)
+    assert json.loads(json_path.read_text())["version"] == SAVE_VERSION
+    assert bin_path.read_bytes().startswith(b"GSAV")
+    for path in (json_path, bin_path):
+        assert load_character(path).name == "Ayla"
+    with pytest.raises(FileExistsError):
+        save_character(hero, bin_path)
+
+    goblins = [create_character("goblin", name=f"g{i}") for i in range(5)]
+    party_path = tmp_path / "party.sav"
+    save_characters(goblins, party_path)
+    stream = iter_characters(party_path)
+    assert next(stream).name == "g0"
+    assert [c.name for c in stream] == ["g1", "g2", "g3", "g4"]
+
+
+def test_rejects_newer_versions_and_corruption():
+    hero = _hero()
+    doc = json.loads(dumps_json(hero))
+    doc["version"] = SAVE_VERSION + 1
+    with pytest.raises(ValueError):
+        loads_json(json.dumps(doc))
+
+    data = bytearray(dumps_binary(hero))
+    data[4:6] = (SAVE_VERSION + 1).to_bytes(2, "big")
+    with pytest.raises(ValueError):
+        loads_binary(bytes(data))
+    with pytest.raises(ValueError):
+        loads_binary(dumps_binary(hero)[:-3])
+    with pytest.raises(ValueError):
+        list(read_characters(io.BytesIO(b"nope")))
+
+
+def test_delta_tracks_only_changed_fields():
+    hero = _hero()
+    hero.clear_dirty()
+    assert character_delta(hero) == {}
+    snapshot = character_to_dict(hero)
+
+    hero.inventory.remove_item("elixir", 4)
+    hero.inventory.add_item("health_potion", quantity=2)
+    delta = character_delta(hero)
+    assert set(delta) == {"items"}
+    assert delta["items"]["elixir"] is None
+    assert apply_delta(snapshot, delta) == character_to_dict(hero)
+
+    hero.clear_dirty()
+    hero.current_mana -= 1
+    hero.stats_mgr.stats.remove_modifier("ring")
+    delta = character_delta(hero)
+    assert set(delta) == {"resources", "stats"}
+    assert apply_delta(snapshot, delta) == character_to_dict(hero)
@@ -0,0 +1,80 @@
+import pytest
+
+from game_sys.core.rarity import Rarity
+from game_sys.config.config import (
+    GRADE_STATS_MULTIPLIER,
+    RARITY_STATS_MULTIPLIER,
+)
+from game_sys.managers.scaling_manager import (
+    scale_stat,
+    scale_values,
+    scale_stat_map,
+    scale_damage_map,
+    stat_factors,
+    damage_factors,
+)
+
+
+def _reference(raw, level, grade, rarity, per_level=0.10):
+    """The original per-call formula, with rarity looked up by name."""
+    return int(round(
+        raw
+        * (1.0 + level * per_level)
+        * GRADE_STATS_MULTIPLIER.get(grade, 1.0)
+        * RARITY_STATS_MULTIPLIER.get(rarity.name, 1.0)
+    ))
+
+
+# Pinned outputs: (base, level, grade, rarity) -> scaled value
+PINNED = [
+    ((10, 1, 1, Rarity.COMMON), 11),
+    ((10, 5, 2, Rarity.UNCOMMON), 28),
+    ((7, 12, 3, Rarity.RARE), 46),
+    ((25, 50, 7, Rarity.DIVINE), 3750),
+    ((3, 100, 4, Rarity.EPIC), 144),
+    ((3, 250, 6, Rarity.MYTHIC), 682),   # beyond the precomputed table
+    ((5, 0, 1, Rarity.LEGENDARY), 15),
+]
+
+
+@pytest.mark.parametrize("args,expected", PINNED)
+def test_scale_stat_pinned_outputs(args, expected):
+    assert scale_stat(*args) == expected
+
+
+def test_rarity_enum_is_honoured():
+    # Previously the string-keyed config made every rarity scale as 1.0
+    assert scale_stat(10, 0, 1, Rarity.RARE) == 20
+    assert scale_stat(10, 0, 1, "rare") == 20
+    assert stat_factors(0, 1, Rarity.DIVINE)[2] == RARITY_STATS_MULTIPLIER["DIVINE"]
+
+
+def test_table_matches_reference_formula():
+    for level in (0, 1, 7, 42, 100):
+        for grade in GRADE_STATS_MULTIPLIER:
+            for rarity in Rarity:
+                for raw in (0, 1, 3, 9, 17, 250):
+                    assert scale_stat(raw, level, grade, rarity) == \
+                        _reference(raw, level, grade, rarity)
+
+
+def test_vectorized_helpers_match_scalar():
+    values = [0, 1, 5, 13, 99]
+    assert scale_values(values, 20, 3, Rarity.EPIC) == [
+        scale_stat(v, 20, 3, Rarity.EPIC) for v in values
+    ]
+    base = {"attack": 3, "defense": (4, 4), "speed": 0}
+    assert scale_stat_map(base, 5, 3, Rarity.EPIC) == {
+        "attack": 17, "defense": 22, "speed": 0,
+    }
+
+
+def test_damage_map_pinned_and_uses_half_level_step():
+    assert scale_damage_map({"FIRE": 5, "MAGIC": 8}, 10, 2, Rarity.RARE) == {
+        "FIRE": 19, "MAGIC": 30,
+    }
+    assert damage_factors(10, 1, Rarity.COMMON)[0] == pytest.approx(1.5)
+
+
+def test_unknown_grade_falls_back_to_one():
+    assert scale_stat(10, 0, 99, Rarity.COMMON) == 10
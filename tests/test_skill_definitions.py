@@ -0,0 +1,72 @@
+import pytest
+
+from game_sys.effects.status import StatusEffect
+from game_sys.skills import factory
+from game_sys.skills.learning import SkillRegistry
+
+
+@pytest.fixture(autouse=True)
+def loaded_registry():
+    SkillRegistry.ensure_loaded()
+    yield
+
+
+def test_instances_share_definition_and_effects():
+    a = factory.create_skill("fireball", level=5, seed=3)
+    b = factory.create_skill("fireball", level=5, seed=3)
+    assert a is not b
+    assert a.definition is b.definition is factory.get_definition("fireball")
+    assert a.effects is b.effects
+    assert a.requirements is b.requirements
+
+    # Per-instance state stays separate
+    a.mana_cost += 1
+    a._current_cooldown = 2
+    assert b.mana_cost == a.mana_cost - 1
+    assert b._current_cooldown == 0
+
+
+def test_scaled_numbers_depend_on_level():
+    low = factory.create_skill("fireball", level=1, seed=3)
+    high = factory.create_skill("fireball", level=30, seed=3)
+    assert low.effects is not high.effects
+    assert low.definition is high.definition
+
+
+def test_registry_records_reuse_compiled_definition():
+    record = SkillRegistry.get("fireball")
+    assert record.definition is factory.get_definition("fireball")
+    assert record.effects == list(record.definition.effects)
+
+
+def test_template_change_recompiles(monkeypatch):
+    template = {"skill_id": "spark", "name": "Spark",
+                "effects": [{"type": "Damage", "damage": {"FIRE": 4}}]}
+    monkeypatch.setitem(factory._skill_defs, "spark", template)
+    first = factory.get_definition("spark")
+    assert factory.get_definition("spark") is first
+
+    monkeypatch.setitem(factory._skill_defs, "spark", dict(template, name="Big Spark"))
+    assert factory.get_definition("spark") is not first
+    assert factory.create_skill("spark", level=1).name == "Big Spark"
+
+
+def test_stateful_effects_are_not_shared(monkeypatch):
+    monkeypatch.setitem(factory._skill_defs, "bless", {
+        "skill_id": "bless", "name": "Bless",
+        "effects": [{"type": "Status", "name": "Blessed",
+                     "stat_mods": {"defense": 2}, "duration": 3}],
+    })
+    a = factory.create_skill("bless", level=3)
+    b = factory.create_skill("bless", level=3)
+    assert isinstance(a.effects[0], StatusEffect)
+    assert a.effects[0] is not b.effects[0]
+
+
+def test_unknown_damage_type_is_rejected(monkeypatch):
+    monkeypatch.setitem(factory._skill_defs, "fizzle", {
+        "skill_id": "fizzle", "name": "Fizzle",
+        "effects": [{"type": "Damage", "damage": {"FIER": 4}}],
+    })
+    with pytest.raises(ValueError, match="FIER"):
+        factory.create_skill("fizzle", level=1)
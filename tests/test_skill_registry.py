@@ -0,0 +1,69 @@
+import json
+
+import pytest
+
+from game_sys.skills.learning import SkillRegistry
+from game_sys.skills import factory
+from game_sys.character.character_creation import create_character
+
+
+def _write_skills(path, damage=5):
+    path.write_text(json.dumps([
+        {
+            "skill_id": "hot_bolt",
+            "name": "Hot Bolt",
+            "effects": [{"type": "Damage", "damage": {"FIRE": damage}}],
+        }
+    ]), encoding="utf-8")
+
+
+@pytest.fixture(autouse=True)
+def restore_default_registry():
+    yield
+    SkillRegistry.ensure_loaded()
+
+
+def test_ensure_loaded_does_not_touch_disk(monkeypatch):
+    SkillRegistry.ensure_loaded()
+    assert SkillRegistry.is_loaded()
+
+    def _no_disk(*args, **kwargs):
+        raise AssertionError("registry re-read skills.json")
+
+    monkeypatch.setattr(SkillRegistry, "reload", _no_disk)
+    SkillRegistry.ensure_loaded()
+    create_character("hero", job_id="knight")
+    create_character("goblin", job_id="goblin")
+
+
+def test_reload_only_rebuilds_when_contents_change(tmp_path):
+    path = tmp_path / "skills.json"
+    _write_skills(path)
+    assert SkillRegistry.reload(path) is True
+    first = SkillRegistry.get("hot_bolt")
+    digest = SkillRegistry.digest()
+
+    assert SkillRegistry.reload(path) is False
+    assert SkillRegistry.get("hot_bolt") is first
+    assert not SkillRegistry.is_stale()
+
+    _write_skills(path, damage=9)
+    assert SkillRegistry.is_stale()
+    assert SkillRegistry.reload(path) is True
+    assert SkillRegistry.digest() != digest
+    assert SkillRegistry.get("hot_bolt") is not first
+
+
+def test_cleared_registry_is_reloaded():
+    SkillRegistry.ensure_loaded()
+    ids = set(SkillRegistry.all_ids())
+    SkillRegistry._registry.clear()
+    assert not SkillRegistry.is_loaded()
+    SkillRegistry.ensure_loaded()
+    assert set(SkillRegistry.all_ids()) == ids
+
+
+def test_forced_reload_refreshes_factory_templates():
+    factory._skill_defs.clear()
+    assert SkillRegistry.reload(force=True) is True
+    assert set(factory._skill_defs) == set(SkillRegistry.all_ids())
@@ -0,0 +1,106 @@
+import pytest
+
+from game_sys.character.character_creation import create_character
+from game_sys.skills import factory
+from game_sys.skills.learning import SkillRecord, SkillRegistry
+
+
+def _record(sid, min_level=1, prereqs=(), sp_cost=1, requirements=None):
+    return SkillRecord(sid, sid.title(), "", 0, 0, 0, [], sp_cost, min_level,
+                       set(prereqs), requirements or {})
+
+
+@pytest.fixture
+def hero():
+    # Created first: character creation (re)loads the default skills
+    return create_character("player", name="Ayla")
+
+
+@pytest.fixture
+def registry(hero, monkeypatch):
+    monkeypatch.setattr(factory, "_skill_defs", {
+        sid: {"skill_id": sid, "name": sid.title()}
+        for sid in ("jab", "cross", "hook", "uppercut")
+    })
+    SkillRegistry._registry.clear()
+    for rec in (
+        _record("jab"),
+        _record("cross", prereqs=["jab"]),
+        _record("hook", min_level=3, prereqs=["jab"]),
+        _record("uppercut", min_level=2, prereqs=["cross", "hook"]),
+        _record("focus", requirements={"intellect": 10_000}),
+        _record("loop_a", prereqs=["loop_b"]),
+        _record("loop_b", prereqs=["loop_a"]),
+        _record("orphan", prereqs=["missing"]),
+    ):
+        SkillRegistry.register(rec)
+    yield SkillRegistry
+    SkillRegistry._registry.clear()
+    SkillRegistry.ensure_loaded()
+
+
+def _brute_force(learning):
+    return [
+        sid for sid in SkillRegistry.all_ids()
+        if sid not in learning.known_skills
+        and SkillRegistry.get(sid).can_character_learn(
+            learning.owner, learning.known_skills, learning.available_sp)
+    ]
+
+
+def test_tree_orders_prerequisites_and_flags_unreachable(registry):
+    tree = registry.tree()
+    order = tree.order
+    assert order.index("jab") < order.index("cross") < order.index("uppercut")
+    assert order.index("hook") < order.index("uppercut")
+    assert tree.unreachable == {"loop_a", "loop_b", "orphan"}
+    assert tree.levels_between(1, 3) == ["uppercut", "hook"]
+    assert registry.tree() is tree
+
+
+def test_tree_is_rebuilt_when_registry_changes(registry):
+    tree = registry.tree()
+    registry.register(_record("kick"))
+    assert registry.tree() is not tree
+    assert "kick" in registry.tree().records
+
+
+def test_frontier_follows_learning_and_levels(hero, registry):
+    learning = hero.learning
+    learning.add_sp(10)
+    assert learning.available_to_learn() == ["jab"] == _brute_force(learning)
+
+    learning.learn("jab")
+    assert learning.available_to_learn() == ["cross"] == _brute_force(learning)
+    learning.learn("cross")
+
+    hero.stats_mgr.add_experience(10_000)
+    assert hero.level >= 3
+    assert learning.available_to_learn() == ["hook"] == _brute_force(learning)
+    learning.learn("hook")
+    assert learning.available_to_learn() == ["uppercut"] == _brute_force(learning)
+
+    learning.unlearn("cross")
+    assert learning.available_to_learn() == ["cross"] == _brute_force(learning)
+
+
+def test_frontier_checks_sp_and_survives_direct_edits(hero, registry):
+    learning = hero.learning
+    assert learning.available_to_learn() == []
+    learning.add_sp(1)
+    assert learning.available_to_learn() == ["jab"]
+
+    learning.known_skills.add("jab")
+    assert learning.available_to_learn() == _brute_force(learning) == ["cross"]
+
+
+def test_frontier_rebuilt_when_direct_edit_keeps_size(hero, registry):
+    learning = hero.learning
+    learning.add_sp(10)
+    learning.learn("jab")
+    assert learning.available_to_learn() == ["cross"]
+
+    # Same size, different members
+    learning.known_skills.discard("jab")
+    learning.known_skills.add("focus")
+    assert learning.available_to_learn() == _brute_force(learning) == ["jab"]
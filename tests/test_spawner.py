@@ -0,0 +1,113 @@
+import gc
+import weakref
+
+import pytest
+
+from game_sys.character.spawner import (
+    EnemySpawner,
+    EnemyPool,
+    clone_character,
+)
+from game_sys.character.character_creation import create_character
+from game_sys.effects.status import StatusEffect
+from game_sys.skills.base import Skill
+
+
+def test_clone_is_independent_of_prototype():
+    proto = create_character("goblin", level=3)
+    clone = clone_character(proto, name="Goblin B")
+    assert clone.name == "Goblin B"
+    assert clone.stats.base == proto.stats.base
+    assert clone.current_health == proto.current_health
+
+    clone.current_health -= 5
+    clone.stats.base["attack"] += 100
+    clone.gold += 1
+    assert proto.current_health == proto.max_health
+    assert proto.stats.base["attack"] != clone.stats.base["attack"]
+    assert clone.stats_mgr.actor is clone
+    assert clone.inventory.owner is clone
+    assert clone.stats_mgr.levels is not proto.stats_mgr.levels
+
+
+def test_spawner_reuses_prototype_per_band():
+    spawner = EnemySpawner(level_band=5)
+    assert spawner.band_level(1) == 1
+    assert spawner.band_level(5) == 1
+    assert spawner.band_level(6) == 6
+    assert spawner.key_for("Goblin", 3) == spawner.key_for("goblin", 4)
+
+    first = spawner.spawn("goblin", level=2)
+    second = spawner.spawn("goblin", level=4)
+    assert first is not second
+    assert first._spawn_proto is second._spawn_proto
+    assert len(spawner.prototypes(first._spawn_key)) == 1
+    assert first.level == 1
+
+    spawner.spawn("goblin", level=7)
+    assert len(spawner._prototypes) == 2
+
+
+def test_spawner_rejects_bad_config():
+    with pytest.raises(ValueError):
+        EnemySpawner(level_band=0)
+    with pytest.raises(ValueError):
+        EnemySpawner(variants=0)
+
+
+def test_pool_recycles_and_resets():
+    pool = EnemyPool(max_per_key=1)
+    enemy = pool.acquire("goblin", level=2)
+    enemy.current_health = 0
+    enemy.add_status(StatusEffect("Poison", {"attack": -1}, 3))
+    enemy.stats.base["attack"] = -1
+
+    assert pool.release(enemy)
+    assert not pool.release(enemy)  # already pooled
+    assert pool.size() == 1
+
+    again = pool.acquire("goblin", level=2, name="Recycled")
+    assert again is enemy
+    assert again.name == "Recycled"
+    assert again.current_health == again.max_health
+    assert not again.statuses
+    assert again.stats.base == again._spawn_proto.stats.base
+    assert pool.reused == 1 and pool.spawned == 1
+
+
+def test_pool_drops_foreign_enemies():
+    pool = EnemyPool()
+    assert not pool.release(create_character("goblin"))
+    assert pool.size() == 0
+
+
+def test_spawned_enemies_can_be_freed():
+    from game_sys.hooks.hooks import hook_dispatcher
+
+    spawner = EnemySpawner()
+    spawner.warm("goblin", level=1)
+    listeners = {e: len(fns) for e, fns in hook_dispatcher._listeners.items()}
+    refs = [weakref.ref(spawner.spawn("goblin")) for _ in range(50)]
+    gc.collect()
+    assert not any(ref() for ref in refs)
+    assert listeners == {e: len(fns) for e, fns in hook_dispatcher._listeners.items()}
+
+
+def test_pool_reset_restores_inventory_and_skills():
+    pool = EnemyPool()
+    enemy = pool.acquire("player", level=2)
+    proto = enemy._spawn_proto
+    enemy.inventory.add_item("health_potion")
+    bolt = Skill("bolt", "Bolt", "", 0, 0, 3, [])
+    enemy.learning.add_skill("bolt", bolt)
+    bolt.use(enemy, enemy, None)
+    pool.release(enemy)
+
+    again = pool.acquire("player", level=2)
+    assert again is enemy
+    assert again.inventory.owner is again
+    assert ([i.id for i in again.inventory.list_items()]
+            == [i.id for i in proto.inventory.list_items()])
+    assert set(again.learning.instantiated_skills) == set(proto.learning.instantiated_skills)
+    assert bolt.cooldowns is not again.learning.cooldowns
+    assert "health_potion" in again.inventory.dirty_item_ids()
@@ -0,0 +1,150 @@
+import pytest
+
+from game_sys.character.character_creation import create_character
+from game_sys.combat.combat_engine import CombatEngine
+from game_sys.core.damage_types import DamageType
+from game_sys.core.stats import Stats
+from game_sys.effects.status import StatusEffect
+from game_sys.effects.status_scheduler import StatusScheduler
+from game_sys.hooks.hooks import hook_dispatcher
+
+
+@pytest.fixture
+def expired_events():
+    events = []
+
+    def on_expired(actor, effect):
+        events.append((actor.name, effect.name))
+
+    hook_dispatcher.register("actor.status_expired", on_expired)
+    yield events
+    hook_dispatcher.unregister("actor.status_expired", on_expired)
+
+
+def test_statuses_expire_only_when_due(expired_events):
+    hero = create_character("player", name="Ayla")
+    hero.add_status(StatusEffect("Haste", {"speed": 3}, 1))
+    hero.add_status(StatusEffect("Blessed", {"defense": 2}, 3))
+
+    assert [s.name for s in hero.tick_statuses()] == ["Haste"]
+    assert expired_events == [("Ayla", "Haste")]
+    assert hero.statuses["Blessed"].duration == 2
+
+    assert hero.tick_statuses() == []
+    assert [s.name for s in hero.tick_statuses()] == ["Blessed"]
+    assert hero.statuses == {}
+
+
+def test_stat_mods_fold_into_effective_stats():
+    hero = create_character("player", name="Ayla")
+    defense = hero.defense
+    hero.add_status(StatusEffect("Blessed", {"defense": 2}, 1))
+    assert hero.defense == defense + 2
+
+    # Re-applying replaces the status instead of stacking it
+    hero.add_status(StatusEffect("Blessed", {"defense": 5}, 2))
+    assert hero.defense == defense + 5
+    hero.tick_statuses()
+    assert hero.defense == defense + 5
+
+    hero.tick_statuses()
+    assert hero.defense == defense
+
+
+def test_effective_cache_tracks_mutations():
+    stats = Stats({"attack": 10})
+    assert stats.get("attack") == 10
+    stats.add_modifier("ring", "attack", 4)
+    assert stats.get("attack") == 14
+    stats.effective()["attack"] = 0  # callers get a copy
+    assert stats.get("attack") == 14
+
+    stats.base["attack"] = 20
+    stats.invalidate()
+    assert stats.effective()["attack"] == 24
+
+
+def test_shared_status_instance_is_copied_per_actor():
+    a = create_character("player", name="Ayla")
+    b = create_character("player", name="Bram")
+    shared = StatusEffect("Regen", {}, 2)
+    a.add_status(shared)
+    b.add_status(shared)
+    assert a.statuses["Regen"] is shared
+    assert b.statuses["Regen"] is not shared
+
+    a.tick_statuses()
+    a.tick_statuses()
+    assert "Regen" not in a.statuses
+    assert b.statuses["Regen"].duration == 2
+
+
+def test_combat_binds_and_restores_status_clocks():
+    hero = create_character("player", name="Ayla")
+    own = hero.status_scheduler
+    hero.add_status(StatusEffect("Blessed", {"defense": 2}, 5))
+    foe = create_character("goblin", level=1)
+
+    engine = CombatEngine([hero], [foe], max_turns=2)
+    engine.start()
+
+    assert hero.status_scheduler is own
+    status = hero.statuses["Blessed"]
+    assert status._scheduler is own
+    assert status.duration == 5 - engine.statuses.now
+
+
+def test_scheduler_skips_replaced_statuses():
+    scheduler = StatusScheduler()
+    hero = create_character("player", name="Ayla")
+    hero.bind_status_scheduler(scheduler)
+    first = StatusEffect("Haste", {"speed": 3}, 1)
+    hero.add_status(first)
+    hero.add_status(StatusEffect("Haste", {"speed": 3}, 3))
+
+    assert scheduler.advance() == []
+    assert hero.statuses["Haste"].duration == 2
+
+
+def test_stack_count_rule_scales_mods_up_to_max():
+    hero = create_character("player", name="Ayla")
+    attack = hero.attack
+    for _ in range(4):
+        rage = hero.add_status(StatusEffect("Rage", {"attack": 2}, 2,
+                                            stacking="stack", max_stacks=3))
+    assert rage.stacks == 3
+    assert hero.attack == attack + 6
+
+    hero.remove_status("Rage")
+    assert hero.attack == attack
+    assert hero.tick_statuses() == []
+
+
+def test_max_rule_keeps_stronger_mods_and_longer_duration():
+    hero = create_character("player", name="Ayla")
+    hero.add_status(StatusEffect("Ward", {"defense": 5, "speed": 1}, 4, stacking="max"))
+    ward = hero.add_status(StatusEffect("Ward", {"defense": 3, "speed": 2}, 2,
+                                        stacking="max"))
+    assert ward.stat_mods == {"defense": 5, "speed": 2}
+    assert ward.duration == 4
+
+
+def test_unknown_stacking_rule_is_rejected():
+    with pytest.raises(ValueError):
+        StatusEffect("Odd", {}, 1, stacking="sometimes")
+
+
+def test_damage_reduction_is_precomputed_and_capped():
+    hero = create_character("player", name="Ayla")
+    base = hero._resistance_multiplier(DamageType.PHYSICAL)
+    hero.add_status(StatusEffect("DamageReduction", {"DamageReduction": 20}, 2))
+    assert hero.status_mgr.damage_reduction == pytest.approx(0.2)
+    assert hero._resistance_multiplier(DamageType.PHYSICAL) == pytest.approx(base * 0.8)
+    assert "DamageReduction" not in hero.stats.effective()
+
+    hero.add_status(StatusEffect("Aegis", {"DamageReduction": 70}, 1))
+    assert hero.status_mgr.damage_reduction == 0.75
+    hero.tick_statuses()
+    assert hero.status_mgr.damage_reduction == pytest.approx(0.2)
+    hero.tick_statuses()
+    assert hero.status_mgr.damage_reduction == 0.0
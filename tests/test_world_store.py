@@ -0,0 +1,173 @@
+import pytest
+
+from game_sys.character.character_creation import Player, create_character
+from game_sys.core.save_load import character_to_dict
+from game_sys.core.world_store import WorldStore
+from game_sys.effects.status import StatusEffect
+from game_sys.items.item_base import ConsumableItem
+
+
+def _world(count=6):
+    chars = [create_character("goblin", name=f"g{i}") for i in range(count)]
+    hero = create_character("player", name="Hero", job_id="knight")
+    hero.inventory.add_item(ConsumableItem(
+        "elixir", "Elixir", "", 10, 1,
+        [{"type": "InstantHeal", "amount": 5}]), quantity=3)
+    hero.add_status(StatusEffect("Blessed", {"defense": 2}, 3))
+    return [hero] + chars
+
+
+def test_bulk_round_trip(tmp_path):
+    world = _world()
+    path = tmp_path / "world.db"
+    with WorldStore(path, batch_size=2) as store:
+        assert store.save_many(world) == len(world)
+        ids = [store.id_of(c) for c in world]
+        assert len(set(ids)) == len(world) and len(store) == len(world)
+
+    with WorldStore(path) as store:
+        loaded = store.load_many()
+        assert list(loaded) == sorted(ids)
+        for char, char_id in zip(world, ids):
+            assert character_to_dict(loaded[char_id]) == character_to_dict(char)
+        hero = loaded[ids[0]]
+        assert isinstance(hero, Player)
+        assert hero.inventory._items["elixir"]["quantity"] == 3
+        assert set(hero.inventory.equipped_items) == set(
+            world[0].inventory.equipped_items)
+        assert not any(store.is_dirty(c) for c in loaded.values())
+
+
+def test_only_dirty_characters_are_written():
+    world = _world()
+    store = WorldStore()
+    store.save_many(world)
+    assert store.save_many(world) == 0
+
+    world[1].gold += 5
+    world[2].inventory.add_item("health_potion")
+    assert [store.is_dirty(c) for c in world[:4]] == [False, True, True, False]
+    assert store.save_many(world) == 2
+    assert store.save_many(world, force=True) == len(world)
+
+    reloaded = store.load_many([store.id_of(world[2]), store.id_of(world[1])])
+    assert [c.name for c in reloaded.values()] == ["g1", "g0"]
+    assert reloaded[store.id_of(world[1])].gold == world[1].gold
+    assert "health_potion" in reloaded[store.id_of(world[2])].inventory._items
+
+
+def test_clean_characters_are_not_serialized(monkeypatch):
+    world = _world()
+    store = WorldStore()
+    store.save_many(world)
+    serialized = []
+    rows = WorldStore._rows
+    monkeypatch.setattr(WorldStore, "_rows", classmethod(
+        lambda cls, c: serialized.append(c) or rows(c)))
+
+    world[3].current_health -= 1
+    assert store.save_many(world) == 1
+    assert serialized == [world[3]]
+    assert store.save_many(world, force=True) == len(world)
+    assert len(serialized) == 1 + len(world)
+
+
+def test_ids_filters_delete_and_missing():
+    world = _world()
+    for char in world:
+        char.stats_mgr.levels.lvl = 1
+    world[3].stats_mgr.levels.lvl = 9
+    store = WorldStore()
+    store.save_many(world)
+    assert store.ids(min_level=5) == [store.id_of(world[3])]
+
+    char_id = store.id_of(world[3])
+    store.delete(char_id)
+    assert store.id_of(world[3]) is None
+    assert store.load_many([char_id]) == {}
+    with pytest.raises(KeyError):
+        store.load(char_id)
+    assert store._conn.execute(
+        "SELECT COUNT(*) FROM items WHERE character_id = ?", (char_id,)
+    ).fetchone()[0] == 0
+
+
+def test_checkpoint_writes_deltas_that_replay_on_load(tmp_path):
+    world = _world(3)
+    path = tmp_path / "world.db"
+    store = WorldStore(path)
+    store.save_many(world)
+    assert not any(c.dirty_fields() for c in world)
+
+    hero, g0, g1, g2 = world
+    hero.gold += 3
+    hero.stats_mgr.levels.experience += 10
+    hero.inventory.unequip_item("weapon")
+    hero.inventory.use_item("elixir")
+    hero.learning.add_sp(2)
+    g0.current_health -= 1
+    g1.inventory.add_item("health_potion")
+    g1.stats_mgr.stats.add_modifier("curse", "attack", -2)
+    assert hero.dirty_fields() == {
+        "gold", "levels", "inventory", "learning", "resources"}
+    assert g1.dirty_fields() == {"inventory", "stats"}
+    assert g2.dirty_fields() == set()
+
+    assert store.checkpoint(world) == 3
+    assert store.pending_deltas() == 3
+    assert store.checkpoint(world) == 0
+    newcomer = create_character("goblin", name="late")
+    assert store.checkpoint(world + [newcomer]) == 1
+    world.append(newcomer)
+
+    expected = [character_to_dict(c) for c in world]
+    loaded = WorldStore(path).load_many()
+    assert [character_to_dict(c) for c in loaded.values()] == expected
+    assert not any(c.dirty_fields() for c in loaded.values())
+
+    assert store.compact() == 3
+    assert store.pending_deltas() == 0
+    loaded = WorldStore(path).load_many()
+    assert [character_to_dict(c) for c in loaded.values()] == expected
+    store.close()
+
+
+def test_status_durations_after_combat_are_saved(tmp_path):
+    from game_sys.combat.combat_engine import CombatEngine
+
+    hero = create_character("player", name="Hero")
+    hero.add_status(StatusEffect("Blessed", {"defense": 2}, 50))
+    hero.stats.add_modifier("test", "health", 10_000)
+    hero.current_health = hero.max_health
+    path = tmp_path / "world.db"
+    store = WorldStore(path)
+    store.save_many([hero])
+
+    foe = create_character("goblin", name="g", level=1)
+    foe.stats.add_modifier("test", "health", 10_000)  # both outlast the fight
+    foe.current_health = foe.max_health
+    engine = CombatEngine([hero], [foe], max_turns=3)
+    engine.start()
+    left = hero.statuses["Blessed"].duration
+    assert left < 50 and "statuses" in hero.dirty_fields()
+
+    assert store.checkpoint([hero]) == 1
+    loaded = WorldStore(path).load_many()[store.id_of(hero)]
+    assert loaded.statuses["Blessed"].duration == left
+    store.close()
+
+
+def test_cleared_statuses_stay_cleared_on_load(tmp_path):
+    hero = create_character("player", name="Hero")
+    hero.add_status(StatusEffect("Warded", {"DamageReduction": 20}, 5))
+    path = tmp_path / "world.db"
+    with WorldStore(path) as store:
+        store.save_many([hero])
+        hero_id = store.id_of(hero)
+        status = hero.statuses["Warded"]
+        hero.status_mgr.clear()
+        assert not status.is_scheduled()
+        assert store.save_many([hero]) == 1
+
+    with WorldStore(path) as store:
+        assert store.load_many()[hero_id].statuses == {}